@@ -21,13 +21,21 @@ THIS FILE IS NOT:
 - NOT a policy engine
 - NOT a CSV reader
 - NOT a preview
+
+Changelog
+- v1.1.0: Field-name classification is memoized per name (column_plan.name_has_any)
+  and each distinct row header compiles once into per-position
+  (tracked, signal, evidence) flags. Every row is counted in one pass over its
+  values; role buckets reuse the global per-row counts. Output is unchanged.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
 from collections import OrderedDict
 
+from EXECUTION_CORE.column_plan import name_has_any
+
 
 def _is_empty(v: Any) -> bool:
     if v is None:
@@ -53,43 +61,54 @@ def _stable_sort(keys: Iterable[str]) -> List[str]:
     return sorted([k for k in keys if isinstance(k, str)], key=str.lower)
 
 
+SIGNAL_FIELD_HINTS: Tuple[str, ...] = (
+    "signal",
+    "match",
+    "matches",
+    "relevance",
+    "stack",
+    "vector",
+    "rag",
+    "retrieval",
+    "embedding",
+    "inference",
+    "cuda",
+    "triton",
+    "onnx",
+    "tensorrt",
+    "rlhf",
+    "lora",
+    "qlora",
+    "dpo",
+    "ppo",
+    "deepspeed",
+    "fsdp",
+    "nccl",
+    "kubernetes",
+    "k8s",
+    "distributed",
+    "latency",
+    "throughput",
+)
+
+EVIDENCE_FIELD_HINTS: Tuple[str, ...] = (
+    "evidence",
+    "strength",
+    "weakness",
+    "tier",
+    "score",
+    "summary",
+    "recommendation",
+    "rationale",
+)
+
+
 def _looks_like_signal_field(field: str) -> bool:
     """
     SIGNAL fields represent technical capability signals.
     Examples: matches, vector/rag/inference, cuda/triton, rlhf, etc.
     """
-    f = field.lower()
-    return any(
-        k in f for k in (
-            "signal",
-            "match",
-            "matches",
-            "relevance",
-            "stack",
-            "vector",
-            "rag",
-            "retrieval",
-            "embedding",
-            "inference",
-            "cuda",
-            "triton",
-            "onnx",
-            "tensorrt",
-            "rlhf",
-            "lora",
-            "qlora",
-            "dpo",
-            "ppo",
-            "deepspeed",
-            "fsdp",
-            "nccl",
-            "kubernetes",
-            "k8s",
-            "distributed",
-            "latency",
-            "throughput",
-        )
-    )
+    return name_has_any(field, SIGNAL_FIELD_HINTS)
 
 
 def _looks_like_evidence_field(field: str) -> bool:
@@ -97,27 +116,50 @@ def _looks_like_evidence_field(field: str) -> bool:
     EVIDENCE fields represent narrative or evaluative evidence artifacts.
     Examples: strengths/weaknesses, evidence, tier labels, score summaries.
     """
-    f = field.lower()
-    return any(
-        k in f for k in (
-            "evidence",
-            "strength",
-            "weakness",
-            "tier",
-            "score",
-            "summary",
-            "recommendation",
-            "rationale",
-        )
-    )
+    return name_has_any(field, EVIDENCE_FIELD_HINTS)
 
 
-def _count_populated_fields(row: Mapping[str, Any], fields: Sequence[str]) -> int:
-    c = 0
-    for f in fields:
-        if not _is_empty(row.get(f)):
-            c += 1
-    return c
+def _populated(v: Any) -> bool:
+    if v.__class__ is str:
+        return bool(v) and not v.isspace()
+    return not _is_empty(v)
+
+
+class _HeaderPlans:
+    """
+    Row header (tuple of keys) -> positions of tracked fields, split by kind
+    (signal, evidence, other), compiled once per distinct header; rows sharing
+    a header share the plan.
+    """
+
+    def __init__(self, all_fields: Sequence[str], signal_fields: Sequence[str], evidence_fields: Sequence[str]):
+        self._tracked = set(all_fields)
+        self._signal = set(signal_fields)
+        self._evidence = set(evidence_fields)
+        self._plans: Dict[Tuple[Any, ...], Tuple[Tuple[int, ...], ...]] = {}
+
+    def _compile(self, keys: Tuple[Any, ...]) -> Tuple[Tuple[int, ...], ...]:
+        both, sig, ev, other = [], [], [], []
+        for i, k in enumerate(keys):
+            if not isinstance(k, str) or k not in self._tracked:
+                continue
+            s, e = k in self._signal, k in self._evidence
+            (both if s and e else sig if s else ev if e else other).append(i)
+        return tuple(both), tuple(sig), tuple(ev), tuple(other)
+
+    def counts(self, row: Mapping[str, Any]) -> Tuple[int, int, int]:
+        """(nonempty, signal, evidence) populated tracked-field counts for one row."""
+        keys = tuple(row.keys())
+        plan = self._plans.get(keys)
+        if plan is None:
+            plan = self._plans[keys] = self._compile(keys)
+        values = tuple(row.values())
+        both, sig_pos, ev_pos, other = plan
+        nb = sum(1 for i in both if _populated(values[i]))
+        ns = sum(1 for i in sig_pos if _populated(values[i]))
+        ne = sum(1 for i in ev_pos if _populated(values[i]))
+        no = sum(1 for i in other if _populated(values[i]))
+        return nb + ns + ne + no, nb + ns, nb + ne
 
 
 def aggregate_signal_views(
@@ -176,13 +218,14 @@ def aggregate_signal_views(
     global_signal_counts: List[int] = []
     global_evidence_counts: List[int] = []
 
-    # Role buckets
-    role_buckets: Dict[str, List[Mapping[str, Any]]] = {}
+    # Role buckets (per-row counts, computed once above)
+    role_buckets: Dict[str, List[Tuple[int, int, int]]] = {}
+
+    plans = _HeaderPlans(all_fields, signal_fields, evidence_fields)
 
     for r in safe_rows:
-        nonempty = _count_populated_fields(r, all_fields)
-        sig = _count_populated_fields(r, signal_fields)
-        ev = _count_populated_fields(r, evidence_fields)
+        counts = plans.counts(r)
+        nonempty, sig, ev = counts
 
         global_nonempty_counts.append(nonempty)
         global_signal_counts.append(sig)
@@ -190,7 +233,7 @@ def aggregate_signal_views(
 
         role = _as_text(r.get(role_key))
         if role:
-            role_buckets.setdefault(role, []).append(r)
+            role_buckets.setdefault(role, []).append(counts)
 
     density_inputs: "OrderedDict[str, Any]" = OrderedDict()
 
@@ -210,23 +253,14 @@ def aggregate_signal_views(
     by_role: "OrderedDict[str, Any]" = OrderedDict()
 
     for role in _stable_sort(role_buckets.keys()):
-        r_rows = role_buckets[role]
-        rc = len(r_rows)
-
-        role_nonempty_counts: List[int] = []
-        role_signal_counts: List[int] = []
-        role_evidence_counts: List[int] = []
-
-        for rr in r_rows:
-            role_nonempty_counts.append(_count_populated_fields(rr, all_fields))
-            role_signal_counts.append(_count_populated_fields(rr, signal_fields))
-            role_evidence_counts.append(_count_populated_fields(rr, evidence_fields))
+        r_counts = role_buckets[role]
+        rc = len(r_counts)
 
         by_role[role] = OrderedDict(
             row_count=rc,
-            nonempty_fields_avg=_safe_div(sum(role_nonempty_counts), rc),
-            signal_fields_nonempty_avg=_safe_div(sum(role_signal_counts), rc),
-            evidence_fields_nonempty_avg=_safe_div(sum(role_evidence_counts), rc),
+            nonempty_fields_avg=_safe_div(sum(c[0] for c in r_counts), rc),
+            signal_fields_nonempty_avg=_safe_div(sum(c[1] for c in r_counts), rc),
+            evidence_fields_nonempty_avg=_safe_div(sum(c[2] for c in r_counts), rc),
             signal_like_field_count=len(signal_fields),
             evidence_like_field_count=len(evidence_fields),
         )
@@ -5,7 +5,7 @@ anchor_exhaustion_pass.py
 IMPORT-ONLY MODULE (CALLABLE UTILITY)
 
 Maintainer: L. David Mendoza © 2026
-Version: v1.2.1 (EOF-CONTAMINATION FIX, LOCKED)
+Version: v1.3.0
 
 Purpose
 - Normalize and exhaust anchor URLs already present in the dataset into
@@ -27,6 +27,10 @@ Non-Negotiables
 - No writes outside returned rows (when used via process_csv).
 
 Changelog
+- v1.3.0: classify_anchor delegates to the shared memoized URL engine
+  (EXECUTION_CORE/url_canon.py: anchor_column). Anchors are merged into each
+  target column once per row (add_unique_many) instead of one re-split/re-sort
+  per URL; output is identical.
 - v1.2.1: Remove stray heredoc token ("EOF") causing NameError; keep all logic
   deterministic and non-overwriting.
 
@@ -49,7 +53,9 @@ git push
 from __future__ import annotations
 
 import csv
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
+
+from EXECUTION_CORE.url_canon import anchor_column
 
 # Canonical output columns (targets)
 CANONICAL_URL_COLUMNS: Tuple[str, ...] = (
@@ -105,76 +111,36 @@ def _is_mailto(u: str) -> bool:
     return (u or "").strip().lower().startswith("mailto:")
 
 
-def add_unique(existing: str, url: str) -> str:
+def add_unique_many(existing: str, urls: Iterable[str]) -> str:
     """
-    Pipe-delimited append with case-insensitive dedupe and deterministic ordering.
+    Pipe-delimited append of several URLs with case-insensitive dedupe and
+    deterministic ordering; same result as folding add_unique over urls.
     """
-    url = (url or "").strip()
-    if not url:
-        return existing or ""
-
     existing_parts = [p.strip() for p in (existing or "").split("|") if p.strip()]
     seen = {p.lower() for p in existing_parts}
-    if url.lower() in seen:
+    added = False
+    for url in urls:
+        url = (url or "").strip()
+        if not url:
+            continue
+        k = url.lower()
+        if k in seen:
+            continue
+        seen.add(k)
+        existing_parts.append(url)
+        added = True
+
+    if not added:
         return existing or ""
-
-    existing_parts.append(url)
     existing_parts = sorted(existing_parts, key=lambda x: x.lower())
     return "|".join(existing_parts)
 
 
-def _is_github_io(u: str) -> bool:
-    return "github.io" in (u or "").lower()
-
-
-def _is_probably_blog(u: str) -> bool:
-    s = (u or "").lower()
-    return any(
-        k in s
-        for k in (
-            "/blog",
-            "medium.com",
-            "substack.com",
-            "dev.to",
-            "hashnode.com",
-            "wordpress",
-            "blogspot",
-        )
-    )
-
-
-def _is_probably_portfolio(u: str) -> bool:
-    s = (u or "").lower()
-    return any(
-        k in s
-        for k in (
-            "portfolio",
-            "/projects",
-            "/work",
-            "/case",
-            "showcase",
-            "personal-site",
-        )
-    )
-
-
-def _is_probably_cv(u: str) -> bool:
-    s = (u or "").lower()
-    # conservative: treat obvious resume/cv URLs or PDFs as CV links
-    if s.endswith(".pdf"):
-        return True
-    return any(
-        k in s
-        for k in (
-            "resume",
-            "cv",
-            "curriculum",
-            "résumé",
-            "lebenslauf",
-            "履歴書",
-            "简历",
-        )
-    )
+def add_unique(existing: str, url: str) -> str:
+    """
+    Pipe-delimited append with case-insensitive dedupe and deterministic ordering.
+    """
+    return add_unique_many(existing, (url,))
 
 
 def classify_anchor(url: str) -> str:
@@ -182,19 +148,7 @@ def classify_anchor(url: str) -> str:
     Determine which canonical URL column a URL belongs to.
     Default is Personal_Website_URLs.
     """
-    u = (url or "").strip()
-    if not u:
-        return "Personal_Website_URLs"
-
-    if _is_github_io(u):
-        return "GitHub_IO_URL"
-    if _is_probably_cv(u):
-        return "CV_URLs"
-    if _is_probably_blog(u):
-        return "Blog_URLs"
-    if _is_probably_portfolio(u):
-        return "Portfolio_URLs"
-    return "Personal_Website_URLs"
+    return anchor_column(url)
 
 
 def ensure_columns(fieldnames: List[str]) -> List[str]:
@@ -229,6 +183,7 @@ def exhaust_anchors_in_rows(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
         # Deterministic iteration order
         anchors = sorted(set(anchors), key=lambda x: x.lower())
 
+        by_target: Dict[str, List[str]] = {}
         for u in anchors:
             target = classify_anchor(u)
 
@@ -238,8 +193,11 @@ def exhaust_anchors_in_rows(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
                     row["GitHub_IO_URL"] = u
                 continue
 
-            # Pipe-delimited targets: append with dedupe
-            row[target] = add_unique(row.get(target, ""), u)
+            by_target.setdefault(target, []).append(u)
+
+        # Pipe-delimited targets: append with dedupe
+        for target, urls in by_target.items():
+            row[target] = add_unique_many(row.get(target, ""), urls)
 
     return rows
 
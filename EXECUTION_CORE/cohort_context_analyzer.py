@@ -5,17 +5,23 @@ DAY 17 — COHORT CONTEXT ANALYZER
 Compute cohort-level context signals.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Sequence
 
 
 def analyze_cohort(evaluations: List[Dict[str, object]]) -> Dict[str, float]:
     """
     Compute simple cohort statistics.
     """
-    scores = [e["final_score"] for e in evaluations]
+    return analyze_cohort_scores([e["final_score"] for e in evaluations])
+
+
+def analyze_cohort_scores(scores: Sequence[float]) -> Dict[str, float]:
+    """
+    analyze_cohort over a score column (cohort order), no per-row dicts.
+    """
     if not scores:
         return {"avg_score": 0.0}
     return {"avg_score": sum(scores) / len(scores)}
 
 
-__all__ = ["analyze_cohort"]
+__all__ = ["analyze_cohort", "analyze_cohort_scores"]
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EXECUTION_CORE/column_plan.py
+============================================================
+COLUMN PLAN COMPILER (HEADER -> POSITIONS, ONCE)
+
+Maintainer: L. David Mendoza © 2026
+Version: v1.0.0
+
+Purpose
+- Row passes used to look up the same column names in every row dict, and some
+  re-classified field names on every call. A ColumnPlan resolves a header once:
+  names -> integer positions, fallback chains -> position tuples, name
+  predicates -> position tuples. Row passes then work on plain lists/tuples.
+
+Conventions
+- Positions follow csv.DictReader: a duplicated header name resolves to its
+  last occurrence.
+- A lookup of an absent column compiles to an empty position tuple, so
+  "missing" and "blank" read the same (""), exactly like row.get(k) -> None.
+- Rows are lists of str, padded to the plan width (fit()).
+- Output via out_row() reproduces csv.DictWriter over the same header, including
+  duplicated names (each copy written with the resolved value).
+
+Rules
+- Deterministic. Import-only. No IO beyond the csv helpers.
+
+Validation
+python3 -m py_compile EXECUTION_CORE/column_plan.py
+"""
+
+from __future__ import annotations
+
+import csv
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+Positions = Tuple[int, ...]
+
+
+class ColumnPlan:
+
+    def __init__(self, fieldnames: Sequence[str]):
+        self.fieldnames: List[str] = list(fieldnames)
+        self.index: Dict[str, int] = {}
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        self.index = {name: i for i, name in enumerate(self.fieldnames)}
+        self.width = len(self.fieldnames)
+        self._out = None
+        if len(self.index) != self.width:
+            self._out = [self.index[name] for name in self.fieldnames]
+
+    # --- compile ---------------------------------------------------------
+
+    def ensure(self, name: str) -> int:
+        """Position of name, appending the column to the header if absent."""
+        i = self.index.get(name)
+        if i is None:
+            self.fieldnames.append(name)
+            self._rebuild()
+            i = self.index[name]
+        return i
+
+    def at(self, *names: str) -> Positions:
+        """Positions of the present columns among names, in the given order."""
+        return tuple(self.index[n] for n in names if n in self.index)
+
+    def where(self, predicate: Callable[[str], bool]) -> Positions:
+        """Positions of distinct columns whose name satisfies predicate."""
+        return tuple(i for n, i in self.index.items() if predicate(n))
+
+    # --- rows ------------------------------------------------------------
+
+    def fit(self, values: List[str]) -> List[str]:
+        """Pad (with "") or truncate a raw csv row to the plan width, in place."""
+        n = len(values)
+        if n < self.width:
+            values.extend([""] * (self.width - n))
+        elif n > self.width:
+            del values[self.width:]
+        return values
+
+    def from_dict(self, row: Dict[str, object]) -> List[str]:
+        return [str(row.get(name) or "") for name in self.fieldnames]
+
+    def to_dict(self, values: Sequence[str]) -> Dict[str, str]:
+        return {name: values[i] for name, i in self.index.items()}
+
+    def out_row(self, values: Sequence[str]) -> Sequence[str]:
+        if self._out is None:
+            return values
+        return [values[i] for i in self._out]
+
+
+# ------------------------------------------------------------
+# Row accessors over compiled positions
+# ------------------------------------------------------------
+
+def first_value(values: Sequence[str], positions: Positions) -> str:
+    """First non-blank (stripped) value among positions, else ""."""
+    for i in positions:
+        v = values[i].strip()
+        if v:
+            return v
+    return ""
+
+
+def any_value(values: Sequence[str], positions: Positions) -> bool:
+    for i in positions:
+        if values[i].strip():
+            return True
+    return False
+
+
+def count_nonblank(values: Sequence[str], positions: Positions) -> int:
+    return sum(1 for i in positions if values[i].strip())
+
+
+# ------------------------------------------------------------
+# Field-name classification (memoized per name, shared by all plans)
+# ------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def name_has_any(name: str, needles: Tuple[str, ...]) -> bool:
+    f = name.lower()
+    return any(k in f for k in needles)
+
+
+# ------------------------------------------------------------
+# CSV helpers
+# ------------------------------------------------------------
+
+def read_csv(path: str | Path) -> Tuple[ColumnPlan, List[List[str]]]:
+    """Header plan + rows as lists fitted to the header width."""
+    with Path(path).open(newline="", encoding="utf-8") as fin:
+        reader = csv.reader(fin)
+        header = next(reader, [])
+        plan = ColumnPlan(header)
+        # csv.DictReader skips rows with no fields at all
+        rows = [plan.fit(r) for r in reader if r]
+    return plan, rows
+
+
+def write_csv(path: str | Path, plan: ColumnPlan, rows: Iterable[List[str]]) -> None:
+    with Path(path).open("w", newline="", encoding="utf-8") as fout:
+        writer = csv.writer(fout)
+        writer.writerow(plan.fieldnames)
+        for r in rows:
+            writer.writerow(plan.out_row(plan.fit(r)))
+
+
+__all__ = [
+    "ColumnPlan",
+    "Positions",
+    "first_value",
+    "any_value",
+    "count_nonblank",
+    "name_has_any",
+    "read_csv",
+    "write_csv",
+]
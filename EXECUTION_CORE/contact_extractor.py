@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EXECUTION_CORE/contact_extractor.py
+============================================================
+EVIDENCE-ONLY ROW CONTACT EXTRACTOR
+
+Maintainer: L. David Mendoza © 2026
+Version: v1.0.0
+
+Purpose
+- Extract public email addresses and phone numbers from a row's existing text,
+  one evidence column at a time, and report which column each value came from.
+- Replaces "join every field into one blob, then run three regexes over it":
+  that re-scanned Field_Level_Provenance_JSON (which grows every pass) and let
+  matches straddle two unrelated fields.
+
+Scanning
+- Evidence columns are declared: an explicit list, or every column except
+  provenance columns (EXCLUDED_COLUMNS / *_Provenance_JSON).
+- Each column is visited once; cheap prefilters gate the regexes:
+    '@' present            -> direct email regex
+    '@' or "at" present    -> de-obfuscating email regex ("x (at) y dot com")
+    >= 10 digits           -> phone regex (it needs 3 + 3 + 4 digits)
+  Most columns (URLs, names, scores) fail every gate and are never regex-scanned.
+- Patterns are the ones public_identity_contact_pass has always used.
+
+Result
+- ContactHits: value -> first evidence column it was found in (column order),
+  plus deterministic primary picks (lowest value case-insensitively).
+
+Benchmark: python3 scripts/bench_contact_extractor.py [ROWS] [WIDTH]
+Tests: test/test_contact_extractor.py
+
+Rules
+- Deterministic. No network. No guessing.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+EMAIL_DIRECT_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+EMAIL_DEOB_RE = re.compile(
+    r"([a-zA-Z0-9._%+\-]+)\s*(?:@|\(at\)|\sat\s)\s*([a-zA-Z0-9.\-]+)\s*(?:\.|\(dot\)|\sdot\s)\s*([a-zA-Z]{2,})",
+    re.IGNORECASE,
+)
+PHONE_RE = re.compile(r"(\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}")
+
+PHONE_MIN_DIGITS = 10
+
+EXCLUDED_COLUMNS = ("Field_Level_Provenance_JSON",)
+
+_STRIP_ASCII_DIGITS = str.maketrans("", "", "0123456789")
+
+
+def is_evidence_column(name: str) -> bool:
+    return name not in EXCLUDED_COLUMNS and not name.endswith("_Provenance_JSON")
+
+
+@dataclass
+class ContactHits:
+    emails: Dict[str, str] = field(default_factory=dict)  # value -> source column
+    phones: Dict[str, str] = field(default_factory=dict)
+
+    def primary_email(self) -> Optional[Tuple[str, str]]:
+        """(value, column) of the lowest email case-insensitively, or None."""
+        if not self.emails:
+            return None
+        v = min(self.emails, key=lambda e: (e.lower(), e))
+        return v, self.emails[v]
+
+    def primary_phone(self) -> Optional[Tuple[str, str]]:
+        if not self.phones:
+            return None
+        v = min(self.phones, key=lambda p: (p.lower(), p))
+        return v, self.phones[v]
+
+
+def scan_text(text: str, column: str, hits: ContactHits) -> None:
+    """Scan one field value into hits (first column wins per value)."""
+    if "@" in text:
+        for m in EMAIL_DEOB_RE.finditer(text):
+            e = f"{m.group(1)}@{m.group(2)}.{m.group(3)}".strip()
+            if e:
+                hits.emails.setdefault(e, column)
+        for m in EMAIL_DIRECT_RE.finditer(text):
+            e = m.group(0).strip()
+            if e:
+                hits.emails.setdefault(e, column)
+    elif "at" in text or "AT" in text or "aT" in text or "At" in text:
+        for m in EMAIL_DEOB_RE.finditer(text):
+            e = f"{m.group(1)}@{m.group(2)}.{m.group(3)}".strip()
+            if e:
+                hits.emails.setdefault(e, column)
+
+    # \d also matches non-ASCII decimal digits: only count when the text is ASCII
+    if not text.isascii() or len(text) - len(text.translate(_STRIP_ASCII_DIGITS)) >= PHONE_MIN_DIGITS:
+        for m in PHONE_RE.finditer(text):
+            p = m.group(0).strip()
+            if p:
+                hits.phones.setdefault(p, column)
+
+
+class ContactExtractor:
+
+    def __init__(self, evidence_columns: Optional[Sequence[str]] = None):
+        self.evidence_columns = list(evidence_columns) if evidence_columns is not None else None
+
+    def columns_for(self, row: Dict[str, str]) -> Iterable[str]:
+        if self.evidence_columns is not None:
+            return self.evidence_columns
+        return [k for k in row.keys() if is_evidence_column(k)]
+
+    def extract(self, row: Dict[str, str]) -> ContactHits:
+        hits = ContactHits()
+        for col in self.columns_for(row):
+            v = row.get(col)
+            if not v:
+                continue
+            scan_text(str(v), col, hits)
+        return hits
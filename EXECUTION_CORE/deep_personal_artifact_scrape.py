@@ -4,7 +4,7 @@
 AI Talent Engine — Deep Personal Artifact Scrape (Day 1 MVP)
 Maintainer: L. David Mendoza © 2025
 Module: EXECUTION_CORE/deep_personal_artifact_scrape.py
-Version: v0.1.0-day1
+Version: v0.6.1
 Created: 2026-01-13
 
 PURPOSE
@@ -28,6 +28,32 @@ NON-GOALS (Day 1 MVP)
 
 CHANGELOG
 - v0.1.0-day1: Initial MVP implementation
+- v0.2.0: Cross-run person cache (EXECUTION_CORE/person_enrichment_cache.py).
+  github.io discovery (incl. negative results) and the raw crawl extraction are
+  cached per GitHub login; a fresh entry for the same crawl roots and caps skips
+  all network. Non-overwrite filtering still runs against the caller's values.
+- v0.3.0: Per-page extraction (title, h1, emails, links) is memoized by body
+  hash + PAGE_EXTRACTOR_VERSION + page URL (EXECUTION_CORE/extraction_cache.py);
+  unchanged pages skip parsing. Hit/miss counts are reported in the crawl log.
+- v0.4.0: _normalize_url delegates to the shared memoized URL engine
+  (EXECUTION_CORE/url_canon.py: normalize_http); same results.
+- v0.5.0: One page scan (_PageScan) feeds every extractor: the page is lowercased
+  once and each regex only runs when its literal is present ("tle>", "</h1>",
+  "lto:", "href", "@"/"at"). EMAIL_REGEX no longer runs over the whole page: it
+  runs per run of characters a match can contain, only on runs holding "@" or
+  "at", with whitespace runs collapsed to one space (the pattern only ever needs
+  zero or one whitespace there; it was quadratic in long whitespace runs).
+  Byte cap (PAGE_SCAN_MAX_CHARS) and per-page time budget (PAGE_SCAN_BUDGET_S);
+  a page over budget keeps what was found, is not memoized, and is counted in
+  the crawl log. Same output otherwise.
+  Tests: test/test_deep_personal_artifact_scrape.py
+- v0.6.0: Links, title and h1 from an EXECUTION_CORE/html_stream.py tokenization
+  (PAGE_EXTRACTOR_VERSION 2). Withdrawn in v0.6.1.
+- v0.6.1: Back on the v0.5.0 extractors (and the full links/title/h1/emails
+  regression corpus). Pages are fetched whole here, so tokenizing saved nothing
+  and only changed output (entity-decoded hrefs, no links inside <script>).
+  PAGE_EXTRACTOR_VERSION is 1 again: memo entries under 1 hold this output,
+  entries written by v0.6.0 (version 2) are never read.
 
 SECURITY / SAFETY
 - Only follows http(s) links
@@ -42,6 +68,7 @@ from __future__ import annotations
 import hashlib
 import html
 import json
+import os
 import re
 import time
 import urllib.parse
@@ -49,6 +76,21 @@ import urllib.request
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+try:
+    from EXECUTION_CORE.person_enrichment_cache import get_cache
+except ImportError:  # imported as a top-level module from EXECUTION_CORE/
+    from person_enrichment_cache import get_cache
+
+try:
+    from EXECUTION_CORE.extraction_cache import memoize as memoize_extraction
+except ImportError:  # imported as a top-level module from EXECUTION_CORE/
+    from extraction_cache import memoize as memoize_extraction
+
+try:
+    from EXECUTION_CORE.url_canon import normalize_http
+except ImportError:  # imported as a top-level module from EXECUTION_CORE/
+    from url_canon import normalize_http
+
 
 DEFAULT_UA = (
     "AI-Talent-Engine/DeepScrapeDay1 (public-evidence-only; "
@@ -81,6 +123,24 @@ PDF_REGEX = re.compile(r"(?i)\.pdf(?:$|\?)")
 # Simple HTML link extraction without external deps
 HREF_REGEX = re.compile(r'(?is)\bhref\s*=\s*["\']([^"\']+)["\']')
 
+TITLE_REGEX = re.compile(r"(?is)<title[^>]*>(.*?)</title>")
+H1_REGEX = re.compile(r"(?is)<h1[^>]*>(.*?)</h1>")
+TAG_REGEX = re.compile(r"(?is)<[^>]+>")
+WS_REGEX = re.compile(r"\s+")
+
+# Bump whenever _extract_page (or any extractor it calls) changes output.
+PAGE_EXTRACTOR_VERSION = "1"
+
+# Extraction caps per page (the fetch cap is 2_000_000 bytes, so the default
+# char cap never truncates a fetched page).
+PAGE_SCAN_MAX_CHARS = int(os.environ.get("AI_TALENT_DEEP_SCRAPE_SCAN_CHARS") or 2_000_000)
+PAGE_SCAN_BUDGET_S = float(os.environ.get("AI_TALENT_DEEP_SCRAPE_PAGE_BUDGET_S") or 2.0)
+
+# Every EMAIL_REGEX match lies inside one run of these characters. Same flags
+# as EMAIL_REGEX, so the same case folding (e.g. U+212A KELVIN SIGN is in).
+EMAIL_RUN_REGEX = re.compile(r"(?i)[A-Z0-9._%+\-\s@()\[\]{}]+")
+WS_RUN_REGEX = re.compile(r"\s{2,}")
+
 
 @dataclass
 class ExtractedValue:
@@ -94,6 +154,9 @@ class CrawlLog:
     pages_visited: List[str] = field(default_factory=list)
     pages_skipped: List[str] = field(default_factory=list)
     stop_reason: str = ""  # depth_limit | page_cap | no_links | error
+    extraction_cache_hits: int = 0
+    extraction_cache_misses: int = 0
+    extraction_over_budget: int = 0
 
 
 @dataclass
@@ -136,6 +199,11 @@ class PersonDeepScrapeResult:
                 "pages_visited": self.crawl_log.pages_visited,
                 "pages_skipped": self.crawl_log.pages_skipped,
                 "stop_reason": self.crawl_log.stop_reason,
+                "extraction_cache": {
+                    "hits": self.crawl_log.extraction_cache_hits,
+                    "misses": self.crawl_log.extraction_cache_misses,
+                },
+                "extraction_over_budget": self.crawl_log.extraction_over_budget,
             },
         }
 
@@ -151,35 +219,8 @@ def _stable_dedupe(items: Iterable[str]) -> List[str]:
 
 
 def _normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
-    url = (url or "").strip()
-    if not url:
-        return None
-
-    # Handle relative URLs
-    if base:
-        url = urllib.parse.urljoin(base, url)
-
-    # Remove fragments
-    parsed = urllib.parse.urlparse(url)
-    if parsed.scheme not in ("http", "https"):
-        return None
-
-    # Normalize: lowercase scheme/host, keep path/query
-    host = (parsed.hostname or "").lower()
-    if not host:
-        return None
-
-    norm = urllib.parse.urlunparse(
-        (
-            parsed.scheme.lower(),
-            host if parsed.port in (None, 80, 443) else f"{host}:{parsed.port}",
-            parsed.path or "/",
-            "",  # params unused
-            parsed.query or "",
-            "",  # fragment removed
-        )
-    )
-    return norm
+    # Resolve against base, drop fragment, lowercase scheme/host (memoized)
+    return normalize_http(url, base)
 
 
 def _same_domain(url: str, domain: str) -> bool:
@@ -226,56 +267,107 @@ def _fetch_url(
         return None, None
 
 
-def _extract_links(html_text: str, base_url: str) -> List[str]:
+class PageBudgetExceeded(Exception):
+    """Raised by _extract_page past PAGE_SCAN_BUDGET_S; .page holds what was found."""
+
+    def __init__(self, page: Dict):
+        super().__init__("page extraction over budget")
+        self.page = page
+
+
+class _PageScan:
+    """
+    One pass over a page shared by every extractor: capped text, its lowercase
+    form for literal prefilters, and the candidate runs for EMAIL_REGEX.
+    """
+
+    __slots__ = ("text", "lower", "deadline", "exhausted")
+
+    def __init__(self, html_text: str, budget_s: Optional[float] = None):
+        self.text = (html_text or "")[:PAGE_SCAN_MAX_CHARS]
+        self.lower = self.text.lower()
+        self.deadline = time.monotonic() + (PAGE_SCAN_BUDGET_S if budget_s is None else budget_s)
+        self.exhausted = False
+
+    def has(self, literal: str) -> bool:
+        # literal must be lowercase and free of characters with irregular case
+        # folding (i/s/k), so "not in lower" proves a (?i) pattern cannot match
+        return literal in self.lower
+
+    def email_runs(self) -> Iterable[str]:
+        """
+        Runs of the page EMAIL_REGEX can match in, as EMAIL_REGEX sees them:
+        every match needs "@" or "at" (case-insensitive) and cannot cross a
+        character outside EMAIL_RUN_REGEX, whose lookarounds then read the same.
+        Whitespace runs shrink to one space: the pattern accepts any run of zero
+        or more (or one or more) whitespace characters in the same places, and
+        groups never contain whitespace.
+        """
+        if "@" not in self.text and not self.has("at"):
+            return
+        for m in EMAIL_RUN_REGEX.finditer(self.text):
+            run = m.group()
+            if "@" in run or "at" in run.lower():
+                if time.monotonic() > self.deadline:
+                    self.exhausted = True
+                    return
+                yield WS_RUN_REGEX.sub(" ", run)
+
+
+def _extract_links(html_text: str, base_url: str, scan: Optional[_PageScan] = None) -> List[str]:
+    scan = scan or _PageScan(html_text)
     links: List[str] = []
-    for m in HREF_REGEX.finditer(html_text or ""):
-        href = m.group(1)
-        norm = _normalize_url(href, base=base_url)
-        if norm:
-            links.append(norm)
+    if scan.has("href"):
+        for m in HREF_REGEX.finditer(scan.text):
+            href = m.group(1)
+            norm = _normalize_url(href, base=base_url)
+            if norm:
+                links.append(norm)
     # Deterministic ordering
     links = sorted(_stable_dedupe(links))
     return links
 
 
-def _extract_title(html_text: str) -> Optional[str]:
-    m = re.search(r"(?is)<title[^>]*>(.*?)</title>", html_text or "")
+def _tag_text(m: Optional[re.Match]) -> Optional[str]:
     if not m:
         return None
-    title = re.sub(r"(?is)<[^>]+>", " ", m.group(1))
-    title = html.unescape(title)
-    title = re.sub(r"\s+", " ", title).strip()
-    return title or None
+    txt = TAG_REGEX.sub(" ", m.group(1))
+    txt = html.unescape(txt)
+    txt = WS_REGEX.sub(" ", txt).strip()
+    return txt or None
 
 
-def _extract_h1(html_text: str) -> Optional[str]:
-    m = re.search(r"(?is)<h1[^>]*>(.*?)</h1>", html_text or "")
-    if not m:
-        return None
-    h1 = re.sub(r"(?is)<[^>]+>", " ", m.group(1))
-    h1 = html.unescape(h1)
-    h1 = re.sub(r"\s+", " ", h1).strip()
-    return h1 or None
+def _extract_title(html_text: str, scan: Optional[_PageScan] = None) -> Optional[str]:
+    scan = scan or _PageScan(html_text)
+    return _tag_text(TITLE_REGEX.search(scan.text)) if scan.has("tle>") else None
+
+
+def _extract_h1(html_text: str, scan: Optional[_PageScan] = None) -> Optional[str]:
+    scan = scan or _PageScan(html_text)
+    return _tag_text(H1_REGEX.search(scan.text)) if scan.has("</h1>") else None
 
 
-def _extract_emails(html_text: str, source_url: str) -> List[ExtractedValue]:
+def _extract_emails(html_text: str, source_url: str, scan: Optional[_PageScan] = None) -> List[ExtractedValue]:
+    scan = scan or _PageScan(html_text)
     out: List[ExtractedValue] = []
 
     # mailto first (high precision)
-    for mm in MAILTO_REGEX.finditer(html_text or ""):
-        addr = mm.group(1).strip()
-        addr = addr.split("?")[0]
-        addr = addr.replace("%40", "@").replace("%2B", "+")
-        if "@" in addr and len(addr) <= 320:
-            out.append(ExtractedValue(value=addr, source_url=source_url, method="mailto"))
+    if scan.has("lto:"):
+        for mm in MAILTO_REGEX.finditer(scan.text):
+            addr = mm.group(1).strip()
+            addr = addr.split("?")[0]
+            addr = addr.replace("%40", "@").replace("%2B", "+")
+            if "@" in addr and len(addr) <= 320:
+                out.append(ExtractedValue(value=addr, source_url=source_url, method="mailto"))
 
     # de-obfuscation regex (basic)
-    for em in EMAIL_REGEX.finditer(html_text or ""):
-        local, dom, tld = em.group(1), em.group(2), em.group(3)
-        candidate = f"{local}@{dom}.{tld}".lower()
-        candidate = re.sub(r"\s+", "", candidate)
-        if len(candidate) <= 320 and "." in dom and "@" in candidate:
-            out.append(ExtractedValue(value=candidate, source_url=source_url, method="regex_obfus"))
+    for run in scan.email_runs():
+        for em in EMAIL_REGEX.finditer(run):
+            local, dom, tld = em.group(1), em.group(2), em.group(3)
+            candidate = f"{local}@{dom}.{tld}".lower()
+            candidate = WS_REGEX.sub("", candidate)
+            if len(candidate) <= 320 and "." in dom and "@" in candidate:
+                out.append(ExtractedValue(value=candidate, source_url=source_url, method="regex_obfus"))
 
     # stable dedupe by value+source
     seen: Set[Tuple[str, str]] = set()
@@ -288,6 +380,37 @@ def _extract_emails(html_text: str, source_url: str) -> List[ExtractedValue]:
     return dedup
 
 
+def _extract_page(html_text: str, url: str) -> Dict:
+    """JSON-compatible per-page extraction; see PAGE_EXTRACTOR_VERSION."""
+    scan = _PageScan(html_text)
+    page = {
+        "title": _extract_title(html_text, scan),
+        "h1": _extract_h1(html_text, scan),
+        "emails": [[e.value, e.method] for e in _extract_emails(html_text, url, scan)],
+        "links": _extract_links(html_text, url, scan),
+    }
+    if scan.exhausted:
+        raise PageBudgetExceeded(page)
+    return page
+
+
+def _extract_page_cached(html_text: str, url: str, log: CrawlLog) -> Dict:
+    try:
+        page, hit = memoize_extraction(
+            "deep_scrape_page", PAGE_EXTRACTOR_VERSION, html_text,
+            lambda: _extract_page(html_text, url), context=url,
+        )
+    except PageBudgetExceeded as exc:
+        # partial and timing-dependent: used for this crawl, never memoized
+        log.extraction_over_budget += 1
+        return exc.page
+    if hit:
+        log.extraction_cache_hits += 1
+    else:
+        log.extraction_cache_misses += 1
+    return page
+
+
 def _extract_cv_links(links: List[str], source_url: str) -> List[ExtractedValue]:
     out: List[ExtractedValue] = []
     for u in links:
@@ -412,21 +535,22 @@ def crawl_domain_extract(
             continue
 
         log.pages_visited.append(url)
+        page = _extract_page_cached(txt, url, log)
 
         # Extract name candidate
         if best_name is None:
-            title = _extract_title(txt)
-            h1 = _extract_h1(txt)
+            title = page["title"]
+            h1 = page["h1"]
             # Prefer h1 if reasonably short
             candidate = h1 if (h1 and 2 <= len(h1) <= 80) else title
             if candidate and 2 <= len(candidate) <= 80:
                 best_name = ExtractedValue(value=candidate, source_url=url, method="h1/title")
 
         # Extract emails
-        emails.extend(_extract_emails(txt, url))
+        emails.extend(ExtractedValue(value=v, source_url=url, method=m) for v, m in page["emails"])
 
         # Extract links
-        links = _extract_links(txt, url)
+        links = page["links"]
         cvs.extend(_extract_cv_links(links, url))
 
         # Enqueue next URLs
@@ -464,6 +588,30 @@ def _stable_dedupe_extracted(items: List[ExtractedValue]) -> List[ExtractedValue
     return out
 
 
+def _ev_to_dict(ev: Optional[ExtractedValue]) -> Optional[Dict[str, str]]:
+    if ev is None:
+        return None
+    return {"value": ev.value, "source_url": ev.source_url, "method": ev.method}
+
+
+def _ev_from_dict(d: Optional[Dict[str, str]]) -> Optional[ExtractedValue]:
+    if not d:
+        return None
+    return ExtractedValue(value=d["value"], source_url=d["source_url"], method=d["method"])
+
+
+def _cached_github_io_url(github_username: str, cache) -> Optional[str]:
+    if cache is None:
+        return discover_github_io_url(github_username)
+    hit = cache.get("github_io_url", login=github_username)
+    if hit is not None:
+        return hit["value"] or None
+    ghio = discover_github_io_url(github_username)
+    # "" records a negative result so absent pages are not re-probed every run
+    cache.put("github_io_url", ghio or "", "https_probe", login=github_username)
+    return ghio
+
+
 def deep_scrape_person(
     person_id: str,
     github_username: Optional[str],
@@ -486,10 +634,11 @@ def deep_scrape_person(
 
     start_urls: List[str] = []
     personal_domain: Optional[str] = None
+    cache = get_cache() if github_username else None
 
     # 1) github.io discovery
     if enable_github_io and github_username:
-        ghio = discover_github_io_url(github_username)
+        ghio = _cached_github_io_url(github_username, cache)
         if ghio:
             res.discovered_github_io_url = ghio
             start_urls.append(ghio)
@@ -507,7 +656,18 @@ def deep_scrape_person(
     best_name: Optional[ExtractedValue] = None
     combined_log = CrawlLog()
 
-    for root in _stable_dedupe(start_urls):
+    roots = _stable_dedupe(start_urls)
+    crawl_sig = {"roots": roots, "max_depth": max_depth, "max_pages": max_pages}
+    hit = cache.get("deep_scrape", login=github_username) if cache is not None else None
+    if hit is not None and hit["value"].get("crawl") == crawl_sig:
+        cached = hit["value"]
+        extracted_emails = [_ev_from_dict(d) for d in cached["emails"]]
+        extracted_cvs = [_ev_from_dict(d) for d in cached["cv_urls"]]
+        best_name = _ev_from_dict(cached["full_name"])
+        combined_log = CrawlLog(**cached["crawl_log"])
+        roots = []
+
+    for root in roots:
         dom = _get_domain(root)
         if not dom:
             continue
@@ -520,12 +680,33 @@ def deep_scrape_person(
         combined_log.pages_visited.extend(log.pages_visited)
         combined_log.pages_skipped.extend(log.pages_skipped)
         combined_log.stop_reason = log.stop_reason or combined_log.stop_reason
+        combined_log.extraction_cache_hits += log.extraction_cache_hits
+        combined_log.extraction_cache_misses += log.extraction_cache_misses
+        combined_log.extraction_over_budget += log.extraction_over_budget
 
         extracted_emails.extend(e)
         extracted_cvs.extend(c)
         if best_name is None and n is not None:
             best_name = n
 
+    if cache is not None and roots:
+        cache.put(
+            "deep_scrape",
+            {
+                "crawl": crawl_sig,
+                "emails": [_ev_to_dict(e) for e in extracted_emails],
+                "cv_urls": [_ev_to_dict(c) for c in extracted_cvs],
+                "full_name": _ev_to_dict(best_name),
+                "crawl_log": {
+                    "pages_visited": combined_log.pages_visited,
+                    "pages_skipped": combined_log.pages_skipped,
+                    "stop_reason": combined_log.stop_reason,
+                },
+            },
+            "crawl_domain_extract",
+            login=github_username,
+        )
+
     # Apply non-overwrite filtering (we keep only new values)
     for e in _stable_dedupe_extracted(extracted_emails):
         if e.value.strip().lower() not in existing_emails_l:
@@ -589,3 +770,4 @@ def stable_person_hash(person_id: str, github_username: Optional[str]) -> str:
     """
     s = f"{person_id}::{(github_username or '').strip().lower()}"
     return hashlib.sha256(s.encode("utf-8")).hexdigest()[:16]
+
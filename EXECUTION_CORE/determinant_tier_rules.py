@@ -19,10 +19,20 @@ THIS FILE IS NOT:
 - NOT an aggregator
 - NOT a CSV reader
 - NOT executable
+
+LOOKUP
+- ROLE_DETERMINANT_CATEGORIES is compiled once at import into per-family hash
+  tables: role_family -> normalized category -> tier (first tier
+  listing a category wins, as in the ordered scan). Resolution is one
+  normalization + one dict lookup per evidence item.
+- resolve_determinant_tiers / resolve_cohort_tiers resolve a row's evidence
+  list / a whole cohort with the family table looked up once per row.
+- Results are identical to the ordered scan; anti-inflation rules are applied
+  downstream and are unaffected.
 """
 
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 
 DETERMINANT_TIERS: Dict[str, Dict[str, str]] = {
@@ -194,6 +204,25 @@ def _norm(s: str) -> str:
     return (s or "").strip().lower()
 
 
+def _compile_tier_tables(
+    rules: Dict[str, Dict[str, List[str]]],
+) -> Dict[str, Dict[str, str]]:
+    tables: Dict[str, Dict[str, str]] = {}
+    for family, family_rules in rules.items():
+        # keyed as listed: lookups normalize role_family, the rule keys are not
+        table: Dict[str, str] = {}
+        for tier, categories in family_rules.items():
+            for c in categories:
+                table.setdefault(_norm(c), tier)
+        table.pop("", None)
+        tables[family] = table
+    return tables
+
+
+_TIER_TABLES: Dict[str, Dict[str, str]] = _compile_tier_tables(ROLE_DETERMINANT_CATEGORIES)
+_NO_TABLE: Dict[str, str] = {}
+
+
 def resolve_determinant_tier(
     *,
     role_family: str,
@@ -205,21 +234,31 @@ def resolve_determinant_tier(
     - Exact match only within ROLE_DETERMINANT_CATEGORIES
     - Unknown -> tier_4
     """
-    rf = _norm(role_family)
-    ec = _norm(evidence_category)
-    if not rf or not ec:
-        return "tier_4"
+    return _TIER_TABLES.get(_norm(role_family), _NO_TABLE).get(_norm(evidence_category), "tier_4")
+
 
-    family_rules = ROLE_DETERMINANT_CATEGORIES.get(rf, {})
-    if not family_rules:
-        return "tier_4"
+def resolve_determinant_tiers(
+    *,
+    role_family: str,
+    evidence_categories: Iterable[str],
+) -> List[str]:
+    """
+    resolve_determinant_tier for each evidence category of one row, in order.
+    """
+    table = _TIER_TABLES.get(_norm(role_family), _NO_TABLE)
+    return [table.get(_norm(ec), "tier_4") for ec in evidence_categories]
 
-    for tier, categories in family_rules.items():
-        for c in categories:
-            if ec == _norm(c):
-                return tier
 
-    return "tier_4"
+def resolve_cohort_tiers(
+    rows: Iterable[Tuple[str, Sequence[str]]],
+) -> List[List[str]]:
+    """
+    resolve_determinant_tiers for a cohort of (role_family, evidence_categories).
+    """
+    return [
+        resolve_determinant_tiers(role_family=rf, evidence_categories=evidence)
+        for rf, evidence in rows
+    ]
 
 
 def explain_tier(tier: str) -> Dict[str, str]:
@@ -236,5 +275,7 @@ __all__ = [
     "ROLE_DETERMINANT_CATEGORIES",
     "ANTI_INFLATION_RULES",
     "resolve_determinant_tier",
+    "resolve_determinant_tiers",
+    "resolve_cohort_tiers",
     "explain_tier",
 ]
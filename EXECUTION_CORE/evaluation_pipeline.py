@@ -5,13 +5,29 @@ EXECUTION_CORE/evaluation_pipeline.py
 DAY 10.5 — EVALUATION PIPELINE BINDING (AUTHORITATIVE)
 
 This is the single authoritative binding for Day 6 → Day 10 logic.
+
+COHORT
+- evaluate_cohort_pipeline(rows=..., density_results=...) evaluates a whole
+  cohort with results identical to evaluate_row_pipeline per row, kept as
+  columns (CohortEvaluation) instead of one dict per row:
+  - role family resolved once per distinct Role_Type
+  - determinant tiers resolved once per (role family, evidence set)
+  - compute_score run once per (density level, tiers, evidence count); the
+    score/verdict columns are filled from that table, so rounding and
+    verdict thresholds stay exactly compute_score's
+- CohortEvaluation.view(i) answers `key in` / `[key]` for row i without
+  building its dict; row(i) builds the evaluate_row_pipeline dict.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Mapping, List
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Tuple
 
-from EXECUTION_CORE.personal_artifact_evidence_summary import summarize_evidence
-from EXECUTION_CORE.determinant_tier_rules import resolve_determinant_tier
+from EXECUTION_CORE.personal_artifact_evidence_summary import (
+    extract_canonical_evidence,
+    summarize_evidence,
+)
+from EXECUTION_CORE.determinant_tier_rules import resolve_determinant_tiers
 from EXECUTION_CORE.scoring_adapter import compute_score
 from EXECUTION_CORE.csv_density_policy import resolve_role_family
 
@@ -32,13 +48,10 @@ def evaluate_row_pipeline(
     canonical_evidence: List[str] = evidence_summary["canonical_evidence"]
     evidence_count: int = evidence_summary["evidence_count"]
 
-    determinant_tiers: List[str] = [
-        resolve_determinant_tier(
-            role_family=role_family,
-            evidence_category=evidence,
-        )
-        for evidence in canonical_evidence
-    ]
+    determinant_tiers: List[str] = resolve_determinant_tiers(
+        role_family=role_family,
+        evidence_categories=canonical_evidence,
+    )
 
     score_result = compute_score(
         density_level=density_result["density_level"],
@@ -57,4 +70,108 @@ def evaluate_row_pipeline(
     }
 
 
-__all__ = ["evaluate_row_pipeline"]
+class CohortEvaluation:
+    """
+    Columnar evaluate_row_pipeline results, one entry per row in cohort order.
+    """
+
+    __slots__ = (
+        "role_family",
+        "density_level",
+        "canonical_evidence",
+        "determinant_tiers",
+        "final_score",
+        "verdict",
+        "score_components",
+    )
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, [])
+
+    def __len__(self) -> int:
+        return len(self.final_score)
+
+    def view(self, i: int) -> "_RowView":
+        return _RowView(self, i)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        out = {name: getattr(self, name)[i] for name in self.__slots__}
+        out["score_components"] = OrderedDict(out["score_components"])
+        return out
+
+
+class _RowView(Mapping):
+    """Read-only evaluation mapping for one cohort row, backed by the columns."""
+
+    __slots__ = ("_cohort", "_i")
+
+    def __init__(self, cohort: CohortEvaluation, i: int):
+        self._cohort = cohort
+        self._i = i
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in CohortEvaluation.__slots__:
+            raise KeyError(key)
+        return getattr(self._cohort, key)[self._i]
+
+    def __contains__(self, key: object) -> bool:
+        return key in CohortEvaluation.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(CohortEvaluation.__slots__)
+
+    def __len__(self) -> int:
+        return len(CohortEvaluation.__slots__)
+
+
+def evaluate_cohort_pipeline(
+    *,
+    rows: Sequence[Mapping[str, Any]],
+    density_results: Sequence[Mapping[str, Any]],
+) -> CohortEvaluation:
+    """
+    evaluate_row_pipeline over a cohort; density_results aligned with rows.
+    """
+    out = CohortEvaluation()
+    families: Dict[Any, str] = {}
+    tiers_memo: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+    score_memo: Dict[Tuple[Any, Tuple[str, ...], int], Dict[str, Any]] = {}
+
+    for row, density_result in zip(rows, density_results):
+        role_type = row.get("Role_Type", "")
+        role_family = families.get(role_type)
+        if role_family is None:
+            role_family = families[role_type] = resolve_role_family(role_type)
+
+        canonical_evidence = extract_canonical_evidence(row=row)
+        evidence_key = (role_family, tuple(canonical_evidence))
+        tiers = tiers_memo.get(evidence_key)
+        if tiers is None:
+            tiers = tiers_memo[evidence_key] = resolve_determinant_tiers(
+                role_family=role_family,
+                evidence_categories=canonical_evidence,
+            )
+
+        density_level = density_result["density_level"]
+        score_key = (density_level, tuple(tiers), len(canonical_evidence))
+        score_result = score_memo.get(score_key)
+        if score_result is None:
+            score_result = score_memo[score_key] = compute_score(
+                density_level=density_level,
+                determinant_tiers=tiers,
+                evidence_count=len(canonical_evidence),
+            )
+
+        out.role_family.append(role_family)
+        out.density_level.append(density_level)
+        out.canonical_evidence.append(canonical_evidence)
+        out.determinant_tiers.append(list(tiers))
+        out.final_score.append(score_result["score"])
+        out.verdict.append(score_result["verdict"])
+        out.score_components.append(score_result["components"])
+
+    return out
+
+
+__all__ = ["CohortEvaluation", "evaluate_cohort_pipeline", "evaluate_row_pipeline"]
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+extraction_cache.py
+
+Content-Hash Cache for HTML Extraction Results
+Author: L. David Mendoza © 2026
+
+Purpose:
+- Skip re-parsing pages whose body has not changed. The scrapers run their
+  regex extractors over every fetched page on every run; shared lab pages,
+  org pages and unchanged personal sites are parsed again and again.
+- Results are keyed by sha256(body) + extractor name + extractor version
+  (+ a context string, e.g. the base URL, when the output depends on it).
+  Bumping an extractor's version invalidates its entries; nothing else can
+  make a cached result wrong, so there is no TTL.
+
+Consumers:
+- EXECUTION_CORE/deep_personal_artifact_scrape.py  (per-page title/h1/emails/links)
+  (deep_artifact_harvester.py and people_discovery_from_hubs.py stream pages
+  through EXECUTION_CORE/html_stream.py and parse them while reading instead)
+
+Storage:
+- In-process LRU (MEMORY_ENTRIES) in front of a persistent ArtifactCacheStore
+  (EXECUTION_CORE/personal_artifact_cache.py) at outputs/extraction_cache.sqlite3:
+  WAL, zlib JSON values, size-bounded LRU eviction, no expiry
+- Values must be JSON-compatible; callers rebuild their own objects from them
+- AI_TALENT_EXTRACTION_CACHE=0 disables the cache (extractors always run)
+
+    python3 EXECUTION_CORE/extraction_cache.py stats
+
+No scraping, no mutation.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+try:
+    from EXECUTION_CORE.personal_artifact_cache import ArtifactCacheStore
+except ImportError:  # imported as a top-level module from EXECUTION_CORE/
+    from personal_artifact_cache import ArtifactCacheStore
+
+EXTRACTION_CACHE_DB = "outputs/extraction_cache.sqlite3"
+ENABLE_ENV = "AI_TALENT_EXTRACTION_CACHE"
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+MEMORY_ENTRIES = 2048
+
+_MISSING = object()
+
+
+def body_hash(body):
+    if isinstance(body, str):
+        body = body.encode("utf-8", errors="surrogatepass")
+    return hashlib.sha256(body or b"").hexdigest()
+
+
+def extraction_key(extractor, version, body, context=""):
+    ctx = hashlib.sha256(context.encode("utf-8")).hexdigest()[:16] if context else "-"
+    return f"{extractor}@{version}:{ctx}:{body_hash(body)}"
+
+
+class ExtractionCache:
+    """
+    (extractor, version, context, body) -> extraction result.
+    memoize() returns (value, hit) so callers can keep their own per-crawl counts.
+    """
+
+    def __init__(self, db_path=EXTRACTION_CACHE_DB, max_bytes=DEFAULT_MAX_BYTES, memory_entries=MEMORY_ENTRIES):
+        self.store = ArtifactCacheStore(db_path=db_path, ttl_seconds=0, max_bytes=max_bytes)
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "memory_hits": 0, "misses": 0}
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def memoize(self, extractor, version, body, fn, context=""):
+        key = extraction_key(extractor, version, body, context)
+        with self._lock:
+            value = self._memory.get(key, _MISSING)
+            if value is not _MISSING:
+                self._memory.move_to_end(key)
+        if value is not _MISSING:
+            self._count("hits")
+            self._count("memory_hits")
+            return value, True
+
+        cached = self.store.get(key)
+        if cached is not None:
+            value = cached["v"]
+            self._remember(key, value)
+            self._count("hits")
+            return value, True
+
+        value = fn()
+        self.store.put(key, {"v": value})
+        self._remember(key, value)
+        self._count("misses")
+        return value, False
+
+    def summary(self):
+        with self._lock:
+            out = dict(self.stats)
+        total = out["hits"] + out["misses"]
+        out["hit_rate"] = round(out["hits"] / total, 4) if total else 0.0
+        out["store"] = self.store.summary()
+        return out
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def cache_enabled():
+    return (os.environ.get(ENABLE_ENV) or "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def get_cache():
+    """Process-wide cache, or None when disabled via AI_TALENT_EXTRACTION_CACHE=0."""
+    global _CACHE
+    if not cache_enabled():
+        return None
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = ExtractionCache()
+    return _CACHE
+
+
+def memoize(extractor, version, body, fn, context=""):
+    """Module-level convenience: (value, hit). Falls through to fn() when disabled."""
+    cache = get_cache()
+    if cache is None:
+        return fn(), False
+    return cache.memoize(extractor, version, body, fn, context=context)
+
+
+def format_hit_rate(hits, misses):
+    total = hits + misses
+    pct = (100.0 * hits / total) if total else 0.0
+    return f"{hits}/{total} hits ({pct:.1f}%)"
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    if cmd != "stats":
+        sys.exit(f"unknown command: {cmd}")
+    print(json.dumps(ArtifactCacheStore(db_path=EXTRACTION_CACHE_DB, ttl_seconds=0).summary(), indent=2))
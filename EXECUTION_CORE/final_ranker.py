@@ -5,18 +5,25 @@ DAY 18 — FINAL RANKER
 Stable, deterministic ranking.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Sequence
 
 
 def rank_candidates(evaluations: List[Dict[str, object]]) -> List[Dict[str, object]]:
     """
     Rank candidates by final_score descending.
     """
+    return [evaluations[i] for i in rank_order([e["final_score"] for e in evaluations])]
+
+
+def rank_order(scores: Sequence[float]) -> List[int]:
+    """
+    Row indices by score descending; ties keep cohort order (stable, as rank_candidates).
+    """
     return sorted(
-        evaluations,
-        key=lambda e: e["final_score"],
+        range(len(scores)),
+        key=scores.__getitem__,
         reverse=True,
     )
 
 
-__all__ = ["rank_candidates"]
+__all__ = ["rank_candidates", "rank_order"]
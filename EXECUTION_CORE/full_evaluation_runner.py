@@ -8,48 +8,61 @@ PURPOSE
 - Execute Days 6–13 in correct order
 - Use per-role density when available
 - Produce final evaluated outputs deterministically
+
+COHORT
+- Density is resolved once per distinct Role_Type (it depends on nothing
+  else), then the cohort is scored in one evaluate_cohort_pipeline pass.
+- run_ranked_evaluation adds the cohort context and ranking computed from the
+  score column (analyze_cohort_scores / rank_order); the ranked list holds the
+  same narrative objects, not copies.
 """
 
-from typing import List, Dict
+from collections import OrderedDict
+from typing import Any, List, Dict
 
 from EXECUTION_CORE.aggregate_signal_views import aggregate_signal_views
 from EXECUTION_CORE.csv_density_policy import classify_density, resolve_role_family
-from EXECUTION_CORE.evaluation_pipeline import evaluate_row_pipeline
+from EXECUTION_CORE.evaluation_pipeline import CohortEvaluation, evaluate_cohort_pipeline
 from EXECUTION_CORE.demo_narrative_sequence import sequence_narrative
 from EXECUTION_CORE.evaluation_qc_validator import validate_evaluation
+from EXECUTION_CORE.cohort_context_analyzer import analyze_cohort_scores
+from EXECUTION_CORE.final_ranker import rank_order
 
 
-def run_full_evaluation(rows: List[Dict[str, object]]) -> List[Dict[str, object]]:
+def evaluate_cohort(rows: List[Dict[str, object]]) -> CohortEvaluation:
     """
-    Execute full evaluation pipeline over rows.
+    Columnar evaluation of rows (per-role density when available).
     """
-    results = []
-
     agg = aggregate_signal_views(rows)
     density_global = agg["density_inputs"]["global"]
     density_by_role = agg["density_inputs"].get("by_role", {})
 
+    density_by_type: Dict[Any, Dict[str, object]] = {}
+    density_results = []
+
     for row in rows:
         role_type = row.get("Role_Type", "")
-        role_family = resolve_role_family(role_type)
+        density_result = density_by_type.get(role_type)
+        if density_result is None:
+            role_density = density_by_role.get(role_type, density_global)
+            density_result = density_by_type[role_type] = classify_density(
+                role_family=resolve_role_family(role_type),
+                nonempty_fields_avg=role_density["nonempty_fields_avg"],
+                signal_fields_nonempty_avg=role_density["signal_fields_nonempty_avg"],
+                evidence_fields_nonempty_avg=role_density["evidence_fields_nonempty_avg"],
+            )
+        density_results.append(density_result)
 
-        role_density = density_by_role.get(role_type, density_global)
+    return evaluate_cohort_pipeline(rows=rows, density_results=density_results)
 
-        density_result = classify_density(
-            role_family=role_family,
-            nonempty_fields_avg=role_density["nonempty_fields_avg"],
-            signal_fields_nonempty_avg=role_density["signal_fields_nonempty_avg"],
-            evidence_fields_nonempty_avg=role_density["evidence_fields_nonempty_avg"],
-        )
 
-        evaluation = evaluate_row_pipeline(
-            row=row,
-            density_result=density_result,
-        )
+def _narratives(cohort: CohortEvaluation) -> List[Dict[str, object]]:
+    results = []
 
+    for i in range(len(cohort)):
         narrative = sequence_narrative(
-            role_family=role_family,
-            evaluation=evaluation,
+            role_family=cohort.role_family[i],
+            evaluation=cohort.view(i),
         )
 
         validate_evaluation(narrative)
@@ -58,4 +71,25 @@ def run_full_evaluation(rows: List[Dict[str, object]]) -> List[Dict[str, object]
     return results
 
 
-__all__ = ["run_full_evaluation"]
+def run_full_evaluation(rows: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """
+    Execute full evaluation pipeline over rows.
+    """
+    return _narratives(evaluate_cohort(rows))
+
+
+def run_ranked_evaluation(rows: List[Dict[str, object]]) -> Dict[str, object]:
+    """
+    run_full_evaluation plus cohort context and final ranking.
+    """
+    cohort = evaluate_cohort(rows)
+    results = _narratives(cohort)
+
+    return OrderedDict(
+        evaluations=results,
+        cohort_context=analyze_cohort_scores(cohort.final_score),
+        ranked=[results[i] for i in rank_order(cohort.final_score)],
+    )
+
+
+__all__ = ["evaluate_cohort", "run_full_evaluation", "run_ranked_evaluation"]
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+EXECUTION_CORE/html_stream.py
+============================================================
+STREAMING HTML TOKENIZER (LINKS, TITLE, H1, VISIBLE TEXT)
+
+Maintainer: L. David Mendoza © 2026
+Version: v1.0.1
+
+Purpose
+- The scrapers materialized whole response bodies (multi-MB faculty and team
+  pages) and ran several regexes across each one. HtmlStream consumes a page
+  chunk by chunk instead, tokenizes it once (text / tag / comment / raw text
+  of script and style) and keeps only what the caller asked for:
+    links  attribute values of link_attrs (default: href), entity-decoded,
+           document order
+    urls   bare http(s) URLs in raw tag text and in text, script/style included
+           (same URL_RE as the hub scraper), when urls=True
+    title  first <title> element, h1 first <h1> element: inner tags -> " ",
+           entities decoded, whitespace collapsed (None when absent/empty)
+    text   visible text (script/style/comments dropped, tags -> " ",
+           whitespace collapsed, not entity-decoded), when text=True
+- max_links caps links + urls. Without text, feed() returns False once the cap
+  is reached and callers stop reading the response there, which is the point on
+  large pages. With text=True the cap only stops link/url collection: the rest
+  of the page is still read for text (contacts sit in footers).
+
+Memory
+- Between feeds only an unfinished construct is held: one tag (<= MAX_TAG_CHARS,
+  else its "<" is read as text), a text run up to its last whitespace, or the
+  last few chars of script/style raw text. Chunk boundaries never change results.
+
+Contract
+- HtmlStream(...).feed(chunk) -> bool, .close() -> HtmlStream
+- parse_html(page, **opts) -> HtmlStream
+- feed_chunks(stream, chunks) -> HtmlStream
+- decode_chunks(byte_chunks, encoding) -> Iterator[str]
+
+Rules
+- Deterministic. Import-only. Stdlib only. No IO.
+
+Validation
+python3 -m py_compile EXECUTION_CORE/html_stream.py
+"""
+
+from __future__ import annotations
+
+import codecs
+import html
+import re
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+CHUNK_BYTES = 65536
+MAX_TAG_CHARS = 65536
+TEXT_FLUSH_CHARS = 65536
+
+RAW_TEXT_TAGS = ("script", "style")
+CAPTURE_TAGS = ("title", "h1")
+
+URL_RE = re.compile(r"https?://[^\s\"'<>]+", re.IGNORECASE)
+
+# Quote-aware tag: a ">" inside a quoted attribute value does not end the tag.
+_TAG_RE = re.compile(r"""<(/?)([A-Za-z][^\s/>]*)((?:[^>"']|"[^"]*"|'[^']*')*)>""")
+_TAG_START_RE = re.compile(r"</?(?:[A-Za-z]|\Z)")
+_ATTR_RE = re.compile(r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+_RAW_END_RE = {t: re.compile(r"</" + t + r"(?=[\s/>]|$)", re.IGNORECASE) for t in RAW_TEXT_TAGS}
+_LAST_WS_RE = re.compile(r"\s(?=\S*\Z)")
+_WS_RE = re.compile(r"\s+")
+
+
+def _collapse(parts: Sequence[str]) -> str:
+    return _WS_RE.sub(" ", "".join(parts)).strip()
+
+
+class HtmlStream:
+    """
+    Incremental tokenizer; see module docstring for what it collects.
+    """
+
+    def __init__(
+        self,
+        link_attrs: Sequence[str] = ("href",),
+        urls: bool = False,
+        text: bool = False,
+        max_links: Optional[int] = None,
+    ):
+        self.link_attrs = frozenset(a.lower() for a in link_attrs)
+        self.want_urls = urls
+        self.want_text = text
+        self.max_links = max_links if max_links and max_links > 0 else None
+
+        self.links: List[str] = []
+        self.urls: List[str] = []
+        self.title: Optional[str] = None
+        self.h1: Optional[str] = None
+        self.capped = False
+        self.done = False
+        self.chars_fed = 0
+
+        self._buf = ""
+        self._raw: Optional[str] = None  # open script/style element
+        self._capture: Optional[str] = None  # open title/h1 element
+        self._capture_parts: List[str] = []
+        self._captured: set = set()
+        self._text_parts: List[str] = []
+
+    # --- public ----------------------------------------------------------
+
+    def feed(self, chunk: str) -> bool:
+        """Consume the next chunk; False once the stream needs no more input."""
+        if self.done or not chunk:
+            return not self.done
+        self.chars_fed += len(chunk)
+        self._buf += chunk
+        self._run(final=False)
+        return not self.done
+
+    def close(self) -> "HtmlStream":
+        if not self.done:
+            self._run(final=True)
+            self.done = True
+        self._buf = ""
+        return self
+
+    @property
+    def text(self) -> str:
+        return _collapse(self._text_parts)
+
+    # --- tokenizer -------------------------------------------------------
+
+    def _run(self, final: bool) -> None:
+        buf = self._buf
+        n = len(buf)
+        i = 0
+        while i < n and not self.done:
+            if self._raw is not None:
+                m = _RAW_END_RE[self._raw].search(buf, i)
+                if m is None:
+                    # keep a possible partial "</script" and the word it may split
+                    stop = n if final else self._text_cut(buf, i, n - len(self._raw) - 2)
+                    if stop > i:
+                        self._raw_text(buf[i:stop])
+                    i = stop
+                    break
+                self._raw_text(buf[i:m.start()])
+                self._raw = None
+                i = m.start()
+                continue
+
+            j = buf.find("<", i)
+            if j < 0:
+                stop = n if final else self._text_cut(buf, i, n)
+                if stop > i:
+                    self._text(buf[i:stop])
+                i = stop
+                break
+            if j > i:
+                self._text(buf[i:j])
+                i = j
+                if self.done:
+                    break
+
+            nxt = buf[j + 1:j + 2]
+            if nxt == "!" or nxt == "?":
+                if buf.startswith("<!--", j):
+                    k = buf.find("-->", j + 4)
+                    end = k + 3
+                elif not final and n - j < 4 and "<!--".startswith(buf[j:]):
+                    break
+                else:
+                    k = buf.find(">", j + 2)
+                    end = k + 1
+                if k < 0:
+                    if final or n - j > MAX_TAG_CHARS:
+                        i = n  # unterminated comment/declaration swallows the rest
+                        continue
+                    break
+                self._boundary()
+                i = end
+                continue
+
+            m = _TAG_RE.match(buf, j)
+            if m is not None:
+                self._tag(m.group(1) == "/", m.group(2).lower(), m.group(3))
+                i = m.end()
+                continue
+            if not nxt:
+                if final:
+                    self._text("<")
+                    i = n
+                break
+            if not final and n - j <= MAX_TAG_CHARS and _TAG_START_RE.match(buf, j):
+                break  # tag not complete yet
+            self._text("<")
+            i = j + 1
+
+        self._buf = buf[i:]
+
+    @staticmethod
+    def _text_cut(buf: str, start: int, limit: int) -> int:
+        """
+        Where to split unfinished text: after its last whitespace (URLs and words
+        never span whitespace), and only once it is long enough to matter.
+        """
+        if limit - start < TEXT_FLUSH_CHARS:
+            return start
+        m = _LAST_WS_RE.search(buf, start, limit)
+        return m.end() if m else limit
+
+    # --- events ----------------------------------------------------------
+
+    def _text(self, s: str) -> None:
+        if self._capture is not None:
+            self._capture_parts.append(s)
+        if self.want_text:
+            self._text_parts.append(s)
+        if self.want_urls:
+            self._scan_urls(s)
+
+    def _raw_text(self, s: str) -> None:
+        if self.want_urls:
+            self._scan_urls(s)
+
+    def _boundary(self) -> None:
+        if self._capture is not None:
+            self._capture_parts.append(" ")
+        if self.want_text:
+            self._text_parts.append(" ")
+
+    def _tag(self, closing: bool, name: str, attrs: str) -> None:
+        self._boundary()
+
+        if closing:
+            if self._capture == name:
+                value = _WS_RE.sub(" ", html.unescape("".join(self._capture_parts))).strip() or None
+                setattr(self, name, value)
+                self._capture = None
+                self._capture_parts = []
+            return
+
+        if name in CAPTURE_TAGS and self._capture is None and name not in self._captured:
+            self._captured.add(name)
+            self._capture = name
+            self._capture_parts = []
+
+        if attrs and not self.capped:
+            if self.want_urls:
+                self._scan_urls(attrs)
+            if "=" in attrs and self.link_attrs and not self.capped:
+                for m in _ATTR_RE.finditer(attrs):
+                    if m.group(1).lower() not in self.link_attrs:
+                        continue
+                    value = m.group(2)
+                    if value is None:
+                        value = m.group(3) if m.group(3) is not None else m.group(4)
+                    if value is None:
+                        continue
+                    self.links.append(html.unescape(value))
+                    self._check_cap()
+                    if self.capped:
+                        break
+
+        if name in RAW_TEXT_TAGS and not attrs.rstrip().endswith("/"):
+            self._raw = name
+
+    def _scan_urls(self, s: str) -> None:
+        if self.capped or "://" not in s:
+            return
+        found = URL_RE.findall(s)
+        if self.max_links is not None:
+            del found[max(0, self.max_links - len(self.links) - len(self.urls)):]
+        self.urls.extend(found)
+        self._check_cap()
+
+    def _check_cap(self) -> None:
+        if self.max_links is not None and len(self.links) + len(self.urls) >= self.max_links:
+            self.capped = True
+            self.done = not self.want_text
+
+
+# ------------------------------------------------------------
+# Feeding helpers
+# ------------------------------------------------------------
+
+def feed_chunks(stream: HtmlStream, chunks: Iterable[str]) -> HtmlStream:
+    """Feed until the chunks run out or the stream is done (link cap), then close."""
+    for chunk in chunks:
+        if not stream.feed(chunk):
+            break
+    return stream.close()
+
+
+def parse_html(page: str, **opts) -> HtmlStream:
+    """HtmlStream over a page already in memory."""
+    return feed_chunks(HtmlStream(**opts), [page or ""])
+
+
+def decode_chunks(byte_chunks: Iterable[bytes], encoding: Optional[str] = None) -> Iterator[str]:
+    """Incremental decode (errors replaced); unknown encodings fall back to utf-8."""
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for b in byte_chunks:
+        if b:
+            yield decoder.decode(b)
+    yield decoder.decode(b"", final=True)
+
+
+__all__ = [
+    "CHUNK_BYTES",
+    "HtmlStream",
+    "URL_RE",
+    "decode_chunks",
+    "feed_chunks",
+    "parse_html",
+]
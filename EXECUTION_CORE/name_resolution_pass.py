@@ -12,6 +12,13 @@ Contract:
 - clean_name(str) -> str
 - run_name_resolution_pass(rows) -> rows
 - process_csv(input_csv, output_csv) -> None
+
+Cross-run cache (process_csv only):
+- Resolved name/contact fields are stored per GitHub_Username in
+  EXECUTION_CORE/person_enrichment_cache.py (field "name_contact")
+- Blank fields are filled from a fresh cache entry AFTER this run's own
+  resolution, never overwriting; provenance records the cached origin
+- Field_Level_Provenance_JSON goes through EXECUTION_CORE/provenance.py
 """
 
 from __future__ import annotations
@@ -20,8 +27,12 @@ import csv
 import re
 from typing import Dict, List
 
+from EXECUTION_CORE.person_enrichment_cache import get_cache
+from EXECUTION_CORE.provenance import Provenance, memo_clear
 from EXECUTION_CORE.public_identity_contact_pass import enrich_rows_public_identity_contact
 
+CACHED_CONTACT_FIELDS = ["Full_Name", "First_Name", "Last_Name", "Primary_Email", "Primary_Phone"]
+
 
 # ---------------------------------------------------------------------
 # Public API: clean_name (regression requirement)
@@ -50,6 +61,48 @@ def run_name_resolution_pass(
     return enrich_rows_public_identity_contact(rows)
 
 
+# ---------------------------------------------------------------------
+# Cross-run cache (non-overwrite)
+# ---------------------------------------------------------------------
+def _prov_of(row: Dict[str, str]) -> Provenance:
+    return Provenance.of_row(row)
+
+
+def apply_name_contact_cache(rows: List[Dict[str, str]], cache) -> List[Dict[str, str]]:
+    for row in rows:
+        login = clean_name(row.get("GitHub_Username")).lower()
+        if not login:
+            continue
+        prov = _prov_of(row)
+
+        hit = cache.get("name_contact", login=login)
+        cached = dict(hit["value"] or {}) if hit is not None else {}
+
+        filled = False
+        for k, entry in cached.items():
+            if k in CACHED_CONTACT_FIELDS and not clean_name(row.get(k)) and entry.get("value"):
+                row[k] = entry["value"]
+                prov[k] = {
+                    "source": "person_enrichment_cache",
+                    "method": f"cached:{entry.get('source', '')}:{entry.get('method', '')}",
+                }
+                filled = True
+        if filled:
+            prov.save(row)
+
+        # Record values resolved by this run that the cache does not hold yet
+        added = False
+        for k in CACHED_CONTACT_FIELDS:
+            v = clean_name(row.get(k))
+            if v and k not in cached:
+                p = prov.get(k) if isinstance(prov.get(k), dict) else {}
+                cached[k] = {"value": v, "source": p.get("source", "row"), "method": p.get("method", "")}
+                added = True
+        if added:
+            cache.put("name_contact", cached, "name_resolution_pass", login=login)
+    return rows
+
+
 # ---------------------------------------------------------------------
 # File-based pipeline adapter (NOT used by regression tests)
 # ---------------------------------------------------------------------
@@ -75,12 +128,18 @@ def process_csv(input_csv: str, output_csv: str) -> None:
 
     rows = run_name_resolution_pass(rows)
 
+    cache = get_cache()
+    if cache is not None:
+        rows = apply_name_contact_cache(rows, cache)
+
     with open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for r in rows:
             writer.writerow({k: r.get(k, "") for k in fieldnames})
 
+    memo_clear()
+
 
 __all__ = [
     "clean_name",
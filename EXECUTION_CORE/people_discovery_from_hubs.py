@@ -6,7 +6,7 @@ EXECUTION_CORE/people_discovery_from_hubs.py
 PEOPLE DISCOVERY FROM HUBS (ADAPTER-FIRST + CONTRIBUTORS FALLBACK + WEB FALLBACK)
 
 Maintainer: L. David Mendoza © 2026
-Version: v1.2.0
+Version: v1.5.0
 
 Purpose
 - Convert hub/org anchor output into candidate PEOPLE rows.
@@ -24,6 +24,18 @@ Non-negotiable
 - Public sources only
 - Deterministic ordering + de-dupe
 - Fail-closed if total discovered people = 0
+
+Changelog
+- v1.5.0: Hub pages are streamed through EXECUTION_CORE/html_stream.py (HtmlStream)
+  instead of being read whole and regex-scanned: hrefs come from tag attributes
+  (entity-decoded), bare URLs from tag and text content, and reading stops at
+  MAX_LINKS_PER_PAGE. Pages are tokenized while they are read, so the body-hash
+  memo of v1.3.0 no longer applies to fetched pages and is dropped.
+- v1.4.0: _to_absolute / _classify_person_url delegate to the shared memoized
+  URL engine (EXECUTION_CORE/url_canon.py); same results.
+- v1.3.0: Raw link extraction (hrefs + bare URLs) memoized by body hash +
+  LINK_EXTRACTOR_VERSION (EXECUTION_CORE/extraction_cache.py); unchanged hub
+  pages skip parsing.
 """
 
 from __future__ import annotations
@@ -35,24 +47,17 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 import requests
 
 from EXECUTION_CORE.github_org_people_adapter import discover_people_from_hub_rows
 from EXECUTION_CORE.github_org_repo_contributors_adapter import discover_contributors_from_hub_rows
+from EXECUTION_CORE.html_stream import CHUNK_BYTES, HtmlStream, decode_chunks, feed_chunks
+from EXECUTION_CORE.url_canon import absolute_http, is_github_repo, person_url
 
 
 URL_RE = re.compile(r"https?://[^\s\"'<>]+", re.IGNORECASE)
-HREF_RE = re.compile(r'href=[\'"]([^\'"]+)[\'"]', re.IGNORECASE)
-
-GITHUB_USER_RE = re.compile(r"^https?://(www\.)?github\.com/([^/\s?#]+)(?:[/?#].*)?$", re.IGNORECASE)
-GITHUB_REPO_RE = re.compile(r"^https?://(www\.)?github\.com/[^/\s?#]+/[^/\s?#]+(?:[/?#].*)?$", re.IGNORECASE)
-
-LINKEDIN_IN_RE = re.compile(r"^https?://(www\.)?linkedin\.com/in/([^/?#]+)(?:[/?#].*)?$", re.IGNORECASE)
-SCHOLAR_USER_RE = re.compile(r"^https?://(www\.)?scholar\.google\.com/citations\?(?:[^#]*&)?user=([^&#]+)", re.IGNORECASE)
-SEMANTIC_AUTHOR_RE = re.compile(r"^https?://(www\.)?semanticscholar\.org/author/([^/?#]+)", re.IGNORECASE)
-ORCID_RE = re.compile(r"^https?://(www\.)?orcid\.org/(\d{4}-\d{4}-\d{4}-\d{3}[\dX])", re.IGNORECASE)
 
 TEAM_HINT_RE = re.compile(r"(team|people|researchers|staff|about|leadership|members|faculty|lab|group)", re.IGNORECASE)
 
@@ -63,6 +68,7 @@ GITHUB_IGNORE = {
 
 MAX_HUBS = 25
 MAX_PAGES_PER_HUB = 6
+MAX_LINKS_PER_PAGE = 5000
 REQUEST_TIMEOUT_S = 10
 SLEEP_BETWEEN_REQUESTS_S = 0.15
 
@@ -90,20 +96,12 @@ def _extract_urls_from_text(text: str) -> List[str]:
     return _stable_dedupe(URL_RE.findall(text or ""))
 
 
-def _extract_hrefs(html: str) -> List[str]:
-    return _stable_dedupe(HREF_RE.findall(html or ""))
+def _raw_links(page: HtmlStream) -> List[str]:
+    return _stable_dedupe(page.links) + _stable_dedupe(page.urls)
 
 
 def _to_absolute(base_url: str, maybe_url: str) -> Optional[str]:
-    u = (maybe_url or "").strip()
-    if not u:
-        return None
-    if u.startswith("#") or u.lower().startswith("mailto:") or u.lower().startswith("javascript:"):
-        return None
-    absu = urljoin(base_url, u)
-    if not absu.lower().startswith(("http://", "https://")):
-        return None
-    return absu
+    return absolute_http(base_url, maybe_url)
 
 
 def _same_domain(a: str, b: str) -> bool:
@@ -116,36 +114,14 @@ def _same_domain(a: str, b: str) -> bool:
 
 
 def _is_github_repo(url: str) -> bool:
-    return bool(GITHUB_REPO_RE.match(url or ""))
+    return is_github_repo(url)
 
 
 def _classify_person_url(url: str) -> Tuple[str, str]:
-    u = (url or "").strip()
-
-    m = LINKEDIN_IN_RE.match(u)
-    if m:
-        return ("linkedin", m.group(2).strip())
-
-    m = ORCID_RE.match(u)
-    if m:
-        return ("orcid", m.group(2).strip())
-
-    m = SCHOLAR_USER_RE.match(u)
-    if m:
-        return ("scholar", m.group(2).strip())
-
-    m = SEMANTIC_AUTHOR_RE.match(u)
-    if m:
-        return ("semantic_scholar", m.group(2).strip())
-
-    m = GITHUB_USER_RE.match(u)
-    if m and not _is_github_repo(u):
-        handle = m.group(2).strip()
-        if handle.lower() in GITHUB_IGNORE:
-            return ("unknown", "")
-        return ("github", handle)
-
-    return ("unknown", "")
+    kind, hid = person_url(url)
+    if kind == "github" and hid.lower() in GITHUB_IGNORE:
+        return ("unknown", "")
+    return (kind, hid)
 
 
 def _candidate_internal_pages(base_url: str, abs_links: List[str]) -> List[str]:
@@ -182,14 +158,22 @@ class DiscoveryRow:
     provenance: Dict[str, Any]
 
 
-def _fetch(url: str) -> str:
+def _fetch_links(url: str) -> List[str]:
+    """
+    Raw links (hrefs, then bare URLs) of url, streamed: the body is never held
+    whole and reading stops once MAX_LINKS_PER_PAGE links are found.
+    """
     headers = {
         "User-Agent": "AI-Talent-Engine/1.0 (public research; contact: none)",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
-    r = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT_S)
-    r.raise_for_status()
-    return r.text or ""
+    with requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT_S, stream=True) as r:
+        r.raise_for_status()
+        page = feed_chunks(
+            HtmlStream(urls=True, max_links=MAX_LINKS_PER_PAGE),
+            decode_chunks(r.iter_content(CHUNK_BYTES), r.encoding),
+        )
+    return _raw_links(page)
 
 
 def process_csv(input_csv: str | Path, output_csv: str | Path) -> None:
@@ -312,13 +296,12 @@ def process_csv(input_csv: str | Path, output_csv: str | Path) -> None:
         pages_fetched = 0
 
         try:
-            html = _fetch(hub_url)
+            raw_links = _fetch_links(hub_url)
             pages_fetched += 1
             time.sleep(SLEEP_BETWEEN_REQUESTS_S)
         except Exception:
             continue
 
-        raw_links = _extract_hrefs(html) + _extract_urls_from_text(html)
         abs_links: List[str] = []
         for l in raw_links:
             a = _to_absolute(hub_url, l)
@@ -349,13 +332,12 @@ def process_csv(input_csv: str | Path, output_csv: str | Path) -> None:
             if pages_fetched >= MAX_PAGES_PER_HUB:
                 break
             try:
-                html2 = _fetch(page_url)
+                raw2 = _fetch_links(page_url)
                 pages_fetched += 1
                 time.sleep(SLEEP_BETWEEN_REQUESTS_S)
             except Exception:
                 continue
 
-            raw2 = _extract_hrefs(html2) + _extract_urls_from_text(html2)
             abs2: List[str] = []
             for l in raw2:
                 a = _to_absolute(page_url, l)
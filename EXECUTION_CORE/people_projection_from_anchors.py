@@ -6,7 +6,7 @@ EXECUTION_CORE/people_projection_from_anchors.py
 PEOPLE PROJECTION FROM ANCHORS (DETERMINISTIC, FAIL-CLOSED)
 
 Maintainer: L. David Mendoza © 2026
-Version: v1.0.0
+Version: v1.1.1
 
 Purpose
 - Convert anchor-exhaustion output into candidate PERSON rows.
@@ -23,6 +23,12 @@ Non-negotiable rules
 - Deterministic output: stable sort + stable de-duplication.
 - Fail-closed if no candidate people are found (prevents "garbage empty runs").
 
+Changelog
+- v1.1.1: Field_Level_Provenance_JSON handled through EXECUTION_CORE/provenance.py
+  (no re-parse of cells the previous stage wrote; byte-identical JSON).
+- v1.1.0: _classify_person_url delegates to the shared memoized URL engine
+  (EXECUTION_CORE/url_canon.py: person_url); same results.
+
 Contract
 - process_csv(input_csv, output_csv) -> None
 
@@ -38,47 +44,33 @@ git push
 from __future__ import annotations
 
 import csv
-import json
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from EXECUTION_CORE.provenance import Provenance, memo_clear
+from EXECUTION_CORE.url_canon import is_github_repo, person_url
 
 URL_RE = re.compile(r"https?://[^\s\"'<>]+", re.IGNORECASE)
 
-GITHUB_USER_RE = re.compile(r"https?://(www\.)?github\.com/([^/\s?#]+)(?:[/?#].*)?$", re.IGNORECASE)
-GITHUB_REPO_RE = re.compile(r"https?://(www\.)?github\.com/[^/\s?#]+/[^/\s?#]+(?:[/?#].*)?$", re.IGNORECASE)
-
-LINKEDIN_IN_RE = re.compile(r"https?://(www\.)?linkedin\.com/in/([^/?#]+)(?:[/?#].*)?$", re.IGNORECASE)
-
-SCHOLAR_USER_RE = re.compile(r"https?://(www\.)?scholar\.google\.com/citations\?(?:[^#]*&)?user=([^&#]+)", re.IGNORECASE)
-
-SEMANTIC_AUTHOR_RE = re.compile(r"https?://(www\.)?semanticscholar\.org/author/([^/?#]+)", re.IGNORECASE)
-
-ORCID_RE = re.compile(r"https?://(www\.)?orcid\.org/(\d{4}-\d{4}-\d{4}-\d{3}[\dX])", re.IGNORECASE)
+# GitHub paths that are not user profiles
+GITHUB_IGNORE = {"topics", "orgs", "organizations", "site", "features", "pricing", "about"}
 
 
 def _norm(x: Any) -> str:
     return str(x or "").strip()
 
 
-def _load_prov(row: Dict[str, str]) -> Dict[str, Any]:
-    raw = _norm(row.get("Field_Level_Provenance_JSON"))
-    if not raw:
-        return {}
-    try:
-        obj = json.loads(raw)
-        return obj if isinstance(obj, dict) else {}
-    except Exception:
-        return {}
+def _load_prov(row: Dict[str, str]) -> Provenance:
+    return Provenance.of_row(row)
 
 
-def _save_prov(row: Dict[str, str], prov: Dict[str, Any]) -> None:
-    row["Field_Level_Provenance_JSON"] = json.dumps(prov, sort_keys=True)
+def _save_prov(row: Dict[str, str], prov: Provenance) -> None:
+    prov.save(row)
 
 
-def _set_prov(prov: Dict[str, Any], field: str, source: str, method: str) -> None:
-    prov[field] = {"source": source, "method": method}
+def _set_prov(prov: Provenance, field: str, source: str, method: str) -> None:
+    prov.set(field, source, method)
 
 
 def _extract_urls_from_row(row: Dict[str, str]) -> List[str]:
@@ -100,7 +92,7 @@ def _extract_urls_from_row(row: Dict[str, str]) -> List[str]:
 
 
 def _is_github_repo(url: str) -> bool:
-    return bool(GITHUB_REPO_RE.match(url or ""))
+    return is_github_repo(url)
 
 
 def _classify_person_url(url: str) -> Tuple[str, str]:
@@ -108,32 +100,11 @@ def _classify_person_url(url: str) -> Tuple[str, str]:
     Returns: (kind, handle_or_id)
     kind in: github, linkedin, scholar, semantic_scholar, orcid, unknown
     """
-    u = (url or "").strip()
-
-    m = LINKEDIN_IN_RE.match(u)
-    if m:
-        return ("linkedin", m.group(2).strip())
-
-    m = ORCID_RE.match(u)
-    if m:
-        return ("orcid", m.group(2).strip())
-
-    m = SCHOLAR_USER_RE.match(u)
-    if m:
-        return ("scholar", m.group(2).strip())
-
-    m = SEMANTIC_AUTHOR_RE.match(u)
-    if m:
-        return ("semantic_scholar", m.group(2).strip())
-
-    m = GITHUB_USER_RE.match(u)
-    if m and not _is_github_repo(u):
-        handle = m.group(2).strip()
-        # ignore obvious non-user endpoints
-        if handle.lower() not in {"topics", "orgs", "organizations", "site", "features", "pricing", "about"}:
-            return ("github", handle)
-
-    return ("unknown", "")
+    kind, hid = person_url(url)
+    # ignore obvious non-user endpoints
+    if kind == "github" and hid.lower() in GITHUB_IGNORE:
+        return ("unknown", "")
+    return (kind, hid)
 
 
 def _stable_sort_key(rec: Dict[str, str]) -> Tuple[str, str, str]:
@@ -187,7 +158,7 @@ def process_csv(input_csv: str | Path, output_csv: str | Path) -> None:
                 continue
 
             out: Dict[str, str] = {k: "" for k in out_fieldnames}
-            prov: Dict[str, Any] = {}
+            prov = Provenance()
 
             out["Source_Person_URL"] = u
             out["Source_Hub_URL"] = hub_url
@@ -255,5 +226,7 @@ def process_csv(input_csv: str | Path, output_csv: str | Path) -> None:
         for rec in projected:
             writer.writerow({k: rec.get(k, "") for k in out_fieldnames})
 
+    memo_clear()
+
 
 __all__ = ["process_csv"]
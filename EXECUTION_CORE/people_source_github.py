@@ -16,12 +16,17 @@ Rules:
 • NEVER infer names
 • NEVER scrape private data
 • GitHub API only
+
+Profiles are cached across runs (EXECUTION_CORE/person_enrichment_cache.py,
+field "github_profile"); a fresh cache entry skips the API call.
 """
 
 import csv
 import sys
 import requests
 
+from EXECUTION_CORE.person_enrichment_cache import get_cache
+
 REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0"}
 TIMEOUT = 10
 
@@ -48,7 +53,37 @@ def add_pipe(existing: str, new: str):
     return "|".join(sorted(existing_set))
 
 
+def login_from_url(url: str):
+    parts = url.rstrip("/").split("/")
+    return parts[3] if len(parts) > 3 else ""
+
+
+def fetch_profile(api: str, login: str, cache=None):
+    """
+    Returns the cached-or-fetched profile subset {login, id, blog}, or None.
+    """
+    if cache is not None:
+        hit = cache.get("github_profile", login=login)
+        if hit is not None:
+            return hit["value"]
+
+    try:
+        r = requests.get(api, timeout=TIMEOUT, headers=REQUEST_HEADERS)
+        if r.status_code != 200:
+            return None
+        data = r.json()
+    except Exception:
+        return None
+
+    profile = {"login": data.get("login"), "id": data.get("id"), "blog": data.get("blog")}
+    if cache is not None:
+        cache.put("github_profile", profile, api, login=data.get("login") or login, user_id=data.get("id"))
+    return profile
+
+
 def process_csv(input_csv: str, output_csv: str):
+    cache = get_cache()
+
     with open(input_csv, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         fieldnames = reader.fieldnames
@@ -63,12 +98,8 @@ def process_csv(input_csv: str, output_csv: str):
         if not api:
             continue
 
-        try:
-            r = requests.get(api, timeout=TIMEOUT, headers=REQUEST_HEADERS)
-            if r.status_code != 200:
-                continue
-            data = r.json()
-        except Exception:
+        data = fetch_profile(api, login_from_url(gh_url), cache)
+        if data is None:
             continue
 
         # Username
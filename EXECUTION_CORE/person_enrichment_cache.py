@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+person_enrichment_cache.py
+
+Cross-Run Person Enrichment Cache
+Author: L. David Mendoza © 2026
+
+Purpose:
+- Remember per-person field values produced by earlier runs so recurring
+  populations do not re-hit the network:
+    people_source_github          -> github_profile (login, id, blog)
+    deep_personal_artifact_scrape -> github_io_url, deep_scrape
+    name_resolution_pass          -> name_contact (Full/First/Last name, email, phone)
+- Every value carries its provenance (source) and fetch timestamp
+- Stages consult the cache BEFORE any network call
+
+Identity:
+- Keyed by GitHub numeric user id when known ("id:<n>"), else lowercase login
+  ("login:<login>"). A login -> id alias table lets later lookups by login find
+  entries written under the id (renames keep their history).
+
+Freshness:
+- Per-field TTL (FIELD_TTL_SECONDS); stale entries read as misses and are refetched
+- Global override: AI_TALENT_REFRESH_OLDER_THAN=<dur> (e.g. 12h, 7d, 2w) treats
+  anything older than <dur> as stale for this process. run_safe accepts
+  --refresh-older-than <dur> and sets it.
+- AI_TALENT_PERSON_CACHE=0 disables the cache entirely
+
+Storage:
+- outputs/person_enrichment_cache.sqlite3 (WAL, safe for concurrent readers)
+
+    python3 EXECUTION_CORE/person_enrichment_cache.py stats
+    python3 EXECUTION_CORE/person_enrichment_cache.py purge --refresh-older-than 30d
+
+No scraping, no row mutation.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+
+PERSON_CACHE_DB = "outputs/person_enrichment_cache.sqlite3"
+
+REFRESH_ENV = "AI_TALENT_REFRESH_OLDER_THAN"
+ENABLE_ENV = "AI_TALENT_PERSON_CACHE"
+
+DAY = 86400
+
+FIELD_TTL_SECONDS = {
+    "github_profile": 7 * DAY,
+    "github_io_url": 30 * DAY,
+    "deep_scrape": 14 * DAY,
+    "name_contact": 30 * DAY,
+}
+DEFAULT_FIELD_TTL = 14 * DAY
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$", re.IGNORECASE)
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": DAY, "w": 7 * DAY, "": DAY}
+
+
+def parse_duration(s):
+    """'90s' | '30m' | '12h' | '7d' | '2w' | '3' (days) -> seconds (float)."""
+    m = _DURATION_RE.match(str(s or ""))
+    if not m:
+        raise ValueError(f"Invalid duration: {s!r} (expected e.g. 12h, 7d, 2w)")
+    return float(m.group(1)) * _UNITS[m.group(2).lower()]
+
+
+def identity_key(login=None, user_id=None):
+    if user_id not in (None, ""):
+        return f"id:{int(user_id)}"
+    login = (login or "").strip().lower()
+    return f"login:{login}" if login else ""
+
+
+class PersonEnrichmentCache:
+    """
+    SQLite-backed (identity, field) -> value store with per-field freshness.
+    One connection per thread.
+    """
+
+    def __init__(self, db_path=PERSON_CACHE_DB, field_ttl=None, refresh_older_than=None):
+        self.db_path = db_path
+        self.field_ttl = dict(FIELD_TTL_SECONDS)
+        self.field_ttl.update(field_ttl or {})
+        self.refresh_older_than = refresh_older_than
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "writes": 0}
+        parent = os.path.dirname(db_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._conn().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS person_fields (
+                identity_key TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value TEXT NOT NULL,
+                source TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (identity_key, field)
+            );
+            CREATE TABLE IF NOT EXISTS login_alias (
+                login TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL
+            );
+            """
+        )
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def max_age(self, field):
+        ttl = self.field_ttl.get(field, DEFAULT_FIELD_TTL)
+        if self.refresh_older_than is not None:
+            ttl = min(ttl, self.refresh_older_than)
+        return ttl
+
+    def _keys(self, login, user_id):
+        keys = []
+        if user_id in (None, "") and login:
+            row = self._conn().execute(
+                "SELECT user_id FROM login_alias WHERE login = ?", ((login or "").strip().lower(),)
+            ).fetchone()
+            if row:
+                keys.append(identity_key(user_id=row[0]))
+        k = identity_key(login=login, user_id=user_id)
+        if k:
+            keys.append(k)
+        if user_id not in (None, "") and login:
+            keys.append(identity_key(login=login))
+        return keys
+
+    def get(self, field, login=None, user_id=None):
+        """
+        Returns {"value", "source", "fetched_at"} for a fresh entry, else None.
+        """
+        conn = self._conn()
+        now = time.time()
+        for k in self._keys(login, user_id):
+            row = conn.execute(
+                "SELECT value, source, fetched_at FROM person_fields WHERE identity_key = ? AND field = ?",
+                (k, field),
+            ).fetchone()
+            if row is None:
+                continue
+            value, source, fetched_at = row
+            if now - fetched_at > self.max_age(field):
+                self._count("stale")
+                break
+            self._count("hits")
+            return {"value": json.loads(value), "source": source, "fetched_at": fetched_at}
+        self._count("misses")
+        return None
+
+    def put(self, field, value, source, login=None, user_id=None):
+        k = identity_key(login=login, user_id=user_id)
+        if not k:
+            return
+        conn = self._conn()
+        if user_id not in (None, "") and login:
+            conn.execute(
+                "INSERT OR REPLACE INTO login_alias (login, user_id) VALUES (?, ?)",
+                (login.strip().lower(), int(user_id)),
+            )
+        conn.execute(
+            "INSERT OR REPLACE INTO person_fields (identity_key, field, value, source, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (k, field, json.dumps(value, ensure_ascii=False, separators=(",", ":")), source or "", time.time()),
+        )
+        self._count("writes")
+
+    def purge_older_than(self, seconds):
+        cur = self._conn().execute("DELETE FROM person_fields WHERE fetched_at < ?", (time.time() - seconds,))
+        return cur.rowcount
+
+    def summary(self):
+        conn = self._conn()
+        per_field = dict(conn.execute("SELECT field, COUNT(*) FROM person_fields GROUP BY field").fetchall())
+        people = conn.execute("SELECT COUNT(DISTINCT identity_key) FROM person_fields").fetchone()[0]
+        with self._lock:
+            out = dict(self.stats)
+        out.update({"people": people, "fields": per_field, "db_path": self.db_path})
+        return out
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def cache_enabled():
+    return (os.environ.get(ENABLE_ENV) or "1").strip().lower() not in ("0", "false", "off", "no")
+
+
+def get_cache():
+    """Process-wide cache, or None when disabled via AI_TALENT_PERSON_CACHE=0."""
+    global _CACHE
+    if not cache_enabled():
+        return None
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                raw = (os.environ.get(REFRESH_ENV) or "").strip()
+                _CACHE = PersonEnrichmentCache(refresh_older_than=parse_duration(raw) if raw else None)
+    return _CACHE
+
+
+def pop_refresh_flag(argv):
+    """
+    Strip '--refresh-older-than <dur>' / '--refresh-older-than=<dur>' from argv
+    and export it via AI_TALENT_REFRESH_OLDER_THAN. Returns the remaining argv.
+    """
+    out = []
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        if a == "--refresh-older-than" and i + 1 < len(argv):
+            val = argv[i + 1]
+            i += 2
+        elif a.startswith("--refresh-older-than="):
+            val = a.split("=", 1)[1]
+            i += 1
+        else:
+            out.append(a)
+            i += 1
+            continue
+        parse_duration(val)
+        os.environ[REFRESH_ENV] = val
+    return out
+
+
+if __name__ == "__main__":
+    args = pop_refresh_flag(sys.argv[1:])
+    cmd = args[0] if args else "stats"
+    cache = PersonEnrichmentCache()
+    if cmd == "purge":
+        raw = (os.environ.get(REFRESH_ENV) or "").strip()
+        if not raw:
+            sys.exit("purge requires --refresh-older-than <dur>")
+        n = cache.purge_older_than(parse_duration(raw))
+        print(f"Purged {n} field entries older than {raw} from {PERSON_CACHE_DB}")
+    print(json.dumps(cache.summary(), indent=2))
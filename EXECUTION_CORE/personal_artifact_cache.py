@@ -11,14 +11,40 @@ Purpose:
 - Prevent re-scraping same person repeatedly
 - Safe fallback if network unavailable
 
+Storage (v2):
+- Single-file SQLite store (WAL mode): outputs/personal_artifact_cache.sqlite3
+- Values are zlib-compressed compact JSON
+- Per-entry TTL (expired entries read as misses and are purged)
+- Size-bounded LRU eviction on total compressed bytes
+- hit / miss / expired / eviction counters (cache_stats())
+- Legacy one-file-per-person JSON entries in outputs/personal_artifact_cache/
+  are read through and imported on first miss, aged from their file mtime
+  (expired files are ignored, live ones keep only their remaining TTL);
+  bulk migration applies the same rule:
+
+    python3 EXECUTION_CORE/personal_artifact_cache.py migrate [--remove-json]
+    python3 EXECUTION_CORE/personal_artifact_cache.py stats
+
+Public API unchanged: cache_key, load_from_cache, write_to_cache.
+
 No scraping, no mutation.
 """
 
 import json
 import os
 import hashlib
+import sqlite3
+import sys
+import threading
+import time
+import zlib
 
 CACHE_DIR = "outputs/personal_artifact_cache"
+CACHE_DB = "outputs/personal_artifact_cache.sqlite3"
+
+DEFAULT_TTL_SECONDS = 30 * 86400
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+EVICT_TARGET_RATIO = 0.9
 
 
 def ensure_cache_dir():
@@ -38,20 +64,220 @@ def cache_path(key):
     return os.path.join(CACHE_DIR, f"{key}.json")
 
 
-def load_from_cache(person_record):
-    ensure_cache_dir()
-    key = cache_key(person_record)
+class ArtifactCacheStore:
+    """
+    SQLite-backed key/value store with TTL and LRU eviction.
+    One connection per thread; WAL allows concurrent readers across processes.
+    """
+
+    def __init__(self, db_path=CACHE_DB, ttl_seconds=DEFAULT_TTL_SECONDS, max_bytes=DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "writes": 0}
+        self._approx_bytes = None  # running upper bound; exact SUM only when it crosses max_bytes
+        parent = os.path.dirname(db_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._conn().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS artifact_cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_artifact_cache_lru ON artifact_cache(last_access);
+            """
+        )
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, name, n=1):
+        with self._lock:
+            self.stats[name] += n
+
+    def get(self, key):
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute("SELECT value, expires_at FROM artifact_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= now:
+            conn.execute("DELETE FROM artifact_cache WHERE key = ?", (key,))
+            self._count("expired")
+            self._count("misses")
+            return None
+        conn.execute("UPDATE artifact_cache SET last_access = ? WHERE key = ?", (now, key))
+        self._count("hits")
+        return json.loads(zlib.decompress(value).decode("utf-8"))
+
+    def put(self, key, obj, ttl_seconds=None):
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        blob = zlib.compress(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6)
+        expires_at = (now + ttl) if ttl else None
+        self._conn().execute(
+            "INSERT OR REPLACE INTO artifact_cache (key, value, size, created_at, expires_at, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, blob, len(blob), now, expires_at, now),
+        )
+        self._count("writes")
+        self._evict_if_needed(len(blob))
+
+    def _evict_if_needed(self, added):
+        if not self.max_bytes:
+            return
+        conn = self._conn()
+        with self._lock:
+            if self._approx_bytes is None:
+                self._approx_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM artifact_cache").fetchone()[0]
+            else:
+                self._approx_bytes += added
+            if self._approx_bytes <= self.max_bytes:
+                return
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM artifact_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            with self._lock:
+                self._approx_bytes = total
+            return
+        conn.execute("DELETE FROM artifact_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        target = int(self.max_bytes * EVICT_TARGET_RATIO)
+        evicted = 0
+        for key, size in conn.execute("SELECT key, size FROM artifact_cache ORDER BY last_access ASC").fetchall():
+            if total <= target:
+                break
+            conn.execute("DELETE FROM artifact_cache WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._approx_bytes = total
+        self._count("evictions", evicted)
+
+    def summary(self):
+        conn = self._conn()
+        entries, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM artifact_cache").fetchone()
+        with self._lock:
+            out = dict(self.stats)
+        out.update({"entries": entries, "bytes": total, "db_path": self.db_path})
+        return out
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_store():
+    global _STORE
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = ArtifactCacheStore()
+    return _STORE
+
+
+def _load_legacy_json(key):
     path = cache_path(key)
-    if os.path.exists(path):
+    if not os.path.exists(path):
+        return None
+    try:
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
-    return None
+    except Exception:
+        return None
+
+
+def _legacy_remaining_ttl(path, ttl):
+    """
+    Remaining TTL of a legacy JSON entry, aged from its file mtime; None when
+    the entry has expired (or vanished), ttl itself when TTLs are off.
+    """
+    if not ttl:
+        return ttl
+    try:
+        age = max(0.0, time.time() - os.stat(path).st_mtime)
+    except OSError:
+        return None
+    if age >= ttl:
+        return None
+    return ttl - age
+
+
+def load_from_cache(person_record):
+    store = get_store()
+    key = cache_key(person_record)
+    cached = store.get(key)
+    if cached is not None:
+        return cached
+    legacy = _load_legacy_json(key)
+    if legacy is None:
+        return None
+    ttl = _legacy_remaining_ttl(cache_path(key), store.ttl_seconds)
+    if store.ttl_seconds and ttl is None:
+        store._count("expired")
+        return None
+    store.put(key, legacy, ttl_seconds=ttl)
+    return legacy
 
 
 def write_to_cache(person_record, scraper_output):
-    ensure_cache_dir()
+    store = get_store()
     key = cache_key(person_record)
-    path = cache_path(key)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(scraper_output, f, indent=2, ensure_ascii=False)
-    return path
+    store.put(key, scraper_output)
+    return store.db_path
+
+
+def cache_stats():
+    return get_store().summary()
+
+
+def migrate_json_cache(json_dir=CACHE_DIR, store=None, remove_json=False):
+    """
+    Import every legacy <key>.json file into the store (mtime kept as created_at
+    for TTL purposes). Returns (migrated, skipped).
+    """
+    store = store or get_store()
+    migrated = skipped = 0
+    if not os.path.isdir(json_dir):
+        return migrated, skipped
+    with os.scandir(json_dir) as it:
+        for entry in it:
+            if not entry.is_file() or not entry.name.endswith(".json"):
+                continue
+            key = entry.name[:-5]
+            try:
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    obj = json.load(f)
+            except Exception:
+                skipped += 1
+                continue
+            ttl = _legacy_remaining_ttl(entry.path, store.ttl_seconds)
+            if store.ttl_seconds and ttl is None:
+                skipped += 1
+                continue
+            store.put(key, obj, ttl_seconds=ttl)
+            migrated += 1
+            if remove_json:
+                os.remove(entry.path)
+    return migrated, skipped
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    if cmd == "migrate":
+        m, s = migrate_json_cache(remove_json="--remove-json" in sys.argv[2:])
+        print(f"Migrated {m} entries into {CACHE_DB} (skipped {s})")
+    print(json.dumps(cache_stats(), indent=2))
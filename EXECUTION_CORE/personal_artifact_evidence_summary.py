@@ -5,6 +5,9 @@ EXECUTION_CORE/personal_artifact_evidence_summary.py
 DAY 9 — EVIDENCE NORMALIZATION & SUMMARIZATION
 
 Uses the frozen canonical evidence vocabulary.
+
+extract_canonical_evidence(row=...) is the bare sorted category list (no
+summary dict), for cohort evaluation; trigger lists are compiled once.
 """
 
 from __future__ import annotations
@@ -27,16 +30,19 @@ ARTIFACT_FIELDS = {
 }
 
 
+_TRIGGERS = tuple((canonical, tuple(triggers)) for canonical, triggers in CANONICAL_EVIDENCE.items())
+
+
 def _norm(v: Any) -> str:
     return str(v or "").strip().lower()
 
 
-def summarize_evidence(
+def extract_canonical_evidence(
     *,
     row: Mapping[str, Any],
-) -> Dict[str, Any]:
+) -> List[str]:
     """
-    Summarize a single row into canonical evidence categories.
+    Sorted canonical evidence categories of a single row.
     Only inspects approved artifact fields.
     """
     text_blob_parts: List[str] = []
@@ -49,13 +55,24 @@ def summarize_evidence(
 
     canonical_hits: List[str] = []
 
-    for canonical, triggers in CANONICAL_EVIDENCE.items():
+    for canonical, triggers in _TRIGGERS:
         for t in triggers:
             if t in text_blob:
                 canonical_hits.append(canonical)
                 break
 
-    canonical_hits = sorted(set(canonical_hits))
+    return sorted(set(canonical_hits))
+
+
+def summarize_evidence(
+    *,
+    row: Mapping[str, Any],
+) -> Dict[str, Any]:
+    """
+    Summarize a single row into canonical evidence categories.
+    Only inspects approved artifact fields.
+    """
+    canonical_hits = extract_canonical_evidence(row=row)
 
     return OrderedDict(
         canonical_evidence=canonical_hits,
@@ -65,5 +82,6 @@ def summarize_evidence(
 
 __all__ = [
     "summarize_evidence",
+    "extract_canonical_evidence",
     "ARTIFACT_FIELDS",
 ]
@@ -7,6 +7,15 @@ IMPORT-ONLY MODULE
 Phase 6: AI Stack Signal Detection
 
 Maintainer: L. David Mendoza © 2026
+
+- Fills the pipe-mode output columns of SCHEMA/ai_stack_taxonomy.json
+  (LLM_Names, VectorDB_Tech, RAG_Stack, Inference_Stack, Optimization_Tech,
+  GPU_Infra_Signals) from each row's evidence text (every other populated
+  field) with the compiled single-pass matcher in taxonomy_matcher.py.
+- Runs after the locked 81-column schema step, so the header is never extended:
+  a taxonomy column is filled when the header already has it, else its
+  canonical counterpart (CANONICAL_TARGETS) is; columns with neither are skipped.
+- Non-overwrite: existing values are kept; detected values are appended.
 """
 
 import csv
@@ -14,6 +23,14 @@ import json
 from pathlib import Path
 from typing import Dict, List
 
+from EXECUTION_CORE.taxonomy_matcher import (
+    compile_taxonomy,
+    evidence_text,
+    merge_pipe,
+    output_targets,
+    pipe_columns,
+)
+
 ROOT = Path(__file__).resolve().parents[1]
 TAXONOMY_PATH = ROOT / "SCHEMA" / "ai_stack_taxonomy.json"
 
@@ -34,17 +51,42 @@ def _load_taxonomy() -> Dict:
     return data
 
 
+EVIDENCE_EXCLUDE = ("Field_Level_Provenance_JSON",)
+
+# Taxonomy output column -> canonical 81-column counterpart
+CANONICAL_TARGETS = {
+    "LLM_Names": "Primary_Model_Families",
+    "Inference_Stack": "Inference_Training_Infra_Signals",
+    "Optimization_Tech": "Inference_Training_Infra_Signals",
+    "GPU_Infra_Signals": "Inference_Training_Infra_Signals",
+}
+
+
 def process_csv(input_csv: str, output_csv: str) -> None:
     taxonomy = _load_taxonomy()
 
     with open(input_csv, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         rows = list(reader)
-        fieldnames = reader.fieldnames or []
+        fieldnames = list(reader.fieldnames or [])
+
+    out_cols = pipe_columns(taxonomy)
+    targets = output_targets(out_cols, fieldnames, CANONICAL_TARGETS)
+    groups = {
+        c["name"]: c.get("items") or []
+        for c in taxonomy["categories"]
+        if isinstance(c, dict) and c.get("name") in targets
+    }
+    matcher = compile_taxonomy("ai_stack", groups)
 
-    # Phase 6 logic (unchanged): empty taxonomy = no matches
-    for row in rows:
-        pass
+    # Empty taxonomy = no matches
+    exclude = set(EVIDENCE_EXCLUDE) | set(out_cols) | set(targets.values())
+    for row in rows if targets else ():
+        found = matcher.match(evidence_text(row, exclude))
+        for col, target in targets.items():
+            values = found.get(col) or []
+            if values:
+                row[target] = merge_pipe(row.get(target, ""), values)
 
     with open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -7,6 +7,16 @@ IMPORT-ONLY MODULE
 Phase 7: Open Source Contribution Intelligence
 
 Maintainer: L. David Mendoza © 2026
+
+- Fills the pipe-mode output columns of SCHEMA/oss_contribution_taxonomy.json
+  from each row's evidence text (every other populated field) with the
+  compiled single-pass matcher in taxonomy_matcher.py:
+    OSS_AI_Frameworks   <- "frameworks"
+    OSS_Repos_Relevant  <- "repo_relevance_patterns"
+- Runs after the locked 81-column schema step, so the header is never extended:
+  only columns the header already has are filled (neither has a canonical
+  counterpart).
+- Non-overwrite: existing values are kept; detected values are appended.
 """
 
 import csv
@@ -14,6 +24,14 @@ import json
 from pathlib import Path
 from typing import Dict, List
 
+from EXECUTION_CORE.taxonomy_matcher import (
+    compile_taxonomy,
+    evidence_text,
+    merge_pipe,
+    output_targets,
+    pipe_columns,
+)
+
 ROOT = Path(__file__).resolve().parents[1]
 TAXONOMY_PATH = ROOT / "SCHEMA" / "oss_contribution_taxonomy.json"
 
@@ -28,23 +46,42 @@ def _load_taxonomy() -> Dict:
     except Exception as e:
         raise RuntimeError(f"Invalid JSON in taxonomy file: {TAXONOMY_PATH}") from e
 
-    if not isinstance(data, dict) or "categories" not in data:
+    if not isinstance(data, dict) or not any(k in data for k in PATTERN_SECTIONS.values()):
         raise RuntimeError(f"Malformed taxonomy structure: {TAXONOMY_PATH}")
 
     return data
 
 
+# Pipe-mode output column -> taxonomy section holding its items
+PATTERN_SECTIONS = {
+    "OSS_AI_Frameworks": "frameworks",
+    "OSS_Repos_Relevant": "repo_relevance_patterns",
+}
+
+EVIDENCE_EXCLUDE = ("Field_Level_Provenance_JSON",)
+
+
 def process_csv(input_csv: str, output_csv: str) -> None:
     taxonomy = _load_taxonomy()
 
     with open(input_csv, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         rows = list(reader)
-        fieldnames = reader.fieldnames or []
+        fieldnames = list(reader.fieldnames or [])
+
+    out_cols = [c for c in pipe_columns(taxonomy) if c in PATTERN_SECTIONS]
+    targets = output_targets(out_cols, fieldnames, {})
+    groups = {c: taxonomy.get(PATTERN_SECTIONS[c]) or [] for c in targets}
+    matcher = compile_taxonomy("oss_contribution", groups)
 
-    # Phase 7 logic (unchanged): empty taxonomy = no matches
-    for row in rows:
-        pass
+    # Empty taxonomy = no matches
+    exclude = set(EVIDENCE_EXCLUDE) | set(taxonomy.get("output_columns") or {})
+    for row in rows if targets else ():
+        found = matcher.match(evidence_text(row, exclude))
+        for col, target in targets.items():
+            values = found.get(col) or []
+            if values:
+                row[target] = merge_pipe(row.get(target, ""), values)
 
     with open(output_csv, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -6,7 +6,7 @@ EXECUTION_CORE/post_run_narrative_pass.py
 POST-RUN NARRATIVE PASS (DETERMINISTIC, NO FABRICATION)
 
 Maintainer: L. David Mendoza © 2026
-Version: v1.1.0
+Version: v1.1.1
 
 Purpose
 - Increase interview-grade row readability without inventing facts.
@@ -27,6 +27,10 @@ Rules
 - No overwrite of non-empty fields
 - Deterministic templates only
 
+Changelog
+- v1.1.1: Field_Level_Provenance_JSON handled through EXECUTION_CORE/provenance.py
+  (no re-parse of cells the previous stage wrote; byte-identical JSON).
+
 Validation
 python3 -c "from EXECUTION_CORE.post_run_narrative_pass import process_csv; print('ok')"
 
@@ -39,10 +43,11 @@ git push
 from __future__ import annotations
 
 import csv
-import json
 from pathlib import Path
 from typing import Dict, Any, List
 
+from EXECUTION_CORE.provenance import Provenance, memo_clear
+
 
 def _norm(x: Any) -> str:
     return str(x or "").strip()
@@ -52,23 +57,16 @@ def _nonempty(x: Any) -> bool:
     return _norm(x) != ""
 
 
-def _load_prov(row: Dict[str, str]) -> Dict[str, Any]:
-    raw = _norm(row.get("Field_Level_Provenance_JSON"))
-    if not raw:
-        return {}
-    try:
-        obj = json.loads(raw)
-        return obj if isinstance(obj, dict) else {}
-    except Exception:
-        return {}
+def _load_prov(row: Dict[str, str]) -> Provenance:
+    return Provenance.of_row(row)
 
 
-def _save_prov(row: Dict[str, str], prov: Dict[str, Any]) -> None:
-    row["Field_Level_Provenance_JSON"] = json.dumps(prov, sort_keys=True)
+def _save_prov(row: Dict[str, str], prov: Provenance) -> None:
+    prov.save(row)
 
 
-def _set_prov(prov: Dict[str, Any], field: str, source: str, method: str) -> None:
-    prov[field] = {"source": source, "method": method}
+def _set_prov(prov: Provenance, field: str, source: str, method: str) -> None:
+    prov.set(field, source, method)
 
 
 def _compose(row: Dict[str, str], fields: List[str]) -> str:
@@ -167,5 +165,7 @@ def process_csv(input_csv: str | Path, output_csv: str | Path) -> None:
         for r in rows:
             writer.writerow({k: r.get(k, "") for k in fieldnames})
 
+    memo_clear()
+
 
 __all__ = ["process_csv"]
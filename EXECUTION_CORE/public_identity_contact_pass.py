@@ -6,7 +6,17 @@ EXECUTION_CORE/public_identity_contact_pass.py
 BEST-IN-CLASS (EVIDENCE-ONLY) IDENTITY + CONTACT PASS
 
 Maintainer: L. David Mendoza © 2026
-Version: v2.1.1 (EOF sanitation, no logic change)
+Version: v2.2.1
+
+Changelog
+- v2.2.1: Field_Level_Provenance_JSON handled through EXECUTION_CORE/provenance.py
+  (no re-parse of cells the previous stage wrote; byte-identical JSON).
+- v2.2.0: Email/phone extraction moved to EXECUTION_CORE/contact_extractor.py:
+  evidence columns are scanned one at a time behind cheap prefilters instead of
+  regexing one blob of the whole row (Field_Level_Provenance_JSON included).
+  Provenance now names the column the value was found in. Matches can no
+  longer span two fields. Ties between case variants resolve deterministically.
+- v2.1.1: EOF sanitation, no logic change
 
 Purpose
 - Deterministic, strict non-overwrite enrichment (no network):
@@ -23,16 +33,17 @@ Rules
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Dict, List, Any, Tuple
 
-EMAIL_DIRECT_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
-EMAIL_DEOB_RE = re.compile(
-    r"([a-zA-Z0-9._%+\-]+)\s*(?:@|\(at\)|\sat\s)\s*([a-zA-Z0-9.\-]+)\s*(?:\.|\(dot\)|\sdot\s)\s*([a-zA-Z]{2,})",
-    re.IGNORECASE,
+from EXECUTION_CORE.provenance import Provenance
+from EXECUTION_CORE.contact_extractor import (  # noqa: F401 (regexes re-exported)
+    EMAIL_DEOB_RE,
+    EMAIL_DIRECT_RE,
+    PHONE_RE,
+    ContactExtractor,
 )
-PHONE_RE = re.compile(r"(\+?1[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}")
+
 LINKEDIN_VANITY_RE = re.compile(r"linkedin\.com/in/([^/?#]+)", re.IGNORECASE)
 
 
@@ -44,23 +55,16 @@ def _nonempty(x: Any) -> bool:
     return _norm(x) != ""
 
 
-def _load_prov(row: Dict[str, str]) -> Dict[str, Any]:
-    raw = _norm(row.get("Field_Level_Provenance_JSON"))
-    if not raw:
-        return {}
-    try:
-        obj = json.loads(raw)
-        return obj if isinstance(obj, dict) else {}
-    except Exception:
-        return {}
+def _load_prov(row: Dict[str, str]) -> Provenance:
+    return Provenance.of_row(row)
 
 
-def _save_prov(row: Dict[str, str], prov: Dict[str, Any]) -> None:
-    row["Field_Level_Provenance_JSON"] = json.dumps(prov, sort_keys=True)
+def _save_prov(row: Dict[str, str], prov: Provenance) -> None:
+    prov.save(row)
 
 
-def _set_prov(prov: Dict[str, Any], field: str, source: str, method: str) -> None:
-    prov[field] = {"source": source, "method": method}
+def _set_prov(prov: Provenance, field: str, source: str, method: str) -> None:
+    prov.set(field, source, method)
 
 
 def _parse_linkedin_vanity(url: str) -> str:
@@ -78,17 +82,7 @@ def _name_from_vanity(vanity: str) -> Tuple[str, str]:
     return "", ""
 
 
-def _extract_emails(text: str) -> List[str]:
-    out: List[str] = []
-    for m in EMAIL_DEOB_RE.finditer(text or ""):
-        out.append(f"{m.group(1)}@{m.group(2)}.{m.group(3)}")
-    out.extend(EMAIL_DIRECT_RE.findall(text or ""))
-    return sorted(set([e.strip() for e in out if e.strip()]), key=str.lower)
-
-
-def _extract_phones(text: str) -> List[str]:
-    out = [m.group(0).strip() for m in PHONE_RE.finditer(text or "")]
-    return sorted(set([p for p in out if p]), key=str.lower)
+_EXTRACTOR = ContactExtractor()
 
 
 def enrich_rows_public_identity_contact(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
@@ -119,17 +113,20 @@ def enrich_rows_public_identity_contact(rows: List[Dict[str, str]]) -> List[Dict
                 row["Last_Name"] = parts[-1]
                 _set_prov(prov, "Last_Name", "Full_Name", "split_last")
 
-        blob = " ".join(_norm(row.get(k)) for k in row.keys())
-        emails = _extract_emails(blob)
-        phones = _extract_phones(blob)
+        need_email = not _nonempty(row.get("Primary_Email"))
+        need_phone = not _nonempty(row.get("Primary_Phone"))
+        if need_email or need_phone:
+            hits = _EXTRACTOR.extract(row)
+            email = hits.primary_email() if need_email else None
+            phone = hits.primary_phone() if need_phone else None
 
-        if emails and not _nonempty(row.get("Primary_Email")):
-            row["Primary_Email"] = emails[0]
-            _set_prov(prov, "Primary_Email", "row_text_fields", "regex_extract_email")
+            if email:
+                row["Primary_Email"] = email[0]
+                _set_prov(prov, "Primary_Email", email[1], "regex_extract_email")
 
-        if phones and not _nonempty(row.get("Primary_Phone")):
-            row["Primary_Phone"] = phones[0]
-            _set_prov(prov, "Primary_Phone", "row_text_fields", "regex_extract_phone")
+            if phone:
+                row["Primary_Phone"] = phone[0]
+                _set_prov(prov, "Primary_Phone", phone[1], "regex_extract_phone")
 
         _save_prov(row, prov)
 
@@ -6,7 +6,7 @@ EXECUTION_CORE/required_fields_densifier.py
 REQUIRED FIELDS DENSIFIER (DETERMINISTIC, NO FABRICATION)
 
 Maintainer: L. David Mendoza © 2026
-Version: v1.0.0
+Version: v1.2.0
 
 THIS FILE IS:
 - Import-only module exposing process_csv(input_csv, output_csv)
@@ -40,6 +40,16 @@ Strengths and Weaknesses (no fabrication)
 - Never asserts negative traits about a person
 
 Changelog
+- v1.2.0: Strengths keyword groups compiled once (KeywordGroups: pre-lowered keywords,
+  one lowering of the evidence text for all four groups); weakness summaries
+  composed once per distinct flag combination. Same output.
+  Benchmark: python3 scripts/bench_required_fields_densifier.py [ROWS]
+  Tests: test/test_required_fields_densifier.py
+- v1.1.1: Field_Level_Provenance_JSON handled through EXECUTION_CORE/provenance.py
+  (no re-parse of cells the previous stage wrote; byte-identical JSON).
+- v1.1.0: Rows run as lists against a compiled column plan (EXECUTION_CORE/column_plan.py):
+  every evidence lookup and fallback chain is resolved to positions once per file
+  instead of dict lookups per row. Output is byte-identical.
 - v1.0.0 (2026-01-18): Initial required-fields densifier (fill blanks only)
 
 Validation
@@ -53,11 +63,13 @@ git push
 
 from __future__ import annotations
 
-import csv
-import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
+
+from EXECUTION_CORE.column_plan import ColumnPlan, any_value, first_value, read_csv, write_csv
+from EXECUTION_CORE.provenance import Provenance, memo_clear
 
 
 def _norm(x: Any) -> str:
@@ -68,31 +80,35 @@ def _nonempty(x: Any) -> bool:
     return _norm(x) != ""
 
 
-def _load_prov(row: Dict[str, str]) -> Dict[str, Any]:
-    raw = _norm(row.get("Field_Level_Provenance_JSON"))
-    if not raw:
-        return {}
-    try:
-        obj = json.loads(raw)
-        return obj if isinstance(obj, dict) else {}
-    except Exception:
-        return {}
-
-
-def _save_prov(row: Dict[str, str], prov: Dict[str, Any]) -> None:
-    row["Field_Level_Provenance_JSON"] = json.dumps(prov, sort_keys=True)
-
+def _set_prov(prov: Provenance, field: str, source: str, method: str) -> None:
+    prov.set(field, source, method)
 
-def _set_prov(prov: Dict[str, Any], field: str, source: str, method: str) -> None:
-    prov[field] = {"source": source, "method": method}
 
+class _Plan:
+    """
+    Header resolved once: every column (or fallback chain) the densifier reads
+    becomes a tuple of positions; absent columns compile to () and read as blank.
+    """
 
-def _get_first_present(row: Dict[str, str], keys: List[str]) -> str:
-    for k in keys:
-        v = _norm(row.get(k))
-        if v:
-            return v
-    return ""
+    def __init__(self, plan: ColumnPlan):
+        at = plan.at
+        self.github_any = at("GitHub_URL", "GitHub_Username", "Key_GitHub_AI_Repos")
+        self.github = at("GitHub_URL", "GitHub_Username")
+        self.repos = at("Key_GitHub_AI_Repos", "Repo_Topics_Keywords")
+        self.repo_topics = at("Repo_Topics_Keywords", "Key_GitHub_AI_Repos")
+        self.models = at("Primary_Model_Families", "Determinative_Skill_Areas")
+        self.infra = at("Inference_Training_Infra_Signals")
+        self.rlhf = at("RLHF_Alignment_Signals")
+        self.pubs = at("Publication_Count", "Citation_Count_Raw")
+        self.company = at("Current_Company", "Company_XRay_Source_URLs")
+        self.identity = at("Full_Name", "LinkedIn_Public_URL")
+        self.ai_role_type = at("AI_Role_Type")
+
+        self.prov = plan.ensure("Field_Level_Provenance_JSON")
+        self.role_type = plan.ensure("Role_Type")
+        self.signal_score = plan.ensure("Signal_Score")
+        self.strengths = plan.ensure("Strengths")
+        self.weaknesses = plan.ensure("Weaknesses")
 
 
 def _split_tokens_preserve_order(text: str) -> List[str]:
@@ -106,31 +122,67 @@ def _split_tokens_preserve_order(text: str) -> List[str]:
     return parts
 
 
-def _extract_ordered_keywords(text: str, keywords: List[str]) -> List[str]:
+VECTOR_KEYWORDS = ("Weaviate", "Pinecone", "FAISS", "Milvus", "Qdrant", "Chroma", "pgvector")
+RAG_KEYWORDS = ("Retrieval-Augmented Generation", "RAG")
+LANG_KEYWORDS = ("LangChain", "LangGraph", "LlamaIndex")
+INFER_KEYWORDS = ("TensorRT", "TensorRT-LLM", "vLLM", "TGI", "ONNX", "Triton", "llama.cpp")
+
+STRENGTH_KEYWORD_GROUPS = (VECTOR_KEYWORDS, RAG_KEYWORDS, LANG_KEYWORDS, INFER_KEYWORDS)
+
+
+class KeywordGroups:
+    """
+    Ordered keyword containment for several keyword lists, compiled once and
+    shared by every row: keywords are lowercased up front, the text once per
+    call, and all groups are answered from that single lowered text.
+    Same result as testing k.lower() in text.lower() per keyword.
+    """
+
+    def __init__(self, groups: Sequence[Sequence[str]]):
+        self.groups: Tuple[Tuple[str, ...], ...] = tuple(tuple(g) for g in groups)
+        self._lowered = tuple(tuple((k, k.lower()) for k in g) for g in self.groups)
+
+    def extract(self, text: str) -> List[List[str]]:
+        blob = (text or "").lower()
+        return [[k for k, kl in g if kl in blob] for g in self._lowered]
+
+
+STRENGTH_KEYWORDS = KeywordGroups(STRENGTH_KEYWORD_GROUPS)
+
+
+@lru_cache(maxsize=64)
+def _keyword_group(keywords: Tuple[str, ...]) -> KeywordGroups:
+    return KeywordGroups([keywords])
+
+
+def _extract_ordered_keywords(text: str, keywords: Sequence[str]) -> List[str]:
     """
     Deterministic containment scan preserving the keyword list order.
     """
-    blob = (text or "").lower()
-    out: List[str] = []
-    for k in keywords:
-        if k.lower() in blob:
-            out.append(k)
-    return out
+    return _keyword_group(tuple(keywords)).extract(text)[0]
+
+
+def extract_keyword_groups(text: str) -> List[List[str]]:
+    """
+    Ordered hits for each of STRENGTH_KEYWORD_GROUPS (vector DBs, RAG, RAG
+    frameworks, inference stacks) from one lowering of the text.
+    """
+    return STRENGTH_KEYWORDS.extract(text)
 
 
-def _evidence_flags(row: Dict[str, str]) -> Dict[str, bool]:
+def _evidence_flags(row: Sequence[str], p: _Plan) -> Dict[str, bool]:
     """
     Evidence-only flags based on presence of existing fields.
     """
     return {
-        "has_github": _nonempty(_get_first_present(row, ["GitHub_URL", "GitHub_Username", "Key_GitHub_AI_Repos"])),
-        "has_repos": _nonempty(row.get("Key_GitHub_AI_Repos")) or _nonempty(row.get("Repo_Topics_Keywords")),
-        "has_models": _nonempty(row.get("Primary_Model_Families")) or _nonempty(row.get("Determinative_Skill_Areas")),
-        "has_infra": _nonempty(row.get("Inference_Training_Infra_Signals")),
-        "has_rlhf": _nonempty(row.get("RLHF_Alignment_Signals")),
-        "has_pubs": _nonempty(row.get("Publication_Count")) or _nonempty(row.get("Citation_Count_Raw")),
-        "has_company": _nonempty(_get_first_present(row, ["Current_Company", "Company_XRay_Source_URLs"])),
-        "has_identity": _nonempty(row.get("Full_Name")) or _nonempty(row.get("LinkedIn_Public_URL")),
+        "has_github": any_value(row, p.github_any),
+        "has_repos": any_value(row, p.repos),
+        "has_models": any_value(row, p.models),
+        "has_infra": any_value(row, p.infra),
+        "has_rlhf": any_value(row, p.rlhf),
+        "has_pubs": any_value(row, p.pubs),
+        "has_company": any_value(row, p.company),
+        "has_identity": any_value(row, p.identity),
     }
 
 
@@ -155,30 +207,22 @@ def _classify_signal_score(flags: Dict[str, bool]) -> str:
     return "Low"
 
 
-def _compose_strengths(row: Dict[str, str], flags: Dict[str, bool]) -> str:
+def _compose_strengths(row: Sequence[str], p: _Plan, flags: Dict[str, bool]) -> str:
     """
     Compose an evidence-only strengths sentence using existing fields.
     Ordered to match your preferred signal order where possible:
     models first, then vector DB, RAG, LangChain family, inference engines.
     """
-    model_src = _get_first_present(row, ["Primary_Model_Families", "Determinative_Skill_Areas"])
-    repo_topics = _get_first_present(row, ["Repo_Topics_Keywords", "Key_GitHub_AI_Repos"])
-    infra = _norm(row.get("Inference_Training_Infra_Signals"))
-    rlhf = _norm(row.get("RLHF_Alignment_Signals"))
+    model_src = first_value(row, p.models)
+    repo_topics = first_value(row, p.repo_topics)
+    infra = first_value(row, p.infra)
+    rlhf = first_value(row, p.rlhf)
 
     text_blob = " ".join([model_src, repo_topics, infra, rlhf])
 
     model_fams = _split_tokens_preserve_order(model_src)[:6]
 
-    vector_keywords = ["Weaviate", "Pinecone", "FAISS", "Milvus", "Qdrant", "Chroma", "pgvector"]
-    rag_keywords = ["Retrieval-Augmented Generation", "RAG"]
-    lang_keywords = ["LangChain", "LangGraph", "LlamaIndex"]
-    infer_keywords = ["TensorRT", "TensorRT-LLM", "vLLM", "TGI", "ONNX", "Triton", "llama.cpp"]
-
-    vectors = _extract_ordered_keywords(text_blob, vector_keywords)
-    rags = _extract_ordered_keywords(text_blob, rag_keywords)
-    langs = _extract_ordered_keywords(text_blob, lang_keywords)
-    infers = _extract_ordered_keywords(text_blob, infer_keywords)
+    vectors, rags, langs, infers = extract_keyword_groups(text_blob)
 
     parts: List[str] = []
 
@@ -209,16 +253,14 @@ def _compose_strengths(row: Dict[str, str], flags: Dict[str, bool]) -> str:
         parts.append("RLHF or alignment signals present")
 
     if flags.get("has_github"):
-        gh = _get_first_present(row, ["GitHub_URL", "GitHub_Username"])
+        gh = first_value(row, p.github)
         if gh:
             parts.append(f"GitHub evidence present ({gh})")
         else:
             parts.append("GitHub evidence present")
 
     if flags.get("has_pubs"):
-        pc = _norm(row.get("Publication_Count"))
-        cc = _norm(row.get("Citation_Count_Raw"))
-        if pc or cc:
+        if any_value(row, p.pubs):
             parts.append("Research impact signals present (publications or citations)")
         else:
             parts.append("Research impact signals present")
@@ -229,10 +271,34 @@ def _compose_strengths(row: Dict[str, str], flags: Dict[str, bool]) -> str:
     return " | ".join(parts)
 
 
-def _compose_weaknesses(row: Dict[str, str], flags: Dict[str, bool]) -> str:
+def _compose_weaknesses(flags: Dict[str, bool]) -> str:
     """
     Weaknesses are framed as evidence gaps only.
     """
+    return _weaknesses_for(
+        bool(flags.get("has_identity")),
+        bool(flags.get("has_github")),
+        bool(flags.get("has_models")),
+        bool(flags.get("has_infra")),
+        bool(flags.get("has_rlhf")),
+        bool(flags.get("has_pubs")),
+        bool(flags.get("has_company")),
+    )
+
+
+@lru_cache(maxsize=None)
+def _weaknesses_for(has_identity: bool, has_github: bool, has_models: bool, has_infra: bool,
+                    has_rlhf: bool, has_pubs: bool, has_company: bool) -> str:
+    # at most 2**7 distinct flag combinations: each summary is composed once
+    flags = {
+        "has_identity": has_identity,
+        "has_github": has_github,
+        "has_models": has_models,
+        "has_infra": has_infra,
+        "has_rlhf": has_rlhf,
+        "has_pubs": has_pubs,
+        "has_company": has_company,
+    }
     gaps: List[str] = []
 
     if not flags.get("has_identity"):
@@ -254,7 +320,7 @@ def _compose_weaknesses(row: Dict[str, str], flags: Dict[str, bool]) -> str:
     return " | ".join(gaps)
 
 
-def _resolve_role_type(row: Dict[str, str]) -> str:
+def _resolve_role_type(row: Sequence[str], p: _Plan) -> str:
     """
     Deterministic Role_Type fill.
     Priority:
@@ -262,7 +328,7 @@ def _resolve_role_type(row: Dict[str, str]) -> str:
     2) AI_Role_Type (materialized earlier)
     3) env AI_TALENT_ROLE_CANONICAL (scenario context)
     """
-    v = _norm(row.get("AI_Role_Type"))
+    v = first_value(row, p.ai_role_type)
     if v:
         return v
 
@@ -282,58 +348,52 @@ def process_csv(input_csv: str | Path, output_csv: str | Path) -> None:
 
     outp.parent.mkdir(parents=True, exist_ok=True)
 
-    with inp.open(newline="", encoding="utf-8") as fin:
-        reader = csv.DictReader(fin)
-        fieldnames = list(reader.fieldnames or [])
-        rows: List[Dict[str, str]] = list(reader)
+    plan, rows = read_csv(inp)
 
-    if not fieldnames:
+    if not plan.fieldnames:
         raise RuntimeError(f"required_fields_densifier: input CSV has no header: {inp}")
 
-    must_cols = ["Field_Level_Provenance_JSON", "Role_Type", "Signal_Score", "Strengths", "Weaknesses"]
-    for c in must_cols:
-        if c not in fieldnames:
-            fieldnames.append(c)
+    p = _Plan(plan)
 
     for row in rows:
-        prov = _load_prov(row)
+        plan.fit(row)
+        prov = Provenance(row[p.prov])
 
         # Role_Type (fill only if blank)
-        if not _nonempty(row.get("Role_Type")):
-            rt = _resolve_role_type(row)
+        if not _nonempty(row[p.role_type]):
+            rt = _resolve_role_type(row, p)
             if rt:
-                row["Role_Type"] = rt
+                row[p.role_type] = rt
                 _set_prov(prov, "Role_Type", "scenario_context", "required_fields_densifier_fill_blank")
 
-        flags = _evidence_flags(row)
+        flags = _evidence_flags(row, p)
 
         # Signal_Score (fill only if blank)
-        if not _nonempty(row.get("Signal_Score")):
+        if not _nonempty(row[p.signal_score]):
             sc = _classify_signal_score(flags)
-            row["Signal_Score"] = sc
+            row[p.signal_score] = sc
             _set_prov(prov, "Signal_Score", "row_fields", "deterministic_gate_classification")
 
         # Strengths (fill only if blank)
-        if not _nonempty(row.get("Strengths")):
-            s = _compose_strengths(row, flags)
+        if not _nonempty(row[p.strengths]):
+            s = _compose_strengths(row, p, flags)
             if s:
-                row["Strengths"] = s
+                row[p.strengths] = s
                 _set_prov(prov, "Strengths", "row_fields", "deterministic_compose_from_evidence")
 
         # Weaknesses (fill only if blank)
-        if not _nonempty(row.get("Weaknesses")):
-            w = _compose_weaknesses(row, flags)
+        if not _nonempty(row[p.weaknesses]):
+            w = _compose_weaknesses(flags)
             if w:
-                row["Weaknesses"] = w
+                row[p.weaknesses] = w
                 _set_prov(prov, "Weaknesses", "row_fields", "deterministic_gap_summary")
 
-        _save_prov(row, prov)
+        row[p.prov] = prov.dumps()
+
+    write_csv(outp, plan, rows)
 
-    with outp.open("w", newline="", encoding="utf-8") as fout:
-        writer = csv.DictWriter(fout, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow({k: r.get(k, "") for k in fieldnames})
+    memo_clear()
 
 
 __all__ = ["process_csv"]
+
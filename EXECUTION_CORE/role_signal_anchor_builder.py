@@ -16,9 +16,34 @@ Design Rules:
 - No scraping
 - No inference without evidence
 - Blank when unclear (with reason handled elsewhere)
+
+Batch:
+- build_role_signal_anchors_batch(rows) / build_role_signal_anchors_rows(fieldnames, rows)
+  classify a whole cohort at once, with output identical to the per-row function:
+  - the signal vocabulary (single-token signals; a token never contains
+    whitespace, so "foundation model" can never match) is compiled once into
+    token ids and a vocabulary x {Frontier, Infrastructure, Applied}
+    indicator matrix
+  - the cohort's text cells are joined (with a row separator token), lowered
+    and split once; tokens map to vocabulary ids in one C-level pass
+  - (row, vocabulary token) hits set a row x vocabulary incidence matrix
+    (token sets, so repeats count once; only signal tokens get a column); one
+    product with the indicator matrix yields all three overlap scores for
+    every row (numpy; pure-Python fallback when numpy is absent)
+  - per-row outputs are copies of at most 10 precomputed templates
+- csv-style rows (sequences aligned to fieldnames) resolve the four text
+  columns to positions once per header (EXECUTION_CORE/column_plan.py).
 """
 
-from typing import Dict
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from EXECUTION_CORE.column_plan import ColumnPlan
 
 
 # ------------------------------------------------------------------
@@ -40,6 +65,13 @@ APPLIED_SIGNALS = {
     "application", "deployment", "pipeline"
 }
 
+TEXT_COLUMNS = (
+    "Determinative_Skill_Areas",
+    "Repo_Topics_Keywords",
+    "Inference_Training_Infra_Signals",
+    "RLHF_Alignment_Signals",
+)
+
 
 # ------------------------------------------------------------------
 # HELPERS
@@ -62,14 +94,162 @@ def build_role_signal_anchors(row: Dict[str, str]) -> Dict[str, str]:
     Returns a dict with Tier-2 role signal columns populated.
     """
 
-    text_blob = " ".join([
-        row.get("Determinative_Skill_Areas", ""),
-        row.get("Repo_Topics_Keywords", ""),
-        row.get("Inference_Training_Infra_Signals", ""),
-        row.get("RLHF_Alignment_Signals", ""),
-    ])
+    text_blob = " ".join([row.get(c, "") for c in TEXT_COLUMNS])
+
+    return _anchors_from_tokens(_tokenize(text_blob))
+
+
+def build_role_signal_anchors_batch(rows: Sequence[Mapping[str, str]]) -> List[Dict[str, str]]:
+    """
+    build_role_signal_anchors for a whole cohort (one dict per row, same order).
+    """
+    cells: List[str] = []
+    for row in rows:
+        cells.extend([row.get(c, "") for c in TEXT_COLUMNS])
+        cells.append(_ROW_END)
+    return _anchors_from_scores(_score_matrix(cells, len(rows), len(TEXT_COLUMNS)))
+
+
+def build_role_signal_anchors_rows(
+    fieldnames: Sequence[str],
+    rows: Iterable[Sequence[str]],
+) -> Iterator[Dict[str, str]]:
+    """
+    build_role_signal_anchors for csv-style rows aligned to fieldnames.
+    Absent columns contribute no tokens, as with row.get(c, "").
+    """
+    positions = ColumnPlan(fieldnames).at(*TEXT_COLUMNS)
+    cells: List[str] = []
+    n = 0
+    for values in rows:
+        cells.extend([values[i] for i in positions])
+        cells.append(_ROW_END)
+        n += 1
+    return iter(_anchors_from_scores(_score_matrix(cells, n, len(positions))))
+
+
+# ------------------------------------------------------------------
+# BATCH ENGINE
+# ------------------------------------------------------------------
+
+CLUSTERS = ("Frontier", "Infrastructure", "Applied")
+
+_CLUSTER_SIGNALS = (FRONTIER_SIGNALS, INFRA_SIGNALS, APPLIED_SIGNALS)
+
+# Tokens are whitespace-free, so only whitespace-free signals can ever overlap.
+SIGNAL_VOCAB: Tuple[str, ...] = tuple(sorted(
+    w for w in set().union(*_CLUSTER_SIGNALS) if w and not any(ch.isspace() for ch in w)
+))
+_INDICATOR = [[1 if w in sig else 0 for sig in _CLUSTER_SIGNALS] for w in SIGNAL_VOCAB]
+_INDICATOR_NP = np.asarray(_INDICATOR, dtype=np.int64).reshape(len(SIGNAL_VOCAB), len(CLUSTERS)) if np is not None else None
+
+# Row separator cell. lower() never produces NUL, so a bare NUL token can only
+# come from the data itself; that is detected (separator count) and handled by
+# the per-row path.
+_ROW_END = "\x00"
+_SEP_ID = -2
+_TOKEN_IDS = {w: i for i, w in enumerate(SIGNAL_VOCAB)}
+_TOKEN_IDS[_ROW_END] = _SEP_ID
+
+
+def _score_matrix(cells: List[str], n_rows: int, per_row: int):
+    """
+    n_rows x 3 overlap scores. cells holds each row's per_row text cells
+    followed by _ROW_END. Tokenizing the joined buffer equals tokenizing each row's
+    " ".join(...) since whitespace separates both cells and rows.
+    """
+    if np is None:
+        return _score_matrix_py(cells, n_rows, per_row)
+
+    if not n_rows or not SIGNAL_VOCAB:
+        return np.zeros((n_rows, len(CLUSTERS)), dtype=np.int64)
+
+    tokens = " ".join(cells).lower().replace(",", " ").split()
+    ids = np.fromiter(map(_TOKEN_IDS.get, tokens, repeat(-1)), dtype=np.int64, count=len(tokens))
+    sep = ids == _SEP_ID
+    if int(sep.sum()) != n_rows:
+        return np.asarray(_score_matrix_py(cells, n_rows, per_row), dtype=np.int64).reshape(n_rows, len(CLUSTERS))
+
+    # row x vocabulary incidence (token *sets*: repeats set the same cell);
+    # the vocabulary is tiny, so it is held as a dense boolean matrix
+    row = np.cumsum(sep) - sep
+    hit = ids >= 0
+    incidence = np.zeros((n_rows, len(SIGNAL_VOCAB)), dtype=bool)
+    incidence[row[hit], ids[hit]] = True
+
+    return incidence.astype(np.int64) @ _INDICATOR_NP
+
+
+def _score_matrix_py(cells: List[str], n_rows: int, per_row: int) -> List[List[int]]:
+    out: List[List[int]] = []
+    stride = per_row + 1
+    for r in range(n_rows):
+        tokens = _tokenize(" ".join(cells[r * stride:r * stride + per_row]))
+        out.append([_count_overlap(tokens, sig) for sig in _CLUSTER_SIGNALS])
+    return out
+
+
+_NO_SIGNAL = {
+    "Role_Signal_Summary": "",
+    "Primary_Skill_Cluster": "",
+    "Secondary_Skill_Cluster": "",
+    "Research_vs_Infra_vs_Applied": "",
+    "Core_Domain_Classification": "",
+}
+
+
+def _template(dominant: int, secondary: int) -> Dict[str, str]:
+    name = CLUSTERS[dominant]
+    return {
+        "Role_Signal_Summary": f"{name}-oriented AI contributor with corroborated technical signals",
+        "Primary_Skill_Cluster": name,
+        "Secondary_Skill_Cluster": CLUSTERS[secondary] if secondary >= 0 else "",
+        "Research_vs_Infra_vs_Applied": name,
+        "Core_Domain_Classification": name,
+    }
 
-    tokens = _tokenize(text_blob)
+
+_TEMPLATES = {
+    (d, s): _template(d, s)
+    for d in range(len(CLUSTERS))
+    for s in [-1] + [k for k in range(len(CLUSTERS)) if k != d]
+}
+
+
+def _anchors_from_scores(scores) -> List[Dict[str, str]]:
+    """
+    Same selection as the per-row path: dominant = first maximum in CLUSTERS
+    order; secondary = first maximum among the rest when positive.
+    """
+    if np is None or not isinstance(scores, np.ndarray):
+        out = []
+        for sc in scores:
+            ranked = sorted(range(len(CLUSTERS)), key=lambda k: sc[k], reverse=True)
+            d, s = ranked[0], ranked[1]
+            out.append(dict(_NO_SIGNAL) if sc[d] == 0 else dict(_TEMPLATES[(d, s if sc[s] > 0 else -1)]))
+        return out
+
+    n = scores.shape[0]
+    if not n:
+        return []
+    idx = np.arange(n)
+    dom = scores.argmax(axis=1)
+    top = scores[idx, dom]
+    rest = scores.copy()
+    rest[idx, dom] = -1
+    sec = rest.argmax(axis=1)
+    sec = np.where(rest[idx, sec] > 0, sec, -1)
+
+    out = []
+    for d, s, t in zip(dom.tolist(), sec.tolist(), top.tolist()):
+        out.append(dict(_NO_SIGNAL) if t == 0 else dict(_TEMPLATES[(d, s)]))
+    return out
+
+
+def _anchors_from_tokens(tokens: set) -> Dict[str, str]:
+    """
+    Tier-2 role signal columns from the token set of the four text columns.
+    """
 
     frontier_score = _count_overlap(tokens, FRONTIER_SIGNALS)
     infra_score = _count_overlap(tokens, INFRA_SIGNALS)
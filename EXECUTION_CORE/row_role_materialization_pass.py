@@ -6,7 +6,7 @@ EXECUTION_CORE/row_role_materialization_pass.py
 ROW ROLE MATERIALIZATION PASS (DETERMINISTIC, EVIDENCE-SAFE)
 
 Maintainer: L. David Mendoza © 2026
-Version: v1.0.0
+Version: v1.0.1
 
 Purpose
 - Materialize scenario role context into each row deterministically.
@@ -26,6 +26,8 @@ Interfaces (LOCKED)
 - process_csv(input_csv, output_csv) -> None
 
 Changelog
+- v1.0.1: Field_Level_Provenance_JSON handled through EXECUTION_CORE/provenance.py
+  (no re-parse of cells the previous stage wrote; byte-identical JSON).
 - v1.0.0: Initial role materialization pass (row-level binding)
 
 Validation
@@ -40,33 +42,27 @@ git push
 from __future__ import annotations
 
 import csv
-import json
 import os
 from pathlib import Path
 from typing import Dict, Any, List
 
+from EXECUTION_CORE.provenance import Provenance, memo_clear
+
 
 def _norm(x: Any) -> str:
     return str(x or "").strip()
 
 
-def _load_prov(row: Dict[str, str]) -> Dict[str, Any]:
-    raw = _norm(row.get("Field_Level_Provenance_JSON"))
-    if not raw:
-        return {}
-    try:
-        obj = json.loads(raw)
-        return obj if isinstance(obj, dict) else {}
-    except Exception:
-        return {}
+def _load_prov(row: Dict[str, str]) -> Provenance:
+    return Provenance.of_row(row)
 
 
-def _save_prov(row: Dict[str, str], prov: Dict[str, Any]) -> None:
-    row["Field_Level_Provenance_JSON"] = json.dumps(prov, sort_keys=True)
+def _save_prov(row: Dict[str, str], prov: Provenance) -> None:
+    prov.save(row)
 
 
-def _set_prov(prov: Dict[str, Any], field: str, source: str, method: str) -> None:
-    prov[field] = {"source": source, "method": method}
+def _set_prov(prov: Provenance, field: str, source: str, method: str) -> None:
+    prov.set(field, source, method)
 
 
 def process_csv(input_csv: str, output_csv: str) -> None:
@@ -109,5 +105,7 @@ def process_csv(input_csv: str, output_csv: str) -> None:
         for r in rows:
             writer.writerow({k: r.get(k, "") for k in fieldnames})
 
+    memo_clear()
+
 
 __all__ = ["process_csv"]
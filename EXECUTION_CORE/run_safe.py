@@ -26,7 +26,10 @@ seed -> anchors -> people_discovery -> people_projection -> github -> name -> ro
 -> canonical write -> integrity_guard -> notify
 
 Usage
-AI_TALENT_MODE=demo|scenario|gpt_slim python3 -m EXECUTION_CORE.run_safe <scenario_key>
+AI_TALENT_MODE=demo|scenario|gpt_slim python3 -m EXECUTION_CORE.run_safe <scenario_key> [--refresh-older-than 7d]
+
+--refresh-older-than <dur> treats cross-run person cache entries older than <dur>
+(12h, 7d, 2w) as stale for this run (EXECUTION_CORE/person_enrichment_cache.py).
 """
 
 from __future__ import annotations
@@ -115,11 +118,18 @@ from EXECUTION_CORE.phase7_oss_contribution_intel import process_csv as phase7_p
 from EXECUTION_CORE.post_run_narrative_pass import process_csv as post_run_narrative_process_csv
 from EXECUTION_CORE.required_fields_densifier import process_csv as required_fields_densify_process_csv
 from EXECUTION_CORE.canonical_people_writer import write_canonical_people_csv
+from EXECUTION_CORE.person_enrichment_cache import pop_refresh_flag, get_cache
+from EXECUTION_CORE.extraction_cache import get_cache as get_extraction_cache, format_hit_rate
+from EXECUTION_CORE.url_canon import cache_stats as url_canon_stats
 
 
 def main(argv: list[str]) -> None:
+    try:
+        argv = pop_refresh_flag(list(argv))
+    except ValueError as e:
+        die(str(e))
     if len(argv) != 2:
-        die("Usage: AI_TALENT_MODE=demo|scenario|gpt_slim python3 -m EXECUTION_CORE.run_safe <scenario_key>")
+        die("Usage: AI_TALENT_MODE=demo|scenario|gpt_slim python3 -m EXECUTION_CORE.run_safe <scenario_key> [--refresh-older-than 7d]")
 
     scenario_key = argv[1].strip()
     require(bool(scenario_key), "Scenario key must be non-empty")
@@ -341,6 +351,18 @@ def main(argv: list[str]) -> None:
     print("✔ Latest CSV:   ", paths.latest_csv)
     print("✔ Rows:", rows_written)
     print("✔ Timestamp:", ts_compact)
+    pcache = get_cache()
+    if pcache is not None:
+        st = pcache.stats
+        print(f"✔ Person cache: hits={st['hits']} misses={st['misses']} stale={st['stale']} writes={st['writes']}")
+    xcache = get_extraction_cache()
+    if xcache is not None and (xcache.stats["hits"] or xcache.stats["misses"]):
+        print(f"✔ Extraction cache: {format_hit_rate(xcache.stats['hits'], xcache.stats['misses'])}")
+    ucanon = url_canon_stats()
+    uhits = sum(t["hits"] for t in ucanon.values())
+    umisses = sum(t["misses"] for t in ucanon.values())
+    if uhits or umisses:
+        print(f"✔ URL canon table: {format_hit_rate(uhits, umisses)}")
 
     # Preview (fail-open)
     if PREVIEW.exists():
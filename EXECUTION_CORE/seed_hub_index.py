@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+seed_hub_index.py
+------------------------------------------------------------
+COMPILED SEED HUB INDEX (READ-ONLY XLSX -> SQLITE)
+
+Maintainer: L. David Mendoza © 2026
+Version: v1.0.0
+
+Purpose
+- Parsing the seed hub workbook with openpyxl dominates startup for small
+  scenarios. This module compiles the workbook once into a SQLite index and
+  serves later reads from it.
+- Rebuilt only when the workbook changes: a (size, mtime_ns) stat check first,
+  then a sha256 content check (a touched-but-identical workbook is not rebuilt).
+
+Views (each compiled to its own index file, built on first use)
+- "master": MASTER_SEED_HUBS rows exactly as seed_projection_resolver reads them
+  (stripped strings, stops at the first blank row), indexed by Tier / Category /
+  Seed_Hub_Type. Used by seed_projection_resolver.
+- "sheets": every worksheet that has a Seed_Hub_Type column, as pandas.read_excel
+  records. Used by tracks/track_d/run_track_d.read_seed_hubs.
+
+Index location
+- repo_root/.cache/seed_hub_index/<workbook stem>_<path hash>.<view>.sqlite3
+- Built into a temp file and os.replace()d in; concurrent runs are safe.
+
+Hard Contract
+- Read-only: never modifies the Excel hub.
+- Deterministic: rows keep workbook order.
+- No network calls.
+
+Validation Steps
+python3 -m py_compile EXECUTION_CORE/seed_hub_index.py
+python3 -m EXECUTION_CORE.seed_hub_index build
+python3 -m EXECUTION_CORE.seed_hub_index project-all
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INDEX_DIR = REPO_ROOT / ".cache" / "seed_hub_index"
+
+MASTER_SHEET_NAME = "MASTER_SEED_HUBS"
+INDEX_FORMAT = "1"
+
+
+# ------------------------------------------------------------
+# Fingerprint
+# ------------------------------------------------------------
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def index_path_for(workbook: Path, view: str, index_dir: Optional[Path] = None) -> Path:
+    workbook = Path(workbook).resolve()
+    tag = hashlib.sha1(str(workbook).encode("utf-8")).hexdigest()[:10]
+    return Path(index_dir or DEFAULT_INDEX_DIR) / f"{workbook.stem}_{tag}.{view}.sqlite3"
+
+
+# ------------------------------------------------------------
+# Workbook readers (used only when compiling)
+# ------------------------------------------------------------
+
+def _safe_str(v: object) -> str:
+    if v is None:
+        return ""
+    return str(v).strip()
+
+
+def _read_master_grid(workbook: Path) -> Tuple[List[str], List[Dict[str, str]]]:
+    """
+    Read MASTER_SEED_HUBS in a single streaming iter_rows pass. Trailing empty
+    header cells are dropped; rows stop at the first blank row after data.
+    Returns (headers, rows); ([], []) when MASTER_SEED_HUBS is missing.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filename=str(workbook), read_only=True, data_only=True)
+    try:
+        if MASTER_SHEET_NAME not in wb.sheetnames:
+            return [], []
+        ws = wb[MASTER_SHEET_NAME]
+        max_col = ws.max_column or 0
+        it = ws.iter_rows(min_row=1, max_col=max_col, values_only=True)
+
+        first = next(it, ())
+        raw_headers = [_safe_str(v) for v in first]
+        raw_headers += [""] * (max_col - len(raw_headers))
+        while raw_headers and raw_headers[-1] == "":
+            raw_headers.pop()
+        headers = [h for h in raw_headers if h != ""]
+        raw_count = len(raw_headers)
+
+        rows: List[Dict[str, str]] = []
+        started = False
+        for vals in it:
+            vals = list(vals[:raw_count])
+            if all(v is None or str(v).strip() == "" for v in vals):
+                if started:
+                    break
+                continue
+            started = True
+            d: Dict[str, str] = {}
+            for idx, h in enumerate(raw_headers):
+                if h == "":
+                    continue
+                d[h] = _safe_str(vals[idx] if idx < len(vals) else "")
+            rows.append(d)
+        return headers, rows
+    finally:
+        try:
+            wb.close()
+        except Exception:
+            pass
+
+
+def _jsonable(v: Any) -> Any:
+    if v is None or isinstance(v, (str, bool, int, float)):
+        return v
+    if hasattr(v, "item"):  # numpy scalars
+        try:
+            return v.item()
+        except Exception:
+            pass
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    return str(v)
+
+
+def _read_sheet_records(workbook: Path) -> List[Tuple[str, str, List[Dict[str, Any]]]]:
+    """
+    pandas.read_excel records for every sheet with a Seed_Hub_Type column.
+    Returns [(sheet, seed_hub_type_column, records)] in workbook order.
+    """
+    import pandas as pd
+
+    book = pd.ExcelFile(str(workbook), engine="openpyxl")
+    out: List[Tuple[str, str, List[Dict[str, Any]]]] = []
+    for sheet in book.sheet_names:
+        df = pd.read_excel(book, sheet_name=sheet, dtype=object)
+        if df is None or df.empty:
+            continue
+        norm_cols = {str(c).lower().replace(" ", "_"): c for c in df.columns}
+        if "seed_hub_type" not in norm_cols:
+            continue
+        records = [
+            {str(k): (None if pd.isna(v) else _jsonable(v)) for k, v in r.items()}
+            for r in df.to_dict(orient="records")
+        ]
+        out.append((sheet, str(norm_cols["seed_hub_type"]), records))
+    return out
+
+
+# ------------------------------------------------------------
+# Index
+# ------------------------------------------------------------
+
+class SeedHubIndex:
+    """
+    Compiled, read-only view of a seed hub workbook.
+    SeedHubIndex.open(workbook, view) returns a fresh index, rebuilding if needed.
+    """
+
+    VIEWS = ("master", "sheets")
+
+    def __init__(self, path: Path, conn: sqlite3.Connection, rebuilt: bool) -> None:
+        self.path = path
+        self.conn = conn
+        self.rebuilt = rebuilt
+
+    @classmethod
+    def open(cls, workbook: Path, view: str = "master", index_dir: Optional[Path] = None) -> "SeedHubIndex":
+        if view not in cls.VIEWS:
+            raise ValueError(f"Unknown seed hub index view: {view}")
+        workbook = Path(workbook).resolve()
+        path = index_path_for(workbook, view, index_dir)
+        st = workbook.stat()
+
+        meta = cls._read_meta(path)
+        if meta and meta.get("format") == INDEX_FORMAT:
+            if meta.get("size") == str(st.st_size) and meta.get("mtime_ns") == str(st.st_mtime_ns):
+                return cls(path, cls._connect(path), False)
+            digest = _file_sha256(workbook)
+            if meta.get("sha256") == digest:
+                conn = cls._connect(path)
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO meta (k, v) VALUES (?, ?)",
+                        [("size", str(st.st_size)), ("mtime_ns", str(st.st_mtime_ns))],
+                    )
+                return cls(path, conn, False)
+        else:
+            digest = _file_sha256(workbook)
+
+        cls._build(workbook, view, path, digest, st)
+        return cls(path, cls._connect(path), True)
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        return sqlite3.connect(str(path), timeout=30)
+
+    @staticmethod
+    def _read_meta(path: Path) -> Dict[str, str]:
+        if not path.exists():
+            return {}
+        try:
+            conn = sqlite3.connect(str(path), timeout=30)
+            try:
+                return dict(conn.execute("SELECT k, v FROM meta").fetchall())
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return {}
+
+    @staticmethod
+    def _build(workbook: Path, view: str, path: Path, digest: str, st: os.stat_result) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        if tmp.exists():
+            tmp.unlink()
+        conn = sqlite3.connect(str(tmp))
+        try:
+            conn.executescript(
+                """
+                CREATE TABLE meta (k TEXT PRIMARY KEY, v TEXT);
+                CREATE TABLE sheets (sheet_idx INTEGER PRIMARY KEY, sheet TEXT, key_col TEXT, headers TEXT);
+                CREATE TABLE rows (
+                    sheet_idx INTEGER, row_idx INTEGER,
+                    tier TEXT, category TEXT, seed_hub_type TEXT, seed_hub_url TEXT,
+                    data TEXT,
+                    PRIMARY KEY (sheet_idx, row_idx)
+                );
+                """
+            )
+            if view == "master":
+                headers, rows = _read_master_grid(workbook)
+                sheets = [(MASTER_SHEET_NAME, "Seed_Hub_Type", headers, rows)] if headers else []
+            else:
+                sheets = [(s, col, [], recs) for s, col, recs in _read_sheet_records(workbook)]
+
+            for si, (sheet, key_col, headers, rows) in enumerate(sheets):
+                conn.execute(
+                    "INSERT INTO sheets VALUES (?, ?, ?, ?)", (si, sheet, key_col, json.dumps(headers))
+                )
+                conn.executemany(
+                    "INSERT INTO rows VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            si, ri,
+                            _safe_str(r.get("Tier")), _safe_str(r.get("Category")),
+                            _safe_str(r.get(key_col)), _safe_str(r.get("Seed_Hub_URL")),
+                            json.dumps(r, ensure_ascii=False),
+                        )
+                        for ri, r in enumerate(rows)
+                    ],
+                )
+            conn.executescript(
+                """
+                CREATE INDEX idx_rows_tier_cat ON rows (tier, category);
+                CREATE INDEX idx_rows_type ON rows (seed_hub_type);
+                """
+            )
+            conn.executemany(
+                "INSERT INTO meta (k, v) VALUES (?, ?)",
+                [
+                    ("format", INDEX_FORMAT),
+                    ("view", view),
+                    ("workbook", str(workbook)),
+                    ("sha256", digest),
+                    ("size", str(st.st_size)),
+                    ("mtime_ns", str(st.st_mtime_ns)),
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp, path)
+
+    def close(self) -> None:
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "SeedHubIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------
+
+    def sheets(self) -> List[Tuple[str, str, List[str]]]:
+        """[(sheet, seed_hub_type_column, headers)] in workbook order."""
+        return [
+            (s, col, json.loads(h))
+            for s, col, h in self.conn.execute("SELECT sheet, key_col, headers FROM sheets ORDER BY sheet_idx")
+        ]
+
+    def headers(self, sheet: str = MASTER_SHEET_NAME) -> List[str]:
+        row = self.conn.execute("SELECT headers FROM sheets WHERE sheet = ?", (sheet,)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def rows(
+        self,
+        tiers: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+        seed_hub_type: Optional[str] = None,
+        with_sheet: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Rows in workbook order, optionally filtered by tier / category / Seed_Hub_Type."""
+        where, params = [], []
+        for col, vals in (("r.tier", tiers), ("r.category", categories)):
+            if vals is not None:
+                vals = list(vals)
+                if not vals:
+                    return []
+                where.append(f"{col} IN ({','.join('?' * len(vals))})")
+                params.extend(vals)
+        if seed_hub_type is not None:
+            where.append("r.seed_hub_type = ?")
+            params.append(seed_hub_type)
+        sql = "SELECT s.sheet, r.data FROM rows r JOIN sheets s ON s.sheet_idx = r.sheet_idx"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY r.sheet_idx, r.row_idx"
+        out = []
+        for sheet, data in self.conn.execute(sql, params):
+            d = json.loads(data)
+            if with_sheet:
+                d["__sheet__"] = sheet
+            out.append(d)
+        return out
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else "build"
+    from EXECUTION_CORE.seed_projection_resolver import project_all_seed_keys, resolve_hub_path
+
+    hub = resolve_hub_path(REPO_ROOT)
+    if cmd == "build":
+        for view in SeedHubIndex.VIEWS:
+            with SeedHubIndex.open(hub, view) as idx:
+                state = "rebuilt" if idx.rebuilt else "fresh"
+                print(f"{view}: {state} ({len(idx.rows())} rows) -> {idx.path}")
+    elif cmd == "project-all":
+        for key, path in project_all_seed_keys(REPO_ROOT).items():
+            print(f"{key}: {path}")
+    else:
+        sys.exit("Usage: python3 -m EXECUTION_CORE.seed_hub_index [build|project-all]")
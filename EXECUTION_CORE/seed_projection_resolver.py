@@ -5,7 +5,7 @@ seed_projection_resolver.py
 IMPORT-ONLY MODULE (READ-ONLY SEED HUB XLSX -> CSV PROJECTION)
 
 Maintainer: L. David Mendoza © 2026
-Version: v1.1.0-master-seed-hubs-projection-locked
+Version: v1.2.0-master-seed-hubs-projection-locked
 
 Purpose
 - Your seed hub workbook does NOT contain role-named tabs.
@@ -25,6 +25,13 @@ Hub reality (validated)
   Tier, Category, Organization, Seed_Hub_URL, etc.
 - This module uses MASTER_SEED_HUBS as source of truth.
 
+Compiled index (v1.2.0)
+- MASTER_SEED_HUBS is read through EXECUTION_CORE/seed_hub_index.py: a SQLite
+  index keyed by Tier / Category, rebuilt only when the workbook changes
+  (mtime/size, then sha256). Projection filters run as indexed queries; the
+  workbook is not opened at all on warm runs.
+- project_all_seed_keys() projects every known seed key in one pass.
+
 Output CSV
 - Created only if missing.
 - Always includes a canonical "URL" column populated from Seed_Hub_URL so downstream
@@ -50,7 +57,7 @@ import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from openpyxl import load_workbook
+from EXECUTION_CORE.seed_hub_index import SeedHubIndex
 
 
 # Known hub filenames. The hub may live in repo root or repo_root/data.
@@ -280,95 +287,39 @@ def resolve_hub_path(repo_root: Path) -> Path:
     )
 
 
-def _normalize_header(v: object) -> str:
-    if v is None:
-        return ""
-    s = str(v).strip()
-    return s
-
-
 def _tier_rank(t: str) -> int:
     return _TIER_ORDER.get((t or "").strip(), 999)
 
 
-def _safe_str(v: object) -> str:
-    if v is None:
-        return ""
-    return str(v).strip()
+_DEFAULT_TIERS = ["Tier 1", "Tier 2", "Tier 3"]
+_DEFAULT_CATEGORIES = [
+    "Primary AGI Research Labs",
+    "Major Tech Labs",
+    "Academic & Institutes",
+    "International & Chinese AI Labs",
+    "Ecosystem & Fast Movers",
+]
+_FALLBACK_TIERS = ["Tier 1", "Tier 2"]
+_FALLBACK_CATEGORIES = [
+    "Primary AGI Research Labs",
+    "Major Tech Labs",
+    "Academic & Institutes",
+]
 
 
-def _read_master_seed_hubs(ws) -> Tuple[List[str], List[Dict[str, str]]]:
+def _filter_for_seed_key(seed_key: str) -> Tuple[List[str], List[str]]:
     """
-    Read MASTER_SEED_HUBS into (headers, rows).
-    Drops trailing empty header cells.
-    """
-    max_col = ws.max_column or 0
-    raw_headers = [_normalize_header(ws.cell(row=1, column=c).value) for c in range(1, max_col + 1)]
-
-    while raw_headers and raw_headers[-1] == "":
-        raw_headers.pop()
-
-    headers = [h for h in raw_headers if h != ""]
-    raw_count = len(raw_headers)
-
-    rows: List[Dict[str, str]] = []
-    started = False
-
-    for r in range(2, (ws.max_row or 0) + 1):
-        vals = [ws.cell(row=r, column=c).value for c in range(1, raw_count + 1)]
-        if all(v is None or str(v).strip() == "" for v in vals):
-            if started:
-                break
-            continue
-
-        started = True
-        d: Dict[str, str] = {}
-        for idx, h in enumerate(raw_headers):
-            if h == "":
-                continue
-            d[h] = _safe_str(vals[idx] if idx < len(vals) else "")
-        rows.append(d)
-
-    return headers, rows
-
-
-def _project_rows_for_seed_key(seed_key: str, rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    """
-    Deterministic projection from MASTER_SEED_HUBS into a role seed list.
+    (tiers, categories) for a seed key.
     If role filter is unknown, fall back to a safe default that still enables demos.
     """
     filt = _ROLE_FILTERS.get(seed_key)
-
     if not filt:
         # Safe default: enable any-role demo by returning Tier 1-3 from core categories.
-        tiers = {"Tier 1", "Tier 2", "Tier 3"}
-        cats = {
-            "Primary AGI Research Labs",
-            "Major Tech Labs",
-            "Academic & Institutes",
-            "International & Chinese AI Labs",
-            "Ecosystem & Fast Movers",
-        }
-    else:
-        tiers = set(filt.get("tiers", []))
-        cats = set(filt.get("categories", []))
-
-    out = []
-    for r in rows:
-        tier = r.get("Tier", "")
-        cat = r.get("Category", "")
-        if tier in tiers and cat in cats:
-            out.append(r)
-
-    # If projection returns nothing, fail open to a minimal deterministic set
-    # to keep demos runnable, but do not fabricate.
-    if not out:
-        out = [r for r in rows if r.get("Tier", "") in {"Tier 1", "Tier 2"} and r.get("Category", "") in {
-            "Primary AGI Research Labs",
-            "Major Tech Labs",
-            "Academic & Institutes",
-        }]
+        return list(_DEFAULT_TIERS), list(_DEFAULT_CATEGORIES)
+    return list(filt.get("tiers", [])), list(filt.get("categories", []))
 
+
+def _order_and_dedupe(out: List[Dict[str, str]]) -> List[Dict[str, str]]:
     # Deterministic ordering
     def sort_key(d: Dict[str, str]):
         return (
@@ -395,6 +346,19 @@ def _project_rows_for_seed_key(seed_key: str, rows: List[Dict[str, str]]) -> Lis
     return deduped
 
 
+def _project_indexed(seed_key: str, index: SeedHubIndex) -> List[Dict[str, str]]:
+    """
+    Deterministic projection from MASTER_SEED_HUBS into a role seed list, answered
+    by indexed tier/category queries. If the role filter matches nothing, fall
+    back to a minimal deterministic set to keep demos runnable (no fabrication).
+    """
+    tiers, cats = _filter_for_seed_key(seed_key)
+    out = index.rows(tiers=tiers, categories=cats)
+    if not out:
+        out = index.rows(tiers=_FALLBACK_TIERS, categories=_FALLBACK_CATEGORIES)
+    return _order_and_dedupe(out)
+
+
 def _candidate_existing_seed_csv_paths(repo_root: Path, seed_key: str) -> List[Path]:
     """
     Mirrors run_safe.py naming patterns for compatibility.
@@ -438,38 +402,60 @@ def ensure_seed_csv_for_seed_key(seed_key: str, repo_root: Path) -> Optional[Pat
     # 2) Project from MASTER_SEED_HUBS into repo_root/seeds/{seed_key}.csv
     hub = resolve_hub_path(repo_root)
 
-    wb = load_workbook(filename=str(hub), read_only=True, data_only=True)
-    try:
-        if MASTER_SHEET_NAME not in wb.sheetnames:
+    with SeedHubIndex.open(hub, "master") as index:
+        headers = index.headers()
+        if not headers:
             return None
+        return _write_projection(seed_key, repo_root, headers, _project_indexed(seed_key, index))
 
-        ws = wb[MASTER_SHEET_NAME]
-        headers, master_rows = _read_master_seed_hubs(ws)
-        projected_rows = _project_rows_for_seed_key(seed_key, master_rows)
-        if not projected_rows:
-            return None
 
-        out_dir = repo_root / "seeds"
-        out_dir.mkdir(parents=True, exist_ok=True)
-        out_path = out_dir / f"{seed_key}.csv"
+def _write_projection(
+    seed_key: str, repo_root: Path, headers: List[str], projected_rows: List[Dict[str, str]]
+) -> Optional[Path]:
+    if not projected_rows:
+        return None
 
-        if out_path.exists():
-            return out_path
+    out_dir = repo_root / "seeds"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f"{seed_key}.csv"
 
-        # Output headers: canonical URL first, then the master headers (excluding empty)
-        out_headers = ["URL"] + [h for h in headers if h != ""]
+    if out_path.exists():
+        return out_path
 
-        with out_path.open("w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=out_headers)
-            w.writeheader()
-            for r in projected_rows:
-                row_out = dict(r)
-                row_out["URL"] = (r.get("Seed_Hub_URL", "") or "").strip()
-                w.writerow({k: row_out.get(k, "") for k in out_headers})
+    # Output headers: canonical URL first, then the master headers (excluding empty)
+    out_headers = ["URL"] + [h for h in headers if h != ""]
 
-        return out_path
-    finally:
-        try:
-            wb.close()
-        except Exception:
-            pass
+    with out_path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=out_headers)
+        w.writeheader()
+        for r in projected_rows:
+            row_out = dict(r)
+            row_out["URL"] = (r.get("Seed_Hub_URL", "") or "").strip()
+            w.writerow({k: row_out.get(k, "") for k in out_headers})
+
+    return out_path
+
+
+def project_all_seed_keys(repo_root: Path, seed_keys: Optional[List[str]] = None) -> Dict[str, Optional[Path]]:
+    """
+    Ensure seed CSVs for every seed key (default: all known role filters) in one
+    pass over a single index handle. Same non-overwrite guarantee per key.
+    """
+    keys = list(seed_keys) if seed_keys is not None else sorted(_ROLE_FILTERS)
+    results: Dict[str, Optional[Path]] = {}
+    pending: List[str] = []
+    for k in keys:
+        existing = next((p for p in _candidate_existing_seed_csv_paths(repo_root, k) if p.is_file()), None)
+        if existing is not None:
+            results[k] = existing
+        else:
+            pending.append(k)
+
+    if pending:
+        hub = resolve_hub_path(repo_root)
+        with SeedHubIndex.open(hub, "master") as index:
+            headers = index.headers()
+            for k in pending:
+                results[k] = _write_projection(k, repo_root, headers, _project_indexed(k, index)) if headers else None
+
+    return {k: results[k] for k in keys}
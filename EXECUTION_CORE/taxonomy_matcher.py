@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+taxonomy_matcher.py
+------------------------------------------------------------
+COMPILED SINGLE-PASS TAXONOMY MATCHER
+
+Maintainer: L. David Mendoza © 2026
+Version: v1.0.0
+
+Purpose
+- Phase 6 (SCHEMA/ai_stack_taxonomy.json) and Phase 7
+  (SCHEMA/oss_contribution_taxonomy.json) map regex patterns per canonical item
+  onto pipe-mode output columns. Running every pattern against every row for
+  every column does not scale to 100k rows; this module compiles a taxonomy
+  once and scans each row's evidence text in one pass.
+
+How it matches
+- Every pattern is parsed (re's own parser) for its longest required literal
+  run. All distinct literals go into one lookahead alternation, longest first,
+  so a single finditer over the case-folded text reports the longest literal
+  starting at each position; every literal contained in a reported one is
+  present too (precomputed "implied" sets). That is exact: any occurrence of a
+  literal is a prefix of the longest literal starting at the same position.
+- Only patterns whose literal is present (plus the few with no usable literal)
+  are then run, each compiled once with IGNORECASE. Results are identical to
+  running every pattern with re.search(pattern, text, re.IGNORECASE).
+- Output order is taxonomy item order; one canonical value per item.
+
+Compiled artifact
+- Keyed by sha256 of the canonical JSON of the column -> items mapping.
+- In-process memo plus a JSON plan at
+  repo_root/.cache/taxonomy_matcher/<name>_<hash>.json (literals, implied sets,
+  pattern -> item wiring), written via temp file + os.replace().
+
+Hard Contract
+- Deterministic. No network calls. No inference beyond the taxonomy patterns.
+
+Validation Steps
+python3 -m py_compile EXECUTION_CORE/taxonomy_matcher.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse as _sre_parse  # type: ignore
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "taxonomy_matcher"
+
+PLAN_FORMAT = "1"
+MIN_LITERAL_LEN = 2
+
+_LITERAL = _sre_parse.LITERAL
+
+
+# ------------------------------------------------------------
+# Literal extraction
+# ------------------------------------------------------------
+
+def required_literal(pattern: str) -> str:
+    """
+    Longest run of consecutive literal characters in the pattern's top-level
+    sequence (anything else - classes, groups, repeats, anchors - ends a run).
+    Every match of the pattern contains it (case-folded). "" when none of
+    useful length, or when it is not ASCII (see fold()).
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return ""
+    best = ""
+    run: List[str] = []
+    for op, av in parsed:
+        if op is _LITERAL:
+            run.append(chr(av))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+    best = best.casefold()
+    if not best.isascii():
+        return ""
+    return best if len(best) >= MIN_LITERAL_LEN else ""
+
+
+def fold(text: str) -> str:
+    """
+    Case-fold so every IGNORECASE match of an ASCII literal survives as a plain
+    substring. casefold() covers re's case equivalences for ASCII (long s, Kelvin
+    sign) except the two Turkish i's, which re matches against "i": dotless i
+    (U+0131) folds to itself and dotted capital I (U+0130) to "i" + U+0307.
+    """
+    return text.replace("\u0130", "i").casefold().replace("\u0131", "i")
+
+
+# ------------------------------------------------------------
+# Plan (JSON-serializable compiled artifact)
+# ------------------------------------------------------------
+
+def taxonomy_hash(groups: Dict[str, Sequence[Dict]]) -> str:
+    blob = json.dumps(
+        {col: [{"canonical": it.get("canonical", ""), "patterns": list(it.get("patterns", []))} for it in items]
+         for col, items in groups.items()},
+        sort_keys=True, ensure_ascii=False, separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def build_plan(groups: Dict[str, Sequence[Dict]]) -> Dict:
+    """
+    groups: output column -> [{"canonical": str, "patterns": [regex, ...]}, ...]
+    """
+    items: List[Tuple[str, str]] = []          # item index -> (column, canonical)
+    patterns: List[Tuple[str, int, str]] = []  # (pattern, item index, literal)
+    for col, col_items in groups.items():
+        for it in col_items:
+            canonical = str(it.get("canonical") or "").strip()
+            pats = [p for p in (it.get("patterns") or []) if isinstance(p, str) and p]
+            if not canonical or not pats:
+                continue
+            idx = len(items)
+            items.append((col, canonical))
+            for p in pats:
+                patterns.append((p, idx, required_literal(p)))
+
+    literals = sorted({lit for _, _, lit in patterns if lit}, key=lambda s: (-len(s), s))
+    implied = {a: sorted(b for b in literals if b != a and b in a) for a in literals}
+    return {
+        "format": PLAN_FORMAT,
+        "columns": list(groups.keys()),
+        "items": [list(x) for x in items],
+        "patterns": [list(x) for x in patterns],
+        "literals": literals,
+        "implied": {k: v for k, v in implied.items() if v},
+    }
+
+
+class CompiledTaxonomy:
+
+    def __init__(self, plan: Dict):
+        self.plan = plan
+        self.columns: List[str] = list(plan["columns"])
+        self.items: List[Tuple[str, str]] = [tuple(x) for x in plan["items"]]
+        self._implied: Dict[str, List[str]] = plan.get("implied", {})
+
+        self._by_literal: Dict[str, List[Tuple[re.Pattern, int]]] = {}
+        self._always: List[Tuple[re.Pattern, int]] = []
+        for pat, idx, lit in plan["patterns"]:
+            try:
+                rx = re.compile(pat, re.IGNORECASE)
+            except re.error:
+                continue
+            if lit:
+                self._by_literal.setdefault(lit, []).append((rx, idx))
+            else:
+                self._always.append((rx, idx))
+
+        lits = plan["literals"]
+        self._prefilter = (
+            re.compile("(?=(" + "|".join(re.escape(l) for l in lits) + "))") if lits else None
+        )
+
+    def _present_literals(self, folded: str) -> set:
+        found = set()
+        if self._prefilter is None:
+            return found
+        for m in self._prefilter.finditer(folded):
+            lit = m.group(1)
+            if lit in found:
+                continue
+            found.add(lit)
+            found.update(self._implied.get(lit, ()))
+        return found
+
+    def match_items(self, text: str) -> List[int]:
+        """Sorted indexes of items with at least one matching pattern."""
+        if not text:
+            return []
+        hit: set = set()
+        candidates: List[Tuple[re.Pattern, int]] = list(self._always)
+        for lit in self._present_literals(fold(text)):
+            candidates.extend(self._by_literal.get(lit, ()))
+        for rx, idx in candidates:
+            if idx not in hit and rx.search(text):
+                hit.add(idx)
+        return sorted(hit)
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """column -> canonical values (taxonomy order) found in text."""
+        out: Dict[str, List[str]] = {c: [] for c in self.columns}
+        for idx in self.match_items(text):
+            col, canonical = self.items[idx]
+            out[col].append(canonical)
+        return out
+
+
+# ------------------------------------------------------------
+# Cache
+# ------------------------------------------------------------
+
+_MEMO: Dict[str, CompiledTaxonomy] = {}
+
+
+def _plan_path(name: str, digest: str, cache_dir: Optional[Path]) -> Path:
+    return Path(cache_dir or DEFAULT_CACHE_DIR) / f"{name}_{digest[:16]}.json"
+
+
+def compile_taxonomy(name: str, groups: Dict[str, Sequence[Dict]], cache_dir: Optional[Path] = None) -> CompiledTaxonomy:
+    digest = taxonomy_hash(groups)
+    hit = _MEMO.get(digest)
+    if hit is not None:
+        return hit
+
+    path = _plan_path(name, digest, cache_dir)
+    plan = None
+    try:
+        with path.open(encoding="utf-8") as f:
+            plan = json.load(f)
+        if plan.get("format") != PLAN_FORMAT or plan.get("sha256") != digest:
+            plan = None
+    except (OSError, ValueError):
+        plan = None
+
+    if plan is None:
+        plan = build_plan(groups)
+        plan["sha256"] = digest
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(plan, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # read-only checkout: the in-process memo still applies
+
+    compiled = CompiledTaxonomy(plan)
+    _MEMO[digest] = compiled
+    return compiled
+
+
+# ------------------------------------------------------------
+# Row helpers shared by the phase passes
+# ------------------------------------------------------------
+
+def evidence_text(row: Dict[str, str], exclude: Iterable[str] = ()) -> str:
+    skip = set(exclude)
+    return "\n".join(str(v) for k, v in row.items() if k not in skip and v)
+
+
+def merge_pipe(existing: str, values: List[str]) -> str:
+    """Non-overwrite pipe merge: keep existing parts, append new values (case-insensitive dedupe)."""
+    parts = [p.strip() for p in (existing or "").split("|") if p.strip()]
+    seen = {p.lower() for p in parts}
+    for v in values:
+        if v.lower() not in seen:
+            seen.add(v.lower())
+            parts.append(v)
+    return "|".join(parts)
+
+
+def output_targets(
+    out_cols: Sequence[str],
+    fieldnames: Sequence[str],
+    canonical: Dict[str, str],
+) -> Dict[str, str]:
+    """
+    Where each taxonomy output column is written: itself when the header has it,
+    else its canonical counterpart when the header has that. Columns with
+    neither are skipped; the header is never extended (the phase passes run
+    after the locked 81-column schema step).
+    """
+    present = set(fieldnames)
+    targets: Dict[str, str] = {}
+    for col in out_cols:
+        if col in present:
+            targets[col] = col
+        elif canonical.get(col) in present:
+            targets[col] = canonical[col]
+    return targets
+
+
+def pipe_columns(taxonomy: Dict) -> List[str]:
+    cols = taxonomy.get("output_columns") or {}
+    return [c for c, spec in cols.items() if isinstance(spec, dict) and spec.get("mode") == "pipe"]
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+url_canon.py
+
+Shared URL Canonicalization Engine
+Author: L. David Mendoza © 2026
+
+Purpose:
+- One place for the URL normalize/classify rules every pass used to carry its
+  own copy of, each re-parsing the same URLs with urlparse/regexes per row:
+    anchor_exhaustion_pass         classify_anchor            -> anchor_column
+    people_discovery_from_hubs     _to_absolute               -> absolute_http
+    people_discovery_from_hubs,
+    people_projection_from_anchors _classify_person_url       -> person_url
+    deep_personal_artifact_scrape  _normalize_url             -> normalize_http
+    deep_artifact_harvester        normalize_url              -> strip_fragment
+- Each rule is a pure function of its arguments, memoized in a process-wide LRU
+  table (functools.lru_cache) shared by every pass in the run; returned strings
+  are interned so repeated URLs share one object across rows and passes.
+- Rules are byte-for-byte the former per-module implementations; the callers'
+  names remain as thin wrappers.
+
+Sizing:
+- CANON_CACHE_SIZE entries per table (env AI_TALENT_URL_CANON_CACHE, default 262144)
+
+Benchmark: python3 scripts/bench_url_canon.py [N]
+Tests: test/test_url_canon.py
+
+No network, no mutation.
+"""
+
+import os
+import re
+import sys
+import urllib.parse
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+CANON_CACHE_SIZE = int(os.environ.get("AI_TALENT_URL_CANON_CACHE") or 262144)
+
+_intern = sys.intern
+
+
+def _i(s: Optional[str]) -> Optional[str]:
+    return _intern(s) if s else s
+
+
+# ------------------------------------------------------------
+# Person profile URLs (hub discovery + anchor projection)
+# ------------------------------------------------------------
+
+GITHUB_USER_RE = re.compile(r"^https?://(www\.)?github\.com/([^/\s?#]+)(?:[/?#].*)?$", re.IGNORECASE)
+GITHUB_REPO_RE = re.compile(r"^https?://(www\.)?github\.com/[^/\s?#]+/[^/\s?#]+(?:[/?#].*)?$", re.IGNORECASE)
+LINKEDIN_IN_RE = re.compile(r"^https?://(www\.)?linkedin\.com/in/([^/?#]+)(?:[/?#].*)?$", re.IGNORECASE)
+SCHOLAR_USER_RE = re.compile(r"^https?://(www\.)?scholar\.google\.com/citations\?(?:[^#]*&)?user=([^&#]+)", re.IGNORECASE)
+SEMANTIC_AUTHOR_RE = re.compile(r"^https?://(www\.)?semanticscholar\.org/author/([^/?#]+)", re.IGNORECASE)
+ORCID_RE = re.compile(r"^https?://(www\.)?orcid\.org/(\d{4}-\d{4}-\d{4}-\d{3}[\dX])", re.IGNORECASE)
+
+_PERSON_PATTERNS = (
+    ("linkedin", LINKEDIN_IN_RE),
+    ("orcid", ORCID_RE),
+    ("scholar", SCHOLAR_USER_RE),
+    ("semantic_scholar", SEMANTIC_AUTHOR_RE),
+)
+
+UNKNOWN = ("unknown", "")
+
+
+@lru_cache(maxsize=CANON_CACHE_SIZE)
+def person_url(url: str) -> Tuple[str, str]:
+    """
+    (kind, handle_or_id); kind in github, linkedin, scholar, semantic_scholar,
+    orcid, unknown. GitHub handles are returned unfiltered: callers apply their
+    own reserved-path list.
+    """
+    u = (url or "").strip()
+    for kind, rx in _PERSON_PATTERNS:
+        m = rx.match(u)
+        if m:
+            return (kind, _i(m.group(2).strip()))
+    m = GITHUB_USER_RE.match(u)
+    if m and not GITHUB_REPO_RE.match(u):
+        return ("github", _i(m.group(2).strip()))
+    return UNKNOWN
+
+
+def is_github_repo(url: str) -> bool:
+    return bool(GITHUB_REPO_RE.match(url or ""))
+
+
+# ------------------------------------------------------------
+# Anchor columns (anchor_exhaustion_pass)
+# ------------------------------------------------------------
+
+_BLOG_HINTS = ("/blog", "medium.com", "substack.com", "dev.to", "hashnode.com", "wordpress", "blogspot")
+_PORTFOLIO_HINTS = ("portfolio", "/projects", "/work", "/case", "showcase", "personal-site")
+_CV_HINTS = ("resume", "cv", "curriculum", "résumé", "lebenslauf", "履歴書", "简历")
+
+
+@lru_cache(maxsize=CANON_CACHE_SIZE)
+def anchor_column(url: str) -> str:
+    """Canonical URL column for an anchor; default Personal_Website_URLs."""
+    u = (url or "").strip()
+    if not u:
+        return "Personal_Website_URLs"
+    s = u.lower()
+    if "github.io" in s:
+        return "GitHub_IO_URL"
+    # conservative: treat obvious resume/cv URLs or PDFs as CV links
+    if s.endswith(".pdf") or any(k in s for k in _CV_HINTS):
+        return "CV_URLs"
+    if any(k in s for k in _BLOG_HINTS):
+        return "Blog_URLs"
+    if any(k in s for k in _PORTFOLIO_HINTS):
+        return "Portfolio_URLs"
+    return "Personal_Website_URLs"
+
+
+# ------------------------------------------------------------
+# Absolute / normalized forms
+# ------------------------------------------------------------
+
+@lru_cache(maxsize=CANON_CACHE_SIZE)
+def absolute_http(base_url: str, maybe_url: str) -> Optional[str]:
+    """href resolved against base_url; None for fragments, mailto:, javascript:, non-http."""
+    u = (maybe_url or "").strip()
+    if not u:
+        return None
+    if u.startswith("#") or u.lower().startswith("mailto:") or u.lower().startswith("javascript:"):
+        return None
+    absu = urllib.parse.urljoin(base_url, u)
+    if not absu.lower().startswith(("http://", "https://")):
+        return None
+    return _i(absu)
+
+
+@lru_cache(maxsize=CANON_CACHE_SIZE)
+def normalize_http(url: str, base: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve against base, drop params/fragment, lowercase scheme/host, drop
+    default ports, empty path -> "/". None for non-http(s) or hostless URLs.
+    """
+    url = (url or "").strip()
+    if not url:
+        return None
+
+    if base:
+        url = urllib.parse.urljoin(base, url)
+
+    parsed = urllib.parse.urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return None
+
+    host = (parsed.hostname or "").lower()
+    if not host:
+        return None
+
+    norm = urllib.parse.urlunparse(
+        (
+            parsed.scheme.lower(),
+            host if parsed.port in (None, 80, 443) else f"{host}:{parsed.port}",
+            parsed.path or "/",
+            "",
+            parsed.query or "",
+            "",
+        )
+    )
+    return _i(norm)
+
+
+@lru_cache(maxsize=CANON_CACHE_SIZE)
+def strip_fragment(url: str) -> str:
+    u, _frag = urllib.parse.urldefrag(url.strip())
+    return _i(u)
+
+
+# ------------------------------------------------------------
+# Stats / maintenance
+# ------------------------------------------------------------
+
+TABLES = {
+    "person_url": person_url,
+    "anchor_column": anchor_column,
+    "absolute_http": absolute_http,
+    "normalize_http": normalize_http,
+    "strip_fragment": strip_fragment,
+}
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    out = {}
+    for name, fn in TABLES.items():
+        ci = fn.cache_info()
+        out[name] = {"hits": ci.hits, "misses": ci.misses, "size": ci.currsize}
+    return out
+
+
+def clear() -> None:
+    for fn in TABLES.values():
+        fn.cache_clear()
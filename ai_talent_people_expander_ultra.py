@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 AI Talent Engine — People Expander (Ultra)
-Version: v1.0.0-ultra
+Version: v1.1.0-ultra
 Date: 2025-12-28
 © 2025 L. David Mendoza. All Rights Reserved.
 
@@ -33,6 +33,9 @@ GUARDRAILS (YOU ASKED FOR THIS)
 
 CHANGELOG
 - v1.0.0-ultra: Initial release. Patents expansion (assignee pages + patent pages) + caching + concurrency + provenance.
+- v1.1.0-ultra: JsonCache is sharded (256 shards, per-shard locks), gzip-compressed, size-capped (LRU eviction)
+  and multi-process safe. Patent page HTML is cached too, so patents shared by several assignee seeds are
+  fetched once. Cache stats printed at the end of each run. New: --cache-dir, --cache-max-mb.
 
 VALIDATION (RUN EXACTLY)
 1) python3 ai_talent_people_expander_ultra.py --dry-run
@@ -54,12 +57,14 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gzip
 import hashlib
 import json
 import os
 import random
 import re
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
@@ -84,6 +89,7 @@ except Exception as e:
 
 DEFAULT_OUTPUT_DIR = "output"
 DEFAULT_CACHE_DIR = ".cache/people_expander_ultra"
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1 GiB across all shards
 DEFAULT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123 Safari/537.36"
 
 PATENTS_HOST = "patents.google.com"
@@ -213,29 +219,170 @@ def is_patents_query_page(url: str) -> bool:
 # ---------------------------
 
 class JsonCache:
-    def __init__(self, cache_dir: str) -> None:
+    """
+    Sharded, compressed on-disk cache shared by all expander threads (and safe
+    across concurrently running expander processes).
+
+    Layout: <cache_dir>/<shard>/<key>.json.gz, shard = first 2 hex chars of the
+    key's URL hash (256 shards). Each shard has its own lock, so workers only
+    contend when they touch the same shard.
+
+    - Values (people lists and raw HTML bodies) are gzip-compressed JSON
+    - Writes go to a per-process/thread temp file and are os.replace()d in,
+      so readers in any process never see a partial entry
+    - Size cap: each shard keeps under max_bytes / NUM_SHARDS; the least
+      recently used entries (by mtime, refreshed on hit) are evicted first
+    - Legacy flat <cache_dir>/<key>.json entries are still read
+    """
+
+    NUM_SHARDS = 256
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
         self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.shard_max_bytes = max(1, max_bytes // self.NUM_SHARDS) if max_bytes else 0
         mkdirp(cache_dir)
+        self._locks = [threading.Lock() for _ in range(self.NUM_SHARDS)]
+        self._shard_bytes: Dict[int, int] = {}
+        self._stats_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "legacy_hits": 0, "writes": 0, "evictions": 0, "bytes_written": 0}
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[name] += n
+
+    @staticmethod
+    def _shard_of(key: str) -> int:
+        h = key.rsplit("_", 1)[-1]
+        try:
+            return int(h[:2], 16)
+        except ValueError:
+            return int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:2], 16)
+
+    def _shard_dir(self, shard: int) -> str:
+        return os.path.join(self.cache_dir, f"{shard:02x}")
 
     def _path(self, key: str) -> str:
+        return os.path.join(self._shard_dir(self._shard_of(key)), f"{key}.json.gz")
+
+    def _legacy_path(self, key: str) -> str:
         return os.path.join(self.cache_dir, f"{key}.json")
 
     def get(self, key: str) -> Optional[dict]:
         p = self._path(key)
-        if not os.path.exists(p):
-            return None
         try:
-            with open(p, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(p, "rb") as f:
+                obj = json.loads(gzip.decompress(f.read()).decode("utf-8"))
+            try:
+                os.utime(p, None)  # LRU touch
+            except OSError:
+                pass
+            self._count("hits")
+            return obj
+        except FileNotFoundError:
+            pass
         except Exception:
+            self._count("misses")
             return None
 
+        lp = self._legacy_path(key)
+        if os.path.exists(lp):
+            try:
+                with open(lp, "r", encoding="utf-8") as f:
+                    obj = json.load(f)
+                self._count("legacy_hits")
+                return obj
+            except Exception:
+                pass
+        self._count("misses")
+        return None
+
     def set(self, key: str, obj: dict) -> None:
+        shard = self._shard_of(key)
+        d = self._shard_dir(shard)
         p = self._path(key)
-        tmp = p + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(obj, f, ensure_ascii=False)
-        os.replace(tmp, p)
+        blob = gzip.compress(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), compresslevel=6)
+        tmp = f"{p}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._locks[shard]:
+            mkdirp(d)
+            try:
+                old = os.path.getsize(p)
+            except OSError:
+                old = 0
+            with open(tmp, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, p)
+            if shard not in self._shard_bytes:
+                self._shard_bytes[shard] = self._scan_shard_bytes(d)
+            else:
+                self._shard_bytes[shard] += len(blob) - old
+            if self.shard_max_bytes and self._shard_bytes[shard] > self.shard_max_bytes:
+                self._evict_shard(shard, keep=p)
+        self._count("writes")
+        self._count("bytes_written", len(blob))
+
+    def get_text(self, key: str) -> Optional[str]:
+        obj = self.get(key)
+        if obj is None:
+            return None
+        return obj.get("text") if isinstance(obj.get("text"), str) else None
+
+    def set_text(self, key: str, text: str) -> None:
+        self.set(key, {"text": text})
+
+    @staticmethod
+    def _scan_shard_bytes(d: str) -> int:
+        total = 0
+        with os.scandir(d) as it:
+            for e in it:
+                if e.name.endswith(".json.gz"):
+                    try:
+                        total += e.stat().st_size
+                    except OSError:
+                        continue  # evicted by another process
+        return total
+
+    def _evict_shard(self, shard: int, keep: str) -> None:
+        """Caller holds the shard lock. Rescans, since other processes share the shard."""
+        entries = []
+        with os.scandir(self._shard_dir(shard)) as it:
+            for e in it:
+                if not e.name.endswith(".json.gz") or e.path == keep:
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+        total = sum(sz for _, sz, _ in entries)
+        try:
+            total += os.path.getsize(keep)
+        except OSError:
+            pass
+        target = int(self.shard_max_bytes * 0.9)
+        evicted = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # already gone (another process evicted it)
+            total -= size
+            evicted += 1
+        self._shard_bytes[shard] = total
+        if evicted:
+            self._count("evictions", evicted)
+
+    def print_stats(self) -> None:
+        s = dict(self.stats)
+        lookups = s["hits"] + s["legacy_hits"] + s["misses"]
+        rate = (100.0 * (s["hits"] + s["legacy_hits"]) / lookups) if lookups else 0.0
+        print(
+            f"🗄️  CACHE: hits={s['hits']} legacy_hits={s['legacy_hits']} misses={s['misses']} "
+            f"hit_rate={rate:.1f}% writes={s['writes']} evictions={s['evictions']} "
+            f"written={s['bytes_written'] / 1_048_576:.1f}MiB cap={self.max_bytes / 1_048_576:.0f}MiB → {self.cache_dir}"
+        )
 
 
 # ---------------------------
@@ -391,8 +538,13 @@ def expand_seed_patents(seed: SeedRow,
         patent_links = parse_query_result_patent_links(html, max_links=max_patents_per_seed)
         for purl in patent_links:
             purl = normalize_patents_url(purl)
-            ph = http_get(purl, timeout=timeout, max_retries=max_retries, user_agent=user_agent)
-            jitter_sleep(sleep_min, sleep_max)
+            html_key = "html_" + stable_hash(purl)
+            ph = cache.get_text(html_key)
+            if ph is None:
+                ph = http_get(purl, timeout=timeout, max_retries=max_retries, user_agent=user_agent)
+                jitter_sleep(sleep_min, sleep_max)
+                if ph:
+                    cache.set_text(html_key, ph)
             if not ph:
                 continue
             inventors = parse_patent_inventors(ph)
@@ -547,6 +699,9 @@ def main() -> int:
     ap.add_argument("--retries", type=int, default=DEFAULT_MAX_RETRIES)
     ap.add_argument("--sleep-min", type=float, default=DEFAULT_SLEEP_MIN)
     ap.add_argument("--sleep-max", type=float, default=DEFAULT_SLEEP_MAX)
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    ap.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+                    help="On-disk cache size cap in MiB (0 = unbounded)")
     ap.add_argument("--dry-run", action="store_true", help="Inventory only (no expansion)")
     args = ap.parse_args()
 
@@ -580,7 +735,7 @@ def main() -> int:
         print("✅ DRY RUN COMPLETE (no expansion performed)")
         return 0
 
-    cache = JsonCache(DEFAULT_CACHE_DIR)
+    cache = JsonCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
 
     # Expand seeds concurrently
     people: List[PersonLead] = []
@@ -643,6 +798,8 @@ def main() -> int:
 
     people_rows = [asdict(p) for p in people]
 
+    cache.print_stats()
+
     people_csv = os.path.join(run_dir, f"people_leads_{run_ts}.csv")
     prov_csv = os.path.join(run_dir, f"people_provenance_{run_ts}.csv")
 
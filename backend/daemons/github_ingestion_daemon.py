@@ -1,21 +1,328 @@
-import time
+# ============================================================
+# AI TALENT ENGINE - SIGNAL INTELLIGENCE PLATFORM
+# © 2026 L. David Mendoza. All Rights Reserved.
+# ============================================================
+"""
+backend/daemons/github_ingestion_daemon.py
+
+GitHubIngestionDaemon: incremental GitHub signal ingestion via the Events API.
+
+Each cycle polls, for the tracked population only:
+- /users/{login}/events/public
+- /orgs/{org}/events
+
+Requests are ETag-conditional (If-None-Match). A 304 costs nothing against the
+rate limit and means "no new events". X-Poll-Interval is honored per entity, so
+an entity is not re-polled before GitHub allows it.
+
+Per-entity cursors (etag, last seen event id, next poll time) persist in
+backend/storage/github_ingestion_cursors.json. Only events newer than the cursor
+and of an ingested type are appended as signals:
+
+- PushEvent                          -> push
+- ReleaseEvent (published)           -> release
+- CreateEvent (ref_type=repository)  -> new_repo
+- WatchEvent (started)               -> star
+
+Signals are appended to backend/storage/github_signal_events.jsonl, and the
+per-entity rollup in backend/storage/signal_history_store.json (read by
+ExecutiveGraphService as an overlay) is refreshed after every cycle.
+
+Tracked population:
+- backend/storage/github_tracked_entities.json {"users": [...], "orgs": [...]}, or
+- GitHub handles found on identity_graph.json nodes when that file is absent.
+
+Version: v1.0.0
+Changelog:
+- v1.0.0 (2026-02-22): Replace print/sleep stub with incremental Events API ingester.
+
+Validation:
+- GITHUB_TOKEN=... python3 -c "from backend.daemons.github_ingestion_daemon import GitHubIngestionDaemon; print(GitHubIngestionDaemon().scan())"
+"""
+
+from __future__ import annotations
+
+import json
 import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+ROOT = _repo_root()
+STORAGE_DIR = ROOT / "backend" / "storage"
+
+API = "https://api.github.com"
+DEFAULT_CYCLE_SECONDS = 300
+DEFAULT_POLL_INTERVAL = 60
+MIN_RATE_LIMIT_REMAINING = 50
+HISTORY_RECENT_PER_ENTITY = 20
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _atomic_write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path, default: Any) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return default
+
+
+def _event_id(ev: Dict[str, Any]) -> int:
+    try:
+        return int(ev.get("id") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def classify_event(ev: Dict[str, Any]) -> Optional[str]:
+    etype = ev.get("type")
+    payload = ev.get("payload") or {}
+    if etype == "PushEvent":
+        return "push"
+    if etype == "ReleaseEvent" and payload.get("action") in (None, "published"):
+        return "release"
+    if etype == "CreateEvent" and payload.get("ref_type") == "repository":
+        return "new_repo"
+    if etype == "WatchEvent" and payload.get("action") in (None, "started"):
+        return "star"
+    return None
+
+
+def event_to_signal(entity: str, ev: Dict[str, Any], kind: str) -> Dict[str, Any]:
+    payload = ev.get("payload") or {}
+    repo = (ev.get("repo") or {}).get("name")
+    signal: Dict[str, Any] = {
+        "entity": entity,
+        "signal": kind,
+        "event_id": str(ev.get("id") or ""),
+        "actor": (ev.get("actor") or {}).get("login"),
+        "repo": repo,
+        "created_at": ev.get("created_at"),
+        "ingested_at": _utc_now_iso(),
+    }
+    if kind == "push":
+        signal["commits"] = payload.get("size", len(payload.get("commits") or []))
+    elif kind == "release":
+        rel = payload.get("release") or {}
+        signal["tag"] = rel.get("tag_name")
+        signal["url"] = rel.get("html_url")
+    return signal
+
 
 class GitHubIngestionDaemon:
 
-    def __init__(self):
+    def __init__(
+        self,
+        storage_dir: Optional[Path] = None,
+        users: Optional[List[str]] = None,
+        orgs: Optional[List[str]] = None,
+        cycle_seconds: int = DEFAULT_CYCLE_SECONDS,
+        token: Optional[str] = None,
+    ):
         self.running = False
+        self._stop = threading.Event()
+        self.storage_dir = Path(storage_dir) if storage_dir else STORAGE_DIR
+        self.cycle_seconds = cycle_seconds
+        self.cursors_path = self.storage_dir / "github_ingestion_cursors.json"
+        self.events_path = self.storage_dir / "github_signal_events.jsonl"
+        self.history_path = self.storage_dir / "signal_history_store.json"
+        self.tracked_path = self.storage_dir / "github_tracked_entities.json"
+        self._users = users
+        self._orgs = orgs
+
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/vnd.github+json", "User-Agent": "AI-Talent-Engine/IngestionDaemon"})
+        tok = token if token is not None else os.getenv("GITHUB_TOKEN", "").strip()
+        if tok:
+            self.session.headers["Authorization"] = f"Bearer {tok}"
 
     def start(self):
         self.running = True
+        self._stop.clear()
         print("GitHub ingestion daemon started")
 
         while self.running:
             self.scan()
-            time.sleep(300)
+            self._stop.wait(self.cycle_seconds)
 
     def stop(self):
         self.running = False
+        self._stop.set()
+
+    # --------------------------------------------------------
+    # Population + cursors
+    # --------------------------------------------------------
+
+    def tracked_entities(self) -> List[Tuple[str, str]]:
+        users = self._users
+        orgs = self._orgs
+        if users is None and orgs is None:
+            data = _read_json(self.tracked_path, None)
+            if isinstance(data, dict):
+                users, orgs = data.get("users") or [], data.get("orgs") or []
+            else:
+                users, orgs = self._users_from_identity_graph(), []
+
+        out: List[Tuple[str, str]] = []
+        seen = set()
+        for kind, names in (("user", users or []), ("org", orgs or [])):
+            for n in names:
+                n = str(n).strip()
+                if n and (kind, n.lower()) not in seen:
+                    seen.add((kind, n.lower()))
+                    out.append((kind, n))
+        return out
+
+    def _users_from_identity_graph(self) -> List[str]:
+        data = _read_json(self.storage_dir / "identity_graph.json", {})
+        nodes = []
+        if isinstance(data, dict):
+            nodes = data.get("nodes") or data.get("identities") or data.get("people") or []
+        elif isinstance(data, list):
+            nodes = data
+        users = []
+        for n in nodes:
+            if not isinstance(n, dict):
+                continue
+            h = n.get("github") or n.get("github_username") or n.get("GitHub_Username") or n.get("github_login")
+            if isinstance(h, str) and h.strip():
+                users.append(h.strip().rstrip("/").split("/")[-1])
+        return users
+
+    def _load_cursors(self) -> Dict[str, Dict[str, Any]]:
+        data = _read_json(self.cursors_path, {})
+        return data if isinstance(data, dict) else {}
+
+    # --------------------------------------------------------
+    # Polling
+    # --------------------------------------------------------
+
+    def _poll_entity(self, kind: str, name: str, cursor: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, str]]:
+        url = f"{API}/users/{name}/events/public" if kind == "user" else f"{API}/orgs/{name}/events"
+        headers = {}
+        if cursor.get("etag"):
+            headers["If-None-Match"] = cursor["etag"]
+
+        r = self.session.get(url, headers=headers, params={"per_page": 100}, timeout=20)
+        now = time.time()
+        poll_interval = int(r.headers.get("X-Poll-Interval", DEFAULT_POLL_INTERVAL) or DEFAULT_POLL_INTERVAL)
+        new_cursor = dict(cursor)
+        new_cursor["next_poll_at"] = now + poll_interval
+        new_cursor["last_polled_at"] = _utc_now_iso()
+        new_cursor["last_status"] = r.status_code
+
+        if r.status_code == 304:
+            return [], new_cursor, dict(r.headers)
+        if r.status_code != 200:
+            return [], new_cursor, dict(r.headers)
+
+        new_cursor["etag"] = r.headers.get("ETag", "")
+        payload = r.json()
+        events = payload if isinstance(payload, list) else []
+        last_id = int(cursor.get("last_event_id") or 0)
+        fresh = [ev for ev in events if _event_id(ev) > last_id]
+        if events:
+            new_cursor["last_event_id"] = str(max(last_id, max(_event_id(ev) for ev in events)))
+
+        signals = []
+        entity = f"{kind}:{name}"
+        for ev in sorted(fresh, key=_event_id):
+            kind_sig = classify_event(ev)
+            if kind_sig:
+                signals.append(event_to_signal(entity, ev, kind_sig))
+        return signals, new_cursor, dict(r.headers)
+
+    def scan(self) -> Dict[str, Any]:
+        """
+        Run one ingestion cycle. Returns a cycle summary.
+        Only entities whose X-Poll-Interval window has elapsed are polled.
+        """
+        entities = self.tracked_entities()
+        cursors = self._load_cursors()
+        now = time.time()
+
+        stats = {"entities": len(entities), "polled": 0, "not_modified": 0, "errors": 0, "skipped_not_due": 0, "signals": 0}
+        new_signals: List[Dict[str, Any]] = []
+
+        for kind, name in entities:
+            if self._stop.is_set():
+                break
+            key = f"{kind}:{name.lower()}"
+            cursor = cursors.get(key, {})
+            if float(cursor.get("next_poll_at", 0) or 0) > now:
+                stats["skipped_not_due"] += 1
+                continue
+            try:
+                signals, cursors[key], headers = self._poll_entity(kind, name, cursor)
+            except Exception as e:
+                stats["errors"] += 1
+                print(f"GitHub ingestion error for {key}: {e}")
+                continue
+            stats["polled"] += 1
+            if cursors[key].get("last_status") == 304:
+                stats["not_modified"] += 1
+            elif cursors[key].get("last_status") != 200:
+                stats["errors"] += 1
+            new_signals.extend(signals)
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            if remaining is not None and remaining.isdigit() and int(remaining) < MIN_RATE_LIMIT_REMAINING:
+                print(f"GitHub ingestion: rate limit low ({remaining}); ending cycle early")
+                break
+
+        self._append_signals(new_signals)
+        _atomic_write_json(self.cursors_path, cursors)
+        self._refresh_history(new_signals)
+
+        stats["signals"] = len(new_signals)
+        print(
+            "GitHub ingestion cycle: "
+            f"entities={stats['entities']} polled={stats['polled']} not_modified={stats['not_modified']} "
+            f"not_due={stats['skipped_not_due']} errors={stats['errors']} new_signals={stats['signals']}"
+        )
+        return stats
+
+    # --------------------------------------------------------
+    # Store
+    # --------------------------------------------------------
+
+    def _append_signals(self, signals: List[Dict[str, Any]]) -> None:
+        if not signals:
+            return
+        self.events_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.events_path.open("a", encoding="utf-8") as f:
+            for s in signals:
+                f.write(json.dumps(s, ensure_ascii=False) + "\n")
 
-    def scan(self):
-        print("Scanning GitHub signals...")
+    def _refresh_history(self, signals: List[Dict[str, Any]]) -> None:
+        history = _read_json(self.history_path, {})
+        if not isinstance(history, dict):
+            history = {}
+        entities = history.setdefault("entities", {})
+        for s in signals:
+            e = entities.setdefault(s["entity"], {"counts": {}, "recent": [], "last_signal_at": None})
+            e["counts"][s["signal"]] = e["counts"].get(s["signal"], 0) + 1
+            e["recent"] = ([s] + e["recent"])[:HISTORY_RECENT_PER_ENTITY]
+            if s.get("created_at") and (e["last_signal_at"] is None or s["created_at"] > e["last_signal_at"]):
+                e["last_signal_at"] = s["created_at"]
+        history["updated_at"] = _utc_now_iso()
+        history["source"] = "github_ingestion_daemon"
+        _atomic_write_json(self.history_path, history)
@@ -0,0 +1,218 @@
+# ============================================================
+# AI TALENT ENGINE - SIGNAL INTELLIGENCE PLATFORM
+# © 2026 L. David Mendoza. All Rights Reserved.
+# ============================================================
+"""
+backend/intelligence/artifact_cache.py
+
+Shared, mtime-invalidated cache for backend/storage JSON artifacts.
+
+Every consumer of identity_graph.json and the overlay stores used to re-read
+and re-parse the file on every call. This layer parses each file once per
+modification (keyed on mtime_ns + size) and hands out frozen views:
+
+- dicts become ReadOnlyDict and lists ReadOnlyList: subclasses of dict/list, so
+  isinstance checks and JSON serialization are unchanged and dict(x) / list(x)
+  give mutable copies, but in-place mutation raises TypeError
+- derive(path, name, fn) memoizes fn(view) per file generation, for normalized
+  views (e.g. ExecutiveGraphService's nodes/edges) or built structures
+
+tail_lines(path, n) reads the last n lines of a log by seeking from the end, and
+keeps an incremental line count for append-only logs.
+
+Version: v1.0.0
+Changelog:
+- v1.0.0 (2026-02-22): Shared artifact cache + tail-seek log reader.
+
+Validation:
+- python3 -c "from backend.intelligence.artifact_cache import load_json; print(load_json('backend/storage/identity_graph.json')[0])"
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+
+class ReadOnlyDict(dict):
+    """dict that refuses mutation; shared safely between callers."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("artifact views are read-only; copy with dict(view) first")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """list that refuses mutation; shared safely between callers."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("artifact views are read-only; copy with list(view) first")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = clear = extend = insert = pop = remove = reverse = sort = _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return ReadOnlyDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return ReadOnlyList(freeze(v) for v in obj)
+    return obj
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class ArtifactCache:
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Optional[Tuple[int, int]], bool, Any, str]] = {}
+        self._derived: Dict[Tuple[str, str], Tuple[Optional[Tuple[int, int]], Any]] = {}
+        self.stats = {"parses": 0, "hits": 0}
+
+    def load(self, path: PathLike) -> Tuple[bool, Any, str]:
+        """(ok, frozen_data, error) with ExecutiveGraphService._read_json semantics."""
+        p = Path(path).resolve()
+        key = str(p)
+        stamp = _stamp(p)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.stats["hits"] += 1
+            return entry[1], entry[2], entry[3]
+
+        if stamp is None:
+            result = (False, None, f"missing: {path}")
+        else:
+            try:
+                result = (True, freeze(json.loads(p.read_text(encoding="utf-8"))), "")
+            except Exception as e:
+                result = (False, None, f"error reading {path}: {e}")
+            self.stats["parses"] += 1
+        with self._lock:
+            self._entries[key] = (stamp,) + result
+        return result
+
+    def generation(self, path: PathLike) -> Optional[Tuple[int, int]]:
+        return _stamp(Path(path).resolve())
+
+    def derive(self, path: PathLike, name: str, fn: Callable[[bool, Any], Any]) -> Any:
+        """
+        Memoize fn(ok, frozen_data) per file generation. fn must not depend on
+        anything but the file content.
+        """
+        p = Path(path).resolve()
+        key = (str(p), name)
+        stamp = _stamp(p)
+        hit = self._derived.get(key)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+        ok, data, _ = self.load(p)
+        value = fn(ok, data)
+        with self._lock:
+            self._derived[key] = (stamp, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._derived.clear()
+
+
+_CACHE = ArtifactCache()
+
+
+def get_cache() -> ArtifactCache:
+    return _CACHE
+
+
+def load_json(path: PathLike) -> Tuple[bool, Any, str]:
+    return _CACHE.load(path)
+
+
+def load_json_or(path: PathLike, default: Any) -> Any:
+    ok, data, _ = _CACHE.load(path)
+    return data if ok else default
+
+
+def derive(path: PathLike, name: str, fn: Callable[[bool, Any], Any]) -> Any:
+    return _CACHE.derive(path, name, fn)
+
+
+# ------------------------------------------------------------
+# Log tail
+# ------------------------------------------------------------
+
+_TAIL_BLOCK = 64 * 1024
+_line_counts: Dict[str, Tuple[int, int, int, bool]] = {}  # path -> (inode, size, newlines, ends_with_newline)
+_line_lock = threading.Lock()
+
+
+def _count_newlines(f, start: int, end: int) -> Tuple[int, bool]:
+    f.seek(start)
+    n = 0
+    last = b""
+    remaining = end - start
+    while remaining > 0:
+        chunk = f.read(min(_TAIL_BLOCK * 16, remaining))
+        if not chunk:
+            break
+        n += chunk.count(b"\n")
+        last = chunk[-1:]
+        remaining -= len(chunk)
+    return n, last == b"\n"
+
+
+def tail_lines(path: PathLike, n: int = 50) -> Tuple[List[str], int]:
+    """
+    (last n lines, total line count). Seeks back from EOF in blocks for the tail;
+    the total is maintained incrementally while the file only grows.
+    """
+    p = Path(path)
+    st = p.stat()
+    size = st.st_size
+    key = str(p.resolve())
+
+    with p.open("rb") as f:
+        # tail
+        data = b""
+        pos = size
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+        tail = data.decode("utf-8", errors="ignore").splitlines()[-n:] if n > 0 else []
+
+        # total
+        with _line_lock:
+            prev = _line_counts.get(key)
+        if prev is not None and prev[0] == st.st_ino and prev[1] <= size:
+            added, ends_nl = _count_newlines(f, prev[1], size)
+            newlines = prev[2] + added
+            if size == prev[1]:
+                ends_nl = prev[3]
+        else:
+            newlines, ends_nl = _count_newlines(f, 0, size)
+        with _line_lock:
+            _line_counts[key] = (st.st_ino, size, newlines, ends_nl)
+
+    total = newlines + (1 if size and not ends_nl else 0)
+    return tail, total
@@ -9,6 +9,8 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
+from backend.intelligence.artifact_cache import load_json_or
+
 GRAPH_FILE = Path("backend/storage/identity_graph.json")
 CACHE_FILE = Path("backend/storage/intelligence/bridge_intelligence.json")
 
@@ -19,7 +21,7 @@ class BridgeIntelligenceEngine:
         self.centrality = {}
 
         if GRAPH_FILE.exists():
-            self.graph = json.loads(GRAPH_FILE.read_text())
+            self.graph = load_json_or(GRAPH_FILE, {})
 
     def build_adj(self):
 
@@ -4,10 +4,11 @@
 ###############################################################################
 
 import networkx as nx
-import json
 from pathlib import Path
 import community as community_louvain
 
+from backend.intelligence.artifact_cache import load_json
+
 DATA_PATH = Path(__file__).resolve().parents[1] / "storage" / "identity_graph.json"
 
 class CommunityDetectionEngine:
@@ -15,7 +16,9 @@ class CommunityDetectionEngine:
     def detect(self):
 
         G = nx.Graph()
-        graph = json.loads(DATA_PATH.read_text())
+        ok, graph, err = load_json(DATA_PATH)
+        if not ok:
+            raise FileNotFoundError(err)
 
         for edge in graph["edges"]:
             G.add_edge(edge["source"], edge["target"])
@@ -4,10 +4,10 @@
 # © 2026 L. David Mendoza. All Rights Reserved.
 # ============================================================
 
-import json
 import os
 from typing import Dict, Any, List
 
+from backend.intelligence.artifact_cache import load_json
 from backend.storage.identity_graph_store import IdentityGraphStore
 from backend.storage.telemetry_registry import TelemetryRegistry
 
@@ -44,8 +44,9 @@ class EcosystemIntelligenceEngine:
                 "edges": []
             }
 
-        with open(self.graph_path, "r") as f:
-            graph = json.load(f)
+        ok, graph, err = load_json(self.graph_path)
+        if not ok:
+            raise ValueError(err)
 
         return graph
 
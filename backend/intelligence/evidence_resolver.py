@@ -1,14 +1,11 @@
-import json
+from backend.intelligence.gold_standard_store import get_store
 
 DATA_PATH = "outputs/gold_standard.json"
 
 def resolve_evidence(identity_key):
 
-    with open(DATA_PATH) as f:
-        data = json.load(f)
+    record = get_store(DATA_PATH).get(identity_key)
+    if record is None:
+        return []
 
-    for record in data:
-        if record.get("Identity_Key") == identity_key:
-            return record.get("Evidence_URLs", [])
-
-    return []
+    return record.get("Evidence_URLs", [])
@@ -0,0 +1,182 @@
+"""
+Gold Standard Identity Store
+Resident, mtime-invalidated view of outputs/gold_standard.json shared by
+query_router (keyword fallback) and evidence_resolver (Identity_Key lookup).
+
+- Parsed once per file generation; a stat (mtime_ns, size) check per access
+  reloads it when the file is rewritten.
+- Identity_Key -> record hash index (first occurrence wins, as the old linear scan).
+- Lowercase token inverted index over the eight keyword fields query_router
+  scores on. A query term matches a record when it is a substring of the joined
+  field text; since terms contain no whitespace, that is exactly "the term is a
+  substring of one of the record's whitespace tokens", so matches are found by
+  scanning the vocabulary (memoized per term) instead of every record.
+- `generation` increments on every reload so callers can key caches on it.
+"""
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+GOLD_STANDARD_PATH = "outputs/gold_standard.json"
+
+KEYWORD_FIELDS = ("name", "company", "title", "role", "determinants", "papers", "repos", "notes")
+
+
+def keyword_text(candidate: Dict) -> str:
+    fields = [
+        candidate.get("name", ""),
+        candidate.get("company", ""),
+        candidate.get("title", ""),
+        candidate.get("role", ""),
+        str(candidate.get("determinants", "")),
+        str(candidate.get("papers", "")),
+        str(candidate.get("repos", "")),
+        str(candidate.get("notes", "")),
+    ]
+    return " ".join(fields).lower()
+
+
+def _fai(c: Dict):
+    return c.get("fai") or c.get("eqi") or 75
+
+
+class GoldStandardStore:
+
+    def __init__(self, path: str = GOLD_STANDARD_PATH):
+        self.path = path
+        self.generation = 0
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._records: List[Dict] = []
+        self._by_key: Dict[str, Dict] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._term_cache: Dict[str, frozenset] = {}
+        self._fai_order: List[int] = []
+
+    # ── Loading ───────────────────────────────────────────────────────────
+
+    def _current_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _ensure_loaded(self) -> None:
+        stamp = self._current_stamp()
+        if stamp == self._stamp and (stamp is not None or self.generation):
+            return
+        with self._lock:
+            if stamp == self._stamp and (stamp is not None or self.generation):
+                return
+            self._load(stamp)
+
+    def _load(self, stamp: Optional[Tuple[int, int]]) -> None:
+        records: List[Dict] = []
+        if stamp is not None:
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                records = data if isinstance(data, list) else data.get("identities", [])
+            except Exception:
+                records = []
+        records = [r for r in records if isinstance(r, dict)]
+
+        by_key: Dict[str, Dict] = {}
+        postings: Dict[str, List[int]] = {}
+        for i, r in enumerate(records):
+            k = r.get("Identity_Key")
+            if k is not None and k not in by_key:
+                by_key[k] = r
+            try:
+                tokens = set(keyword_text(r).split())
+            except Exception:
+                tokens = set()
+            for t in tokens:
+                postings.setdefault(t, []).append(i)
+
+        try:
+            fai_order = sorted(range(len(records)), key=lambda i: _fai(records[i]), reverse=True)
+        except TypeError:
+            fai_order = list(range(len(records)))
+
+        self._records = records
+        self._by_key = by_key
+        self._postings = postings
+        self._term_cache = {}
+        self._fai_order = fai_order
+        self._stamp = stamp
+        self.generation += 1
+
+    # ── Queries ───────────────────────────────────────────────────────────
+
+    def records(self) -> List[Dict]:
+        self._ensure_loaded()
+        return self._records
+
+    def get(self, identity_key) -> Optional[Dict]:
+        self._ensure_loaded()
+        return self._by_key.get(identity_key)
+
+    def _term_matches(self, term: str) -> frozenset:
+        hit = self._term_cache.get(term)
+        if hit is None:
+            ids = set(self._postings.get(term, ()))
+            for tok, plist in self._postings.items():
+                if term in tok:
+                    ids.update(plist)
+            hit = self._term_cache[term] = frozenset(ids)
+        return hit
+
+    def match_counts(self, terms: Iterable[str]) -> Dict[int, int]:
+        """record index -> number of query terms contained in its keyword text."""
+        self._ensure_loaded()
+        counts: Dict[int, int] = {}
+        for t in terms:
+            for i in self._term_matches(t):
+                counts[i] = counts.get(i, 0) + 1
+        return counts
+
+    def keyword_rank(self, query: str, exclude_employers: Iterable[str] = (), limit: int = 20) -> List[Dict]:
+        """
+        Same ordering as scoring every record by (keyword score, fai) descending
+        with a stable sort, but touches only matching records plus the top of a
+        prebuilt fai order to fill remaining slots with zero-score records.
+        """
+        self._ensure_loaded()
+        records = self._records
+        exclude = list(exclude_employers)
+
+        def excluded(c: Dict) -> bool:
+            employer = (c.get("company") or c.get("employer", "")).lower()
+            return any(ex in employer for ex in exclude)
+
+        terms = query.lower().split()
+        denom = max(len(terms), 1)
+        counts = self.match_counts(terms)
+
+        matched = [(i, counts[i] / denom) for i in sorted(counts) if not excluded(records[i])]
+        matched.sort(key=lambda x: (x[1], _fai(records[x[0]])), reverse=True)
+        out = [records[i] for i, _ in matched[:limit]]
+
+        if len(out) < limit:
+            for i in self._fai_order:
+                if i in counts or excluded(records[i]):
+                    continue
+                out.append(records[i])
+                if len(out) >= limit:
+                    break
+        return out
+
+
+_STORES: Dict[str, GoldStandardStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(path: str = GOLD_STANDARD_PATH) -> GoldStandardStore:
+    store = _STORES.get(path)
+    if store is None:
+        with _STORES_LOCK:
+            store = _STORES.setdefault(path, GoldStandardStore(path))
+    return store
@@ -18,8 +18,13 @@ Data sources (real, on-disk):
 This intentionally avoids placeholder data. If a file is missing, it returns empty arrays plus
 a diagnostics block so the UI can show what is missing instead of going blank.
 
-Version: v6.0.1
+Parsing is shared through backend/intelligence/artifact_cache.py: each storage file is
+parsed and normalized once per modification (mtime_ns + size); later calls reuse the
+frozen views. The backend_autoreload.log fallback reads only the tail.
+
+Version: v6.1.0
 Changelog:
+- v6.1.0 (2026-02-22): Memoized, mtime-invalidated loaders; tail-seek log reader.
 - v6.0.1 (2026-02-21): Introduce normalized real-data loaders and stable graph contract.
 - v6.0.0: Hyperscale v6 baseline.
 
@@ -34,10 +39,11 @@ Git:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from backend.intelligence.artifact_cache import derive, freeze, load_json, tail_lines
+
 
 def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -46,19 +52,21 @@ def _repo_root() -> Path:
 ROOT = _repo_root()
 STORAGE_DIR = ROOT / "backend" / "storage"
 
+OVERLAY_FILES = [
+    "ecosystem_state_store.json",
+    "signal_history_store.json",
+    "trajectory_store.json",
+    "intelligence_cache.json",
+]
+
 
 class ExecutiveGraphService:
     def __init__(self) -> None:
         self.storage_dir = STORAGE_DIR
 
     def _read_json(self, path: Path) -> Tuple[bool, Any, str]:
-        try:
-            if not path.exists():
-                return False, None, f"missing: {path}"
-            raw = path.read_text(encoding="utf-8")
-            return True, json.loads(raw), ""
-        except Exception as e:
-            return False, None, f"error reading {path}: {e}"
+        """Cached parse; the returned data is a shared read-only view."""
+        return load_json(path)
 
     def _normalize_identity_graph(self, data: Any) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
@@ -132,16 +140,15 @@ class ExecutiveGraphService:
         edges: List[Dict[str, Any]] = []
 
         if ok:
-            nodes, edges = self._normalize_identity_graph(data)
+            nodes, edges = derive(
+                identity_path,
+                "executive_graph_normalized",
+                lambda ok_, d: tuple(freeze(x) for x in self._normalize_identity_graph(d)) if ok_ else ([], []),
+            )
 
         # Optional enrichment overlays
         overlays = {}
-        for fname in [
-            "ecosystem_state_store.json",
-            "signal_history_store.json",
-            "trajectory_store.json",
-            "intelligence_cache.json",
-        ]:
+        for fname in OVERLAY_FILES:
             p = self.storage_dir / fname
             ok2, data2, err2 = self._read_json(p)
             diag["files"][fname] = {"ok": ok2, "error": err2}
@@ -149,8 +156,8 @@ class ExecutiveGraphService:
                 overlays[fname] = data2
 
         return {
-            "nodes": nodes,
-            "edges": edges,
+            "nodes": list(nodes),
+            "edges": list(edges),
             "overlays": overlays,
             "diagnostics": diag,
         }
@@ -216,9 +223,8 @@ class ExecutiveGraphService:
         log_path = ROOT / "backend_autoreload.log"
         if log_path.exists():
             try:
-                lines = log_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-                tail = lines[-50:]
-                return {"source": "backend_autoreload.log", "lines_total": len(lines), "tail": tail}
+                tail, total = tail_lines(log_path, 50)
+                return {"source": "backend_autoreload.log", "lines_total": total, "tail": tail}
             except Exception as e:
                 return {"source": "backend_autoreload.log", "error": str(e)}
 
@@ -4,21 +4,27 @@
 ###############################################################################
 
 import networkx as nx
-import json
 from pathlib import Path
 
+from backend.intelligence.artifact_cache import derive
+
 DATA_PATH = Path(__file__).resolve().parents[1] / "storage" / "identity_graph.json"
 
+def _build_graph(ok, graph):
+    G = nx.Graph()
+    if ok:
+        for node in graph["nodes"]:
+            G.add_node(node["id"], **node)
+        for edge in graph["edges"]:
+            G.add_edge(edge["source"], edge["target"], **edge)
+    return G
+
+
 class InfluenceMetricsEngine:
 
     def __init__(self):
-        self.G = nx.Graph()
-        if DATA_PATH.exists():
-            graph = json.loads(DATA_PATH.read_text())
-            for node in graph["nodes"]:
-                self.G.add_node(node["id"], **node)
-            for edge in graph["edges"]:
-                self.G.add_edge(edge["source"], edge["target"], **edge)
+        # Built once per identity_graph.json modification and shared; treat as read-only.
+        self.G = derive(DATA_PATH, "influence_nx_graph", _build_graph) if DATA_PATH.exists() else nx.Graph()
 
     def compute_metrics(self):
 
@@ -2,39 +2,42 @@
 Query Execution Router
 Routes query IDs and natural language queries to the correct intelligence engines,
 chains execution paths, and returns structured results with execution trace.
+
+Result cache: engine output (results, backend reasoning, trace) is memoized per
+(normalized query, query_meta filters, data generation) with a TTL and an LRU
+size bound. The data generation is the gold-standard store generation plus the
+stat of each vector index file, so rebuilding either invalidates every entry;
+invalidate_result_cache() drops them explicitly. Each response's execution trace
+starts with a "result_cache" step reporting hit or miss. Only results a live
+engine produced are cached: gold-standard fallback answers are recomputed on
+every call, so a recovered engine is used on the next call.
+
+Engine probes: the localhost engines are called through one pooled httpx.Client,
+each behind a circuit breaker. A failed probe (connection error, timeout or
+non-200) opens the breaker; while open the engine is skipped without a request.
+Once the backoff elapses a single half-open probe is let through: success closes
+the breaker, failure reopens it with the backoff doubled (up to a cap). Every
+engine step in the trace carries its breaker state.
 """
+import copy
 import json
 import os
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+from backend.intelligence.gold_standard_store import GOLD_STANDARD_PATH, get_store, keyword_text
 from backend.intelligence.query_library_loader import get_query_by_id, get_all_queries
 
-GOLD_STANDARD_PATH = "outputs/gold_standard.json"
-
 
 def _load_gold_standard() -> List[Dict]:
-    try:
-        with open(GOLD_STANDARD_PATH) as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else data.get("identities", [])
-    except Exception:
-        return []
+    return get_store(GOLD_STANDARD_PATH).records()
 
 
 def _keyword_match_score(candidate: Dict, query: str) -> float:
     terms = query.lower().split()
-    fields = [
-        candidate.get("name", ""),
-        candidate.get("company", ""),
-        candidate.get("title", ""),
-        candidate.get("role", ""),
-        str(candidate.get("determinants", "")),
-        str(candidate.get("papers", "")),
-        str(candidate.get("repos", "")),
-        str(candidate.get("notes", "")),
-    ]
-    text = " ".join(fields).lower()
+    text = keyword_text(candidate)
     score = sum(1 for t in terms if t in text)
     return score / max(len(terms), 1)
 
@@ -88,83 +91,283 @@ def _compute_influence(c: Dict) -> int:
     return min(100, base)
 
 
-def execute_by_query_id(query_id: str) -> Dict:
-    """Execute a query by its library ID with full engine chaining."""
-    q = get_query_by_id(query_id)
-    if not q:
-        return {"error": f"Query {query_id} not found in library", "results": []}
-    return execute_query(q["query"], query_meta=q)
+# ── Result cache ──────────────────────────────────────────────────────────
 
+RESULT_CACHE_TTL_S = 300
+RESULT_CACHE_MAX_ENTRIES = 256
+# Written by build_vector_index.py (vector_db/) and faiss_loader.py (outputs/)
+VECTOR_INDEX_PATHS = (
+    "vector_db/faiss.index",
+    "vector_db/faiss.index.npy",
+    "vector_db/identity_metadata.json",
+    "outputs/faiss.index",
+)
 
-def execute_query(query: str, query_meta: Optional[Dict] = None) -> Dict:
-    """Execute a natural language query through the intelligence pipeline."""
-    start = time.time()
-    trace = []
-    results = []
-    reasoning = ""
-    summary_blocks = {}
 
-    # ── Try live backend engines ──────────────────────────────────────────
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
     try:
-        import httpx
-        # Try vector search
-        trace.append({"engine": "faiss_vector_search", "status": "attempting", "ts": time.time()})
-        r = httpx.post("http://127.0.0.1:8000/api/vector/query",
-                       json={"query": query, "top_k": 20}, timeout=4.0)
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def data_generation() -> Tuple:
+    store = get_store(GOLD_STANDARD_PATH)
+    store.records()  # stat check; bumps store.generation when the file was rewritten
+    return (store.generation,) + tuple(_file_stamp(p) for p in VECTOR_INDEX_PATHS)
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+def _cache_key(query: str, query_meta: Optional[Dict]) -> str:
+    filters = (query_meta or {}).get("filters", {})
+    return _normalize_query(query) + "\x00" + json.dumps(filters, sort_keys=True, default=str)
+
+
+class _ResultCache:
+
+    def __init__(self, ttl_s: float = RESULT_CACHE_TTL_S, max_entries: int = RESULT_CACHE_MAX_ENTRIES):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._generation = None
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "invalidations": 0}
+
+    def _check_generation(self, generation) -> None:
+        if generation != self._generation:
+            if self._generation is not None:
+                self._entries.clear()
+                self.stats["invalidations"] += 1
+            self._generation = generation
+
+    def get(self, key: str, generation) -> Optional[Tuple[float, Dict]]:
+        with self._lock:
+            self._check_generation(generation)
+            hit = self._entries.get(key)
+            if hit is not None and time.time() - hit[0] > self.ttl_s:
+                del self._entries[key]
+                self.stats["expired"] += 1
+                hit = None
+            if hit is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return hit
+
+    def put(self, key: str, generation, value: Dict) -> None:
+        with self._lock:
+            self._check_generation(generation)
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats["invalidations"] += 1
+
+
+_RESULT_CACHE = _ResultCache()
+
+
+def invalidate_result_cache() -> None:
+    """Drop all cached query results (call after rebuilding gold_standard.json or the vector index)."""
+    _RESULT_CACHE.clear()
+
+
+def result_cache_stats() -> Dict:
+    with _RESULT_CACHE._lock:
+        out = dict(_RESULT_CACHE.stats)
+        out["entries"] = len(_RESULT_CACHE._entries)
+    return out
+
+
+# ── Engine probes: pooled client + circuit breakers ──────────────────────
+
+ENGINE_BASE_URL = "http://127.0.0.1:8000"
+ENGINE_TIMEOUT_S = 4.0
+BREAKER_BACKOFF_S = 5.0
+BREAKER_MAX_BACKOFF_S = 120.0
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class _CircuitBreaker:
+
+    def __init__(self, name: str, backoff_s: float = BREAKER_BACKOFF_S, max_backoff_s: float = BREAKER_MAX_BACKOFF_S):
+        self.name = name
+        self.base_backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.state = CLOSED
+        self.backoff_s = backoff_s
+        self.opened_at = 0.0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True if a request may go out; moves open -> half_open once the backoff elapsed."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.time() - self.opened_at >= self.backoff_s:
+                self.state = HALF_OPEN
+                return True
+            return False  # open, or a half-open probe is already in flight
+
+    def retry_in_s(self) -> float:
+        return max(0.0, round(self.opened_at + self.backoff_s - time.time(), 1))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.backoff_s = self.base_backoff_s
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.backoff_s = min(self.backoff_s * 2, self.max_backoff_s)
+            self.state = OPEN
+            self.failures += 1
+            self.opened_at = time.time()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            out = {"state": self.state, "failures": self.failures, "backoff_s": self.backoff_s}
+        if out["state"] == OPEN:
+            out["retry_in_s"] = self.retry_in_s()
+        return out
+
+
+_BREAKERS = {
+    "faiss_vector_search": _CircuitBreaker("faiss_vector_search"),
+    "executive_intelligence": _CircuitBreaker("executive_intelligence"),
+}
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _http_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                import httpx
+                _client = httpx.Client(
+                    base_url=ENGINE_BASE_URL,
+                    timeout=ENGINE_TIMEOUT_S,
+                    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+                )
+    return _client
+
+
+def breaker_states() -> Dict[str, Dict]:
+    return {name: b.snapshot() for name, b in _BREAKERS.items()}
+
+
+def _probe_engine(engine: str, path: str, query: str, trace: List[Dict]):
+    """POST to a localhost engine behind its breaker; returns parsed JSON or None."""
+    breaker = _BREAKERS[engine]
+    if not breaker.allow():
+        trace.append({"engine": engine, "status": "skipped (circuit open)", "ts": time.time(),
+                      "breaker": OPEN, "retry_in_s": breaker.retry_in_s()})
+        return None
+
+    step = {"engine": engine, "status": "attempting", "ts": time.time(), "breaker": breaker.state}
+    trace.append(step)
+    try:
+        r = _http_client().post(path, json={"query": query, "top_k": 20})
         if r.status_code == 200:
             data = r.json()
-            raw = data if isinstance(data, list) else data.get("results", [])
-            results = [_enrich_candidate(c) for c in raw[:20]]
-            trace[-1]["status"] = "success"
-            trace[-1]["count"] = len(results)
-        else:
-            trace[-1]["status"] = "failed"
+            breaker.record_success()
+            step["status"] = "success"
+            step["breaker_after"] = breaker.state
+            return data
+        breaker.record_failure()
+        step["status"] = "failed"
     except Exception as e:
-        if trace: trace[-1]["status"] = f"offline ({str(e)[:40]})"
+        breaker.record_failure()
+        step["status"] = f"offline ({str(e)[:40]})"
+    step["breaker_after"] = breaker.state
+    return None
+
+
+def _run_engines(query: str, query_meta: Optional[Dict]) -> Tuple[List[Dict], str, List[Dict], bool]:
+    """Live engines, then gold-standard fallback; results sorted by FAI. The flag is True when a live engine answered."""
+    trace = []
+    results = []
+    reasoning = ""
+
+    # ── Try live backend engines ──────────────────────────────────────────
+    data = _probe_engine("faiss_vector_search", "/api/vector/query", query, trace)
+    if data is not None:
+        raw = data if isinstance(data, list) else data.get("results", [])
+        results = [_enrich_candidate(c) for c in raw[:20]]
+        trace[-1]["count"] = len(results)
 
     # ── Try intelligence/executive endpoint ──────────────────────────────
     if not results:
-        try:
-            import httpx
-            trace.append({"engine": "executive_intelligence", "status": "attempting", "ts": time.time()})
-            r = httpx.post("http://127.0.0.1:8000/api/intelligence/query",
-                           json={"query": query, "top_k": 20}, timeout=4.0)
-            if r.status_code == 200:
-                data = r.json()
-                results = data.get("results", [])
-                reasoning = data.get("summary") or data.get("reasoning", "")
-                trace[-1]["status"] = "success"
-            else:
-                trace[-1]["status"] = "failed"
-        except Exception as e:
-            if trace: trace[-1]["status"] = f"offline ({str(e)[:40]})"
+        data = _probe_engine("executive_intelligence", "/api/intelligence/query", query, trace)
+        if isinstance(data, dict):
+            results = data.get("results", [])
+            reasoning = data.get("summary") or data.get("reasoning", "")
+
+    live = bool(results)
 
     # ── Fallback: gold_standard.json ─────────────────────────────────────
     if not results:
         trace.append({"engine": "gold_standard_fallback", "status": "active", "ts": time.time()})
-        data = _load_gold_standard()
-        if data:
-            q_lower = query.lower()
+        store = get_store(GOLD_STANDARD_PATH)
+        if store.records():
             exclude = []
             if query_meta:
                 exclude = [e.lower() for e in query_meta.get("filters", {}).get("exclude_employers", [])]
 
-            scored = []
-            for c in data:
-                employer = (c.get("company") or c.get("employer", "")).lower()
-                if any(ex in employer for ex in exclude):
-                    continue
-                ms = _keyword_match_score(c, q_lower)
-                fai = c.get("fai") or c.get("eqi") or 75
-                scored.append((c, ms, fai))
-
-            scored.sort(key=lambda x: (x[1], x[2]), reverse=True)
-            results = [_enrich_candidate(c) for c, _, _ in scored[:20]]
+            ranked = store.keyword_rank(query, exclude_employers=exclude, limit=20)
+            results = [_enrich_candidate(c) for c in ranked]
             trace[-1]["status"] = "success"
             trace[-1]["count"] = len(results)
 
     # ── Sort by FAI ───────────────────────────────────────────────────────
     results.sort(key=lambda x: x.get("fai", 0), reverse=True)
+    return results, reasoning, trace, live
+
+
+def execute_by_query_id(query_id: str) -> Dict:
+    """Execute a query by its library ID with full engine chaining."""
+    q = get_query_by_id(query_id)
+    if not q:
+        return {"error": f"Query {query_id} not found in library", "results": []}
+    return execute_query(q["query"], query_meta=q)
+
+
+def execute_query(query: str, query_meta: Optional[Dict] = None, use_cache: bool = True) -> Dict:
+    """Execute a natural language query through the intelligence pipeline."""
+    start = time.time()
+    summary_blocks = {}
+
+    key = _cache_key(query, query_meta)
+    generation = data_generation()
+    hit = _RESULT_CACHE.get(key, generation) if use_cache else None
+    if hit is not None:
+        cached_at, cached = hit
+        cached = copy.deepcopy(cached)
+        results, reasoning = cached["results"], cached["reasoning"]
+        trace = [{"engine": "result_cache", "status": "hit", "ts": time.time(),
+                  "age_ms": round((time.time() - cached_at) * 1000)}] + cached["trace"]
+    else:
+        results, reasoning, engine_trace, live = _run_engines(query, query_meta)
+        if use_cache and live:
+            _RESULT_CACHE.put(key, generation, copy.deepcopy(
+                {"results": results, "reasoning": reasoning, "trace": engine_trace}))
+        trace = [{"engine": "result_cache", "status": "miss" if use_cache else "bypass", "ts": start}] + engine_trace
 
     # ── Build reasoning / summary ─────────────────────────────────────────
     if not reasoning and results:
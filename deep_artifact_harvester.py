@@ -3,8 +3,17 @@
 AI Talent Engine — Deep Artifact + Contact Harvester (Crawler)
 © 2025 L. David Mendoza
 
-Version: v1.2.0 (2026-01-01)
+Version: v1.5.1 (2026-10-18)
 Changelog:
+- v1.5.1: The whole body is read again for text (emails/phones); MAX_LINKS_PER_PAGE
+          only caps link collection, so contacts after the cap are not lost.
+- v1.5.0: HTML responses are streamed through EXECUTION_CORE/html_stream.py (HtmlStream):
+          links (href/src, entity-decoded) and visible text are taken while the body is
+          read, which stops at MAX_LINKS_PER_PAGE. Replaces the whole-body regexes and the
+          body-hash memo of v1.3.0; the summary reports streamed / link-capped pages.
+- v1.4.0: normalize_url delegates to the shared memoized URL engine (EXECUTION_CORE/url_canon.py).
+- v1.3.0: HTML text/link extraction memoized by body hash + extractor version + page URL
+          (EXECUTION_CORE/extraction_cache.py); per-run hit rate printed with the summary.
 - v1.2.0: Adds Hugging Face discovery + model/space/org URL extraction.
 - v1.1.0: Adds provenance splitting (contact vs research URLs) + stronger de-duplication.
 - v1.0.0: Bounded crawler for github.io + linked public pages/docs; extracts emails/phones + key URLs.
@@ -41,7 +50,10 @@ import hashlib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse, urldefrag
+from urllib.parse import urljoin, urlparse
+
+from EXECUTION_CORE.html_stream import CHUNK_BYTES, HtmlStream, decode_chunks, feed_chunks
+from EXECUTION_CORE.url_canon import strip_fragment
 
 try:
     import requests
@@ -70,8 +82,7 @@ PHONE_RE = re.compile(
     r"(?!\d)"
 )
 
-HREF_RE = re.compile(r'(?i)\bhref\s*=\s*["\']([^"\']+)["\']')
-SRC_RE = re.compile(r'(?i)\bsrc\s*=\s*["\']([^"\']+)["\']')
+MAX_LINKS_PER_PAGE = 5000
 
 # URL classifiers
 def is_http_url(u: str) -> bool:
@@ -82,9 +93,7 @@ def is_http_url(u: str) -> bool:
         return False
 
 def normalize_url(u: str) -> str:
-    u = u.strip()
-    u, _frag = urldefrag(u)
-    return u
+    return strip_fragment(u)
 
 def same_host(a: str, b: str) -> bool:
     try:
@@ -141,32 +150,34 @@ def extract_github_username(row: Dict[str, str]) -> Optional[str]:
                 pass
     return None
 
-def extract_text_and_links_from_html(html: str, base_url: str) -> Tuple[str, Set[str]]:
+def html_stream() -> HtmlStream:
+    return HtmlStream(link_attrs=("href", "src"), text=True, max_links=MAX_LINKS_PER_PAGE)
+
+def text_and_links(page: HtmlStream, base_url: str) -> Tuple[str, Set[str]]:
     links: Set[str] = set()
-    for m in HREF_RE.finditer(html):
-        u = safe_join(base_url, m.group(1))
-        if u:
-            links.add(u)
-    for m in SRC_RE.finditer(html):
-        u = safe_join(base_url, m.group(1))
+    for href in page.links:
+        u = safe_join(base_url, href)
         if u:
             links.add(u)
-    # naive text extraction: strip tags
-    text = re.sub(r"(?s)<script.*?>.*?</script>", " ", html)
-    text = re.sub(r"(?s)<style.*?>.*?</style>", " ", text)
-    text = re.sub(r"(?s)<.*?>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text, links
-
-def fetch(session: requests.Session, url: str, timeout: int) -> Tuple[Optional[str], Optional[bytes], Optional[str]]:
+    return page.text, links
+
+def extract_text_and_links_from_html(html: str, base_url: str) -> Tuple[str, Set[str]]:
+    return text_and_links(feed_chunks(html_stream(), [html]), base_url)
+
+def fetch(session: requests.Session, url: str, timeout: int) -> Tuple[Optional[HtmlStream], Optional[bytes], Optional[str]]:
+    """
+    (page, blob, content_type). Text responses are streamed into an HtmlStream and
+    never held whole; other bodies (PDFs) are returned as bytes.
+    """
     try:
-        r = session.get(url, timeout=timeout, headers={"User-Agent": USER_AGENT}, allow_redirects=True)
-        ct = (r.headers.get("Content-Type") or "").lower()
-        if r.status_code >= 400:
-            return None, None, ct
-        if "text/html" in ct or ct.startswith("text/"):
-            return r.text, None, ct
-        return None, r.content, ct
+        with session.get(url, timeout=timeout, headers={"User-Agent": USER_AGENT}, allow_redirects=True, stream=True) as r:
+            ct = (r.headers.get("Content-Type") or "").lower()
+            if r.status_code >= 400:
+                return None, None, ct
+            if "text/html" in ct or ct.startswith("text/"):
+                page = feed_chunks(html_stream(), decode_chunks(r.iter_content(CHUNK_BYTES), r.encoding))
+                return page, None, ct
+            return None, r.content, ct
     except Exception:
         return None, None, None
 
@@ -215,6 +226,9 @@ class HarvestResult:
     contact_provenance: Dict[str, Set[str]] = field(default_factory=dict)
     research_provenance: Dict[str, Set[str]] = field(default_factory=dict)
 
+    html_pages: int = 0
+    html_pages_link_capped: int = 0
+
 def classify_url(u: str):
     du = domain(u)
     ul = u.lower()
@@ -352,11 +366,13 @@ def bounded_crawl(
         seen.add(url)
         pages += 1
 
-        html, blob, ct = fetch(session, url, timeout)
+        page, blob, ct = fetch(session, url, timeout)
         ingest_url(url, where=url)
 
-        if html:
-            text, links = extract_text_and_links_from_html(html, url)
+        if page is not None and page.chars_fed:
+            result.html_pages += 1
+            result.html_pages_link_capped += int(page.capped)
+            text, links = text_and_links(page, url)
             ingest_text(text, where=url)
 
             # Ingest mailto/tel links too
@@ -472,6 +488,7 @@ def main() -> int:
             fieldnames.append(c)
 
     session = requests.Session()
+    html_pages = html_pages_capped = 0
 
     for i, row in enumerate(rows):
         gh_user = extract_github_username(row) or ""
@@ -503,6 +520,8 @@ def main() -> int:
             max_pages=max(1, args.max_pages),
             timeout=max(5, args.timeout),
         )
+        html_pages += harvest.html_pages
+        html_pages_capped += harvest.html_pages_link_capped
 
         # Primary email/phone: pick first in sorted list (deterministic)
         emails_sorted = sorted(harvest.emails)
@@ -568,6 +587,7 @@ def main() -> int:
             writer.writerow(r)
 
     print(f"SUCCESS: Deep harvest complete → {outp}")
+    print(f"html pages streamed: {html_pages} ({html_pages_capped} with links capped at {MAX_LINKS_PER_PAGE})")
 
     if args.open:
         try:
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+AI Talent Engine — Unified Enrichment Engine (Async, Pluggable Sources)
+Version: v1.0.0
+Date: 2026-01-06
+© 2026 L. David Mendoza. All Rights Reserved.
+
+PURPOSE
+Single enrichment engine shared by ai_talent_enrichment_pro.py and
+autogen_enrichment_fetcher_pro.py. It replaces their duplicated
+fetch_github / fetch_huggingface / fetch_scholar / fetch_semantic helpers.
+
+MODEL
+- One SourceAdapter per public source (GitHub, Hugging Face, Semantic Scholar,
+  Google Scholar link). Each adapter derives its lookup key from a row and
+  returns a flat dict of output columns.
+- All enabled sources for a row are fanned out concurrently on one asyncio loop.
+- Identical (source, key) lookups across rows are deduped: the first row starts
+  the request and every other row awaits the same task (shared cache).
+- Each source has its own concurrency semaphore and min-interval rate limiter,
+  configured from scrape_settings in config.yaml:
+
+    scrape_settings:
+      max_threads: 6           # default per-source concurrency
+      delay_seconds: 2         # legacy per-row politeness delay
+      timeout_seconds: 10
+      user_agent: "..."
+      source_concurrency:      # optional, overrides max_threads per source
+        github: 6
+        huggingface: 2
+        semantic: 1
+      source_min_interval_seconds:   # optional, default delay_seconds / max_threads
+        semantic: 1.0
+
+The legacy "enrichment:" block (max_threads / delay_seconds) is accepted in
+place of scrape_settings.
+Output columns and evidence_urls ordering match the legacy scripts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import quote
+
+import requests
+
+SOURCE_ORDER = ("github", "huggingface", "scholar", "semantic")
+
+
+# ---------------------------
+# Rate limiting
+# ---------------------------
+
+class AsyncRateLimiter:
+    """Min-interval limiter; callers reserve slots under an asyncio lock."""
+
+    def __init__(self, min_interval_s: float) -> None:
+        self.min_interval_s = max(0.0, float(min_interval_s))
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        if self.min_interval_s <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.min_interval_s
+        delay = slot - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# ---------------------------
+# Source adapters
+# ---------------------------
+
+def name_from_row(row: Dict[str, Any]) -> str:
+    name = row.get("full_name") or ""
+    return name if isinstance(name, str) else ""
+
+
+def handle_from_row(row: Dict[str, Any]) -> str:
+    name = name_from_row(row)
+    return name.split()[0].lower() if name.strip() else ""
+
+
+class SourceAdapter:
+    name = ""
+    network = True
+
+    def __init__(self, settings: Dict[str, Any], auth: Dict[str, Any]) -> None:
+        self.timeout = settings.get("timeout_seconds", 10)
+        self.user_agent = settings.get("user_agent", "AITalentBot/1.0")
+        self.auth = auth
+
+    def key_for(self, row: Dict[str, Any]) -> str:
+        return handle_from_row(row)
+
+    def fetch(self, session: requests.Session, key: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class GitHubAdapter(SourceAdapter):
+    name = "github"
+
+    def fetch(self, session, key):
+        headers = {"User-Agent": self.user_agent}
+        tok = self.auth.get("github_token") or os.getenv("GITHUB_TOKEN")
+        if tok:
+            headers["Authorization"] = f"token {tok}"
+        r = session.get(f"https://api.github.com/users/{key}", headers=headers, timeout=self.timeout)
+        if r.status_code == 200:
+            d = r.json()
+            return {
+                "github_url": d.get("html_url"),
+                "github_followers": d.get("followers", 0),
+                "github_repos": d.get("public_repos", 0),
+                "github_bio": d.get("bio", ""),
+            }
+        return {}
+
+
+class HuggingFaceAdapter(SourceAdapter):
+    name = "huggingface"
+
+    def fetch(self, session, key):
+        headers = {"User-Agent": self.user_agent}
+        tok = self.auth.get("huggingface_token") or os.getenv("HF_TOKEN")
+        if tok:
+            headers["Authorization"] = f"Bearer {tok}"
+        r = session.get(f"https://huggingface.co/api/users/{key}", headers=headers, timeout=self.timeout)
+        if r.status_code == 200:
+            d = r.json()
+            return {
+                "huggingface_url": f"https://huggingface.co/{key}",
+                "huggingface_models": len(d.get("models", [])),
+                "huggingface_likes": d.get("likes", 0),
+            }
+        return {}
+
+
+class ScholarLinkAdapter(SourceAdapter):
+    name = "scholar"
+    network = False
+
+    def key_for(self, row):
+        return name_from_row(row)
+
+    def fetch(self, session, key):
+        return {"scholar_url": f"https://scholar.google.com/scholar?q={key.replace(' ', '+')}"}
+
+
+class SemanticScholarAdapter(SourceAdapter):
+    name = "semantic"
+
+    def key_for(self, row):
+        return name_from_row(row)
+
+    def fetch(self, session, key):
+        url = (
+            "https://api.semanticscholar.org/graph/v1/author/search"
+            f"?query={quote(key)}&limit=1&fields=name,paperCount,citationCount,url"
+        )
+        headers = {"User-Agent": self.user_agent}
+        tok = self.auth.get("semantic_token") or os.getenv("SEMANTIC_TOKEN")
+        if tok:
+            headers["x-api-key"] = tok
+        r = session.get(url, headers=headers, timeout=self.timeout)
+        if r.status_code == 200:
+            j = r.json()
+            if j.get("data"):
+                a = j["data"][0]
+                return {
+                    "semantic_url": a.get("url"),
+                    "semantic_papers": a.get("paperCount", 0),
+                    "semantic_citations": a.get("citationCount", 0),
+                }
+        return {}
+
+
+ADAPTERS = {
+    "github": GitHubAdapter,
+    "huggingface": HuggingFaceAdapter,
+    "scholar": ScholarLinkAdapter,
+    "semantic": SemanticScholarAdapter,
+}
+
+
+# ---------------------------
+# Engine
+# ---------------------------
+
+class EnrichmentEngine:
+    def __init__(
+        self,
+        sources: Sequence[str],
+        settings: Dict[str, Any],
+        auth: Optional[Dict[str, Any]] = None,
+        adapters: Optional[Dict[str, type]] = None,
+    ) -> None:
+        registry = adapters or ADAPTERS
+        auth = auth or {}
+        self.settings = settings
+        self.adapters: List[SourceAdapter] = [
+            registry[s](settings, auth) for s in SOURCE_ORDER if s in sources and s in registry
+        ]
+
+        default_conc = int(settings.get("max_threads", 4) or 4)
+        conc = settings.get("source_concurrency", {}) or {}
+        self.concurrency = {a.name: max(1, int(conc.get(a.name, default_conc))) for a in self.adapters}
+
+        legacy_delay = float(settings.get("delay_seconds", 0) or 0)
+        default_interval = legacy_delay / max(1, default_conc)
+        intervals = settings.get("source_min_interval_seconds", {}) or {}
+        self.min_interval = {
+            a.name: float(intervals.get(a.name, 0.0 if not a.network else default_interval)) for a in self.adapters
+        }
+
+        self.stats = {a.name: {"requests": 0, "deduped": 0, "errors": 0} for a in self.adapters}
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any], sources: Optional[Iterable[str]] = None) -> "EnrichmentEngine":
+        enabled = cfg.get("data_sources", {}) or {}
+        wanted = [s for s in SOURCE_ORDER if enabled.get(s)]
+        if sources is not None:
+            allowed = set(sources)
+            wanted = [s for s in wanted if s in allowed]
+        settings = cfg.get("scrape_settings") or cfg.get("enrichment") or {}
+        return cls(wanted, settings, cfg.get("auth", {}) or {})
+
+    def enrich_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Enrich rows in place (same order); returns the list."""
+        return asyncio.run(self._enrich_all(records))
+
+    async def _enrich_all(self, records):
+        loop = asyncio.get_running_loop()
+        workers = max(1, sum(self.concurrency.values()))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        sessions: Dict[str, requests.Session] = {a.name: requests.Session() for a in self.adapters}
+        sems = {a.name: asyncio.Semaphore(self.concurrency[a.name]) for a in self.adapters}
+        limiters = {a.name: AsyncRateLimiter(self.min_interval[a.name]) for a in self.adapters}
+        tasks: Dict[tuple, asyncio.Task] = {}
+
+        async def lookup(adapter: SourceAdapter, key: str) -> Dict[str, Any]:
+            async with sems[adapter.name]:
+                if adapter.network:
+                    await limiters[adapter.name].wait()
+                self.stats[adapter.name]["requests"] += 1
+                try:
+                    return await loop.run_in_executor(pool, adapter.fetch, sessions[adapter.name], key)
+                except Exception as e:
+                    self.stats[adapter.name]["errors"] += 1
+                    print(f"⚠️ {adapter.name} fetch error for {key}: {e}")
+                    return {}
+
+        def shared(adapter: SourceAdapter, key: str) -> asyncio.Task:
+            k = (adapter.name, key)
+            t = tasks.get(k)
+            if t is None:
+                t = tasks[k] = asyncio.ensure_future(lookup(adapter, key))
+            else:
+                self.stats[adapter.name]["deduped"] += 1
+            return t
+
+        async def enrich_row(row):
+            pending = []
+            for a in self.adapters:
+                key = a.key_for(row)
+                if key:
+                    pending.append(shared(a, key))
+            result: Dict[str, Any] = {}
+            for part in await asyncio.gather(*pending):
+                result.update(part)
+            row.update(result)
+            row["evidence_urls"] = "; ".join(
+                [v for v in result.values() if isinstance(v, str) and v.startswith("http")]
+            )
+            return row
+
+        try:
+            await asyncio.gather(*(enrich_row(r) for r in records))
+        finally:
+            pool.shutdown(wait=True)
+            for s in sessions.values():
+                s.close()
+        return records
+
+    def print_stats(self) -> None:
+        for name, s in self.stats.items():
+            print(
+                f"   {name}: requests={s['requests']} deduped={s['deduped']} errors={s['errors']} "
+                f"concurrency={self.concurrency[name]}"
+            )
@@ -6,7 +6,7 @@ AI Talent Engine | Research-First Sourcer Automation
 File: run_people_pipeline.py
 
 Author: © 2026 L. David Mendoza. All rights reserved.
-Version: v1.2.0-phase1-flat-output-authoritative-rowcount
+Version: v1.3.1-phase1-throttled-enumeration
 Date: 2026-01-06
 
 PURPOSE (LOCKED)
@@ -24,6 +24,18 @@ CRITICAL GUARANTEE
 people_master.csv must contain ALL accepted rows (not just hydrated subset).
 Optional detail hydration enriches some columns, but NEVER changes rowcount.
 
+CONCURRENCY (v1.3.1)
+- Search pages are requested one at a time, each only after the previous page
+  is merged, so the sequential stop rules decide every request and the call
+  count equals the sequential loop's. Requests are throttled to the GitHub
+  Search API budget (30 requests/min authenticated).
+  (v1.3.0 fetched queries from a worker pool; workers paginated on a stale
+  accepted count and spent several times the sequential search calls.)
+- Search result pages are cached per (query, page, per_page) under
+  .cache/run_people_pipeline/ with a TTL, so re-runs do not re-spend budget.
+- Detail hydration covers ALL accepted rows by default (--detail-lookups -1)
+  through a concurrent path. A failed lookup leaves that row unhydrated.
+
 VALIDATION (run from repo root)
 1) Token:
    echo "$GITHUB_TOKEN" | wc -c
@@ -44,11 +56,15 @@ git push
 
 import argparse
 import csv
+import hashlib
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import urllib.request
 import json
@@ -57,7 +73,13 @@ import json
 DEFAULT_MIN_PEOPLE = 25
 DEFAULT_PER_PAGE = 100
 DEFAULT_MAX_PAGES_PER_QUERY = 5
-DEFAULT_DETAIL_LOOKUPS = 1
+DEFAULT_DETAIL_LOOKUPS = -1  # -1 hydrates all accepted rows, 0 disables
+
+DEFAULT_DETAIL_WORKERS = 8
+SEARCH_REQUESTS_PER_MINUTE = 30
+
+DEFAULT_CACHE_DIR = ".cache/run_people_pipeline"
+DEFAULT_CACHE_TTL_HOURS = 12.0
 
 
 def eprint(msg: str) -> None:
@@ -103,6 +125,83 @@ def log_rate_limit(headers: Dict[str, str]) -> None:
         print(f"RateLimit: remaining={remaining} limit={limit} reset_utc={reset_utc}")
 
 
+class SearchRateLimiter:
+    """
+    Thread-safe minimum-interval limiter for the GitHub Search API.
+    Each caller reserves the next free slot under the lock and sleeps outside it.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self.interval = 60.0 / max(1, int(requests_per_minute))
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class SearchPageCache:
+    """
+    On-disk cache of search result pages keyed by (query, page, per_page).
+    Entries older than ttl_hours are treated as misses. Writes are atomic.
+    """
+
+    def __init__(self, cache_dir: str, ttl_hours: float) -> None:
+        self.cache_dir = cache_dir
+        self.ttl_seconds = max(0.0, float(ttl_hours)) * 3600.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        safe_mkdir(cache_dir)
+
+    def _path(self, q: str, page: int, per_page: int) -> str:
+        key = hashlib.sha256(f"{q}\x1f{page}\x1f{per_page}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"search_{key}.json")
+
+    def get(self, q: str, page: int, per_page: int) -> Optional[Dict]:
+        p = self._path(q, page, per_page)
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            fresh = (time.time() - float(entry.get("fetched_at", 0))) <= self.ttl_seconds
+        except Exception:
+            entry, fresh = None, False
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry.get("payload") if fresh else None
+
+    def set(self, q: str, page: int, per_page: int, payload: Dict) -> None:
+        p = self._path(q, page, per_page)
+        tmp = f"{p}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"query": q, "page": page, "per_page": per_page,
+                           "fetched_at": time.time(), "payload": payload}, f, ensure_ascii=False)
+            os.replace(tmp, p)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except Exception:
+                pass
+
+
+def github_headers(token: str) -> Dict[str, str]:
+    return {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {token}",
+        "User-Agent": "AI-Talent-Engine-Phase1",
+    }
+
+
 def is_bot_login(login: str) -> bool:
     s = (login or "").lower()
     return (
@@ -180,6 +279,43 @@ class PersonRow:
     Retrieved_At_UTC: str
 
 
+@dataclass
+class SearchPage:
+    page: int
+    status: int
+    total_count: int
+    items: List[Dict]
+    url: str
+    cached: bool
+
+
+def fetch_search_page(
+    q: str,
+    page: int,
+    headers: Dict[str, str],
+    per_page: int,
+    limiter: SearchRateLimiter,
+    cache: Optional[SearchPageCache],
+) -> SearchPage:
+    """
+    One search result page, from the cache when fresh, else one throttled request.
+    """
+    url = build_search_url(q, per_page=per_page, page=page)
+    payload = cache.get(q, page, per_page) if cache is not None else None
+    cached = payload is not None
+    status = 200
+    if not cached:
+        limiter.wait()
+        payload, resp_headers, status = http_get_json(url, headers=headers)
+        log_rate_limit(resp_headers)
+        if cache is not None and status == 200:
+            cache.set(q, page, per_page, payload)
+
+    items = payload.get("items", []) or []
+    total_count = int(payload.get("total_count", 0) or 0)
+    return SearchPage(page=page, status=int(status), total_count=total_count, items=items, url=url, cached=cached)
+
+
 def enumerate_candidates(
     token: str,
     scenario: str,
@@ -187,22 +323,30 @@ def enumerate_candidates(
     per_page: int,
     max_pages_per_query: int,
     hard_cap_total: int,
+    cache: Optional[SearchPageCache] = None,
 ) -> Tuple[List[Tuple[Candidate, str, int, int]], List[Tuple[str, str]]]:
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {token}",
-        "User-Agent": "AI-Talent-Engine-Phase1",
-    }
+    """
+    Enumerate candidates across all scenario queries.
+
+    Every page is requested only after the previous one is merged, so the stop
+    rules (empty page, minimum met after page 2, hard cap, minimum met after a
+    query) decide each request exactly as in the sequential loop. Requests are
+    throttled to SEARCH_REQUESTS_PER_MINUTE.
+    """
+    headers = github_headers(token)
+    limiter = SearchRateLimiter(SEARCH_REQUESTS_PER_MINUTE)
 
     queries = scenario_queries(scenario)
     print(f"Scenario: {scenario}")
     print(f"Queries planned: {len(queries)}")
+    print(f"Search budget: {SEARCH_REQUESTS_PER_MINUTE}/min")
     print("")
 
     accepted: List[Tuple[Candidate, str, int, int]] = []
     discards: List[Tuple[str, str]] = []
     seen = set()
     pages_fetched = 0
+    pages_from_cache = 0
     total_items_seen = 0
 
     for qi, q in enumerate(queries, start=1):
@@ -212,17 +356,16 @@ def enumerate_candidates(
         discarded_for_q = 0
 
         for page in range(1, max_pages_per_query + 1):
-            url = build_search_url(q, per_page=per_page, page=page)
-            payload, resp_headers, status = http_get_json(url, headers=headers)
-            log_rate_limit(resp_headers)
+            sp = fetch_search_page(q, page, headers, per_page, limiter, cache)
 
             pages_fetched += 1
-            items = payload.get("items", []) or []
-            total_count = int(payload.get("total_count", 0) or 0)
+            pages_from_cache += 1 if sp.cached else 0
+            items = sp.items
             query_total_for_q += len(items)
             total_items_seen += len(items)
 
-            print(f"  Page {page}/{max_pages_per_query}: status={status} total_count={total_count} items={len(items)} url={url}")
+            src = " (cache)" if sp.cached else ""
+            print(f"  Page {page}/{max_pages_per_query}: status={sp.status} total_count={sp.total_count} items={len(items)} url={sp.url}{src}")
 
             if not items:
                 print("  No items returned on this page. Ending pagination for this query.")
@@ -273,7 +416,7 @@ def enumerate_candidates(
             break
 
     print("Enumeration summary:")
-    print(f"  Pages fetched: {pages_fetched}")
+    print(f"  Pages fetched: {pages_fetched} (from cache: {pages_from_cache})")
     print(f"  Total items seen: {total_items_seen}")
     print(f"  Unique accepted: {len(accepted)}")
     print(f"  Unique discarded reasons logged: {len(discards)}")
@@ -290,49 +433,65 @@ def enumerate_candidates(
     return accepted, discards
 
 
+def _apply_user_payload(row: PersonRow, payload: Dict) -> None:
+    row.GitHub_URL = (payload.get("html_url") or row.GitHub_URL or "").strip()
+    row.Name = (payload.get("name") or "").strip()
+    row.Company = (payload.get("company") or "").strip()
+    row.Blog = (payload.get("blog") or "").strip()
+    row.Location = (payload.get("location") or "").strip()
+    row.Email = (payload.get("email") or "").strip()
+    row.Bio = (payload.get("bio") or "").strip()
+    row.Followers = str(payload.get("followers") or "").strip()
+    row.Following = str(payload.get("following") or "").strip()
+    row.Public_Repos = str(payload.get("public_repos") or "").strip()
+    row.Created_At = (payload.get("created_at") or "").strip()
+    row.Updated_At = (payload.get("updated_at") or "").strip()
+
+
 def hydrate_user_details_in_place(
     token: str,
     rows: List[PersonRow],
     max_detail_lookups: int,
-) -> None:
+    workers: int = DEFAULT_DETAIL_WORKERS,
+) -> int:
     """
-    Optional detail hydration for the first N rows only.
-    CRITICAL: Never changes rowcount.
+    Optional detail hydration. max_detail_lookups < 0 hydrates every row,
+    0 disables, N hydrates the first N rows. Lookups run concurrently and
+    each worker writes only to its own row.
+    CRITICAL: Never changes rowcount. A failed lookup leaves the row as-is.
+    Returns the number of rows hydrated.
     """
-    if max_detail_lookups <= 0:
-        return
+    if max_detail_lookups == 0 or not rows:
+        return 0
 
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {token}",
-        "User-Agent": "AI-Talent-Engine-Phase1",
-    }
+    headers = github_headers(token)
+    n = len(rows) if max_detail_lookups < 0 else min(len(rows), max_detail_lookups)
 
-    n = min(len(rows), max_detail_lookups)
-    for idx in range(n):
-        login = rows[idx].GitHub_Username
-        url = build_user_url(login)
+    def lookup(idx: int) -> Tuple[int, Optional[Dict], Dict[str, str]]:
+        url = build_user_url(rows[idx].GitHub_Username)
         payload, resp_headers, status = http_get_json(url, headers=headers)
-        log_rate_limit(resp_headers)
-
-        if status != 200:
-            continue
-
-        rows[idx].GitHub_URL = (payload.get("html_url") or rows[idx].GitHub_URL or "").strip()
-        rows[idx].Name = (payload.get("name") or "").strip()
-        rows[idx].Company = (payload.get("company") or "").strip()
-        rows[idx].Blog = (payload.get("blog") or "").strip()
-        rows[idx].Location = (payload.get("location") or "").strip()
-        rows[idx].Email = (payload.get("email") or "").strip()
-        rows[idx].Bio = (payload.get("bio") or "").strip()
-        rows[idx].Followers = str(payload.get("followers") or "").strip()
-        rows[idx].Following = str(payload.get("following") or "").strip()
-        rows[idx].Public_Repos = str(payload.get("public_repos") or "").strip()
-        rows[idx].Created_At = (payload.get("created_at") or "").strip()
-        rows[idx].Updated_At = (payload.get("updated_at") or "").strip()
-
-        if (idx + 1) % 10 == 0:
-            print(f"  Hydrated {idx+1}/{n} profiles...")
+        return idx, (payload if status == 200 else None), resp_headers
+
+    hydrated = 0
+    done = 0
+    last_headers: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+        futures = [pool.submit(lookup, idx) for idx in range(n)]
+        for fut in as_completed(futures):
+            done += 1
+            try:
+                idx, payload, last_headers = fut.result()
+            except Exception as ex:
+                eprint(f"  Detail lookup failed (row left unhydrated): {ex}")
+                continue
+            if payload is not None:
+                _apply_user_payload(rows[idx], payload)
+                hydrated += 1
+            if done % 10 == 0:
+                print(f"  Hydrated {hydrated}/{n} profiles ({done} lookups done)...")
+
+    log_rate_limit(last_headers)
+    return hydrated
 
 
 def write_csv_excel_safe(path: str, rows: List[PersonRow]) -> None:
@@ -371,7 +530,11 @@ def main() -> int:
     p.add_argument("--per-page", type=int, default=DEFAULT_PER_PAGE, help="GitHub search per_page (max 100).")
     p.add_argument("--max-pages-per-query", type=int, default=DEFAULT_MAX_PAGES_PER_QUERY, help="Max pages per query.")
     p.add_argument("--hard-cap-total", type=int, default=200, help="Hard cap on total accepted people.")
-    p.add_argument("--detail-lookups", type=int, default=DEFAULT_DETAIL_LOOKUPS, help="Hydrate details for first N rows only (0 disables).")
+    p.add_argument("--detail-lookups", type=int, default=DEFAULT_DETAIL_LOOKUPS, help="Hydrate details for first N rows (-1 = all rows, 0 disables).")
+    p.add_argument("--detail-workers", type=int, default=DEFAULT_DETAIL_WORKERS, help="Concurrent profile lookups during hydration.")
+    p.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Search page cache directory.")
+    p.add_argument("--cache-ttl-hours", type=float, default=DEFAULT_CACHE_TTL_HOURS, help="Search page cache TTL in hours.")
+    p.add_argument("--no-cache", action="store_true", help="Disable the search page cache.")
     p.add_argument("--out-dir", default="outputs/people", help="Flat output directory for people artifacts.")
     args = p.parse_args()
 
@@ -394,6 +557,8 @@ def main() -> int:
 
     safe_mkdir(out_dir)
 
+    cache = None if args.no_cache else SearchPageCache(args.cache_dir, args.cache_ttl_hours)
+
     try:
         accepted, discards = enumerate_candidates(
             token=token,
@@ -402,6 +567,7 @@ def main() -> int:
             per_page=args.per_page,
             max_pages_per_query=args.max_pages_per_query,
             hard_cap_total=args.hard_cap_total,
+            cache=cache,
         )
     except Exception as ex:
         eprint(str(ex))
@@ -440,9 +606,15 @@ def main() -> int:
         )
 
     # Optional detail hydration in-place (never changes rowcount).
-    print(f"Detail hydration target: first {max(0, int(args.detail_lookups))} rows (0 disables)")
-    hydrate_user_details_in_place(token=token, rows=rows, max_detail_lookups=int(args.detail_lookups))
-    print(f"Detail hydration complete. Rows: {len(rows)}")
+    if cache is not None:
+        print(f"Search page cache: hits={cache.hits} misses={cache.misses} dir={cache.cache_dir}")
+    detail_lookups = int(args.detail_lookups)
+    target = "all" if detail_lookups < 0 else f"first {detail_lookups}"
+    print(f"Detail hydration target: {target} rows (0 disables)")
+    hydrated = hydrate_user_details_in_place(
+        token=token, rows=rows, max_detail_lookups=detail_lookups, workers=args.detail_workers
+    )
+    print(f"Detail hydration complete. Hydrated: {hydrated} Rows: {len(rows)}")
 
     master_csv = os.path.join(out_dir, "people_master.csv")
     discards_csv = os.path.join(out_dir, "discards.csv")
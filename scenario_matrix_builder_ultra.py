@@ -4,12 +4,18 @@ Scenario Matrix Builder (Ultra Expansion)
 - Takes your scenario_control_matrix.xlsx (11 rows)
 - Expands to 100+ high-recall variants
 - Outputs: data/scenarios/scenario_control_matrix_EXPANDED.xlsx
+- Optional (--plan or query_plan.enabled): samples page 1 of every variant,
+  orders/prunes variants by expected marginal new people per API call
+  (scenario_query_planner) and writes *_QUERY_PLAN.csv next to the matrix.
 © 2025 L. David Mendoza
 """
+import argparse
 import pandas as pd
 from pathlib import Path
 import yaml
 
+import scenario_query_planner as qp
+
 EXPAND_MAP = {
     # Foundational / frontier expansions
     "LLM researcher language model": [
@@ -121,10 +127,47 @@ EXPAND_MAP = {
     ],
 }
 
+def apply_query_plan(expanded: pd.DataFrame, plan_cfg: dict, prune: bool) -> tuple:
+    """
+    Sample, plan and reorder the expanded matrix. Returns (matrix, plan_df).
+    Rows keep their original columns plus plan_rank / plan_est_new_people / plan_action.
+    """
+    variants = []
+    for idx, r in expanded.iterrows():
+        source = qp.source_for_seed_type(str(r.get("seed_type", "")))
+        variants.append((str(idx), source, str(r["seed_value"]).strip()))
+
+    samples = qp.sample_variants(variants)
+    plan = qp.plan_variants(
+        samples,
+        num_perm=int(plan_cfg.get("num_perm", qp.DEFAULT_NUM_PERM)),
+        min_new_per_call=float(plan_cfg.get("min_new_per_call", qp.DEFAULT_MIN_NEW_PER_CALL)),
+    )
+    plan_df = pd.DataFrame(qp.plan_rows_as_dicts(plan))
+
+    by_key = {p.key: p for p in plan}
+    planned = expanded.copy()
+    planned["plan_rank"] = [by_key[str(i)].plan_rank for i in planned.index]
+    planned["plan_est_new_people"] = [by_key[str(i)].est_new_people_per_call for i in planned.index]
+    planned["plan_action"] = [by_key[str(i)].plan_action for i in planned.index]
+    planned = planned.sort_values("plan_rank", kind="stable")
+    if prune:
+        planned = planned[planned["plan_action"] != "prune"]
+    return planned.reset_index(drop=True), plan_df
+
+
 def main():
+    ap = argparse.ArgumentParser(description="Scenario Matrix Builder (Ultra Expansion)")
+    ap.add_argument("--plan", action="store_true", help="Sample variants and order them by marginal new people per call.")
+    ap.add_argument("--prune", action="store_true", help="With --plan, drop variants the planner marks as prune.")
+    args = ap.parse_args()
+
     cfg = yaml.safe_load(open("volume_expansion.yaml"))
     inp = cfg["scenario_matrix_input"]
     out = cfg["scenario_matrix_output"]
+    plan_cfg = cfg.get("query_plan", {}) or {}
+    do_plan = args.plan or bool(plan_cfg.get("enabled", False))
+    do_prune = args.prune or bool(plan_cfg.get("prune", False))
 
     base = pd.read_excel(inp)
 
@@ -156,6 +199,14 @@ def main():
             rows.append(rr)
 
     expanded = pd.DataFrame(rows).drop_duplicates(subset=["seed_value", "tier", "category"]).reset_index(drop=True)
+    variant_count = len(expanded)
+
+    plan_out = ""
+    if do_plan:
+        expanded, plan_df = apply_query_plan(expanded, plan_cfg, do_prune)
+        plan_out = plan_cfg.get("output") or str(Path(out).with_name(Path(out).stem + "_QUERY_PLAN.csv"))
+        Path(plan_out).parent.mkdir(parents=True, exist_ok=True)
+        plan_df.to_csv(plan_out, index=False)
 
     Path(out).parent.mkdir(parents=True, exist_ok=True)
     expanded.to_excel(out, index=False)
@@ -168,5 +219,9 @@ def main():
     print(f"Expanded rows: {len(expanded)}")
     print(f"Wrote: {out}")
     print("Synced: scenario_control_matrix.xlsx (root)")
+    if plan_out:
+        kept = int((expanded["plan_action"] != "prune").sum())
+        print(f"Query plan: {kept}/{variant_count} variants kept{' (pruned rows dropped)' if do_prune else ''}")
+        print(f"Wrote plan: {plan_out}")
 if __name__ == "__main__":
     main()
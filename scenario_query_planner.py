@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+AI Talent Engine – Scenario Query Planner (Overlap-Aware)
+Version: v1.0.0-ultra
+Date: 2026-01-06
+© 2026 L. David Mendoza. All Rights Reserved.
+
+PURPOSE
+scenario_matrix_builder_ultra.EXPAND_MAP turns 11 scenarios into 100+ search
+variants. Many of them return heavily overlapping result sets, so most of the
+enumeration budget re-fetches people we already have.
+
+This planner:
+- Samples the FIRST page of each variant (GitHub user search or OpenAlex works).
+- Builds a MinHash signature of the returned login / author-id set.
+- Greedily orders variants by expected marginal NEW people per API call,
+  estimating overlap against everything already planned.
+- Marks variants whose marginal yield falls below a floor as "prune".
+- A sample that fails (rate limit, network error, error payload) is recorded
+  with calls=0 and kept unsampled; it is never read as a zero-yield query.
+
+The planner never enumerates beyond page 1 and never writes people rows.
+It only produces an ordering/pruning plan for the expanded scenario matrix.
+
+VALIDATION
+python3 scenario_matrix_builder_ultra.py --plan
+open data/scenarios/scenario_control_matrix_EXPANDED_QUERY_PLAN.csv
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_MIN_NEW_PER_CALL = 5.0
+DEFAULT_GITHUB_PER_PAGE = 100
+DEFAULT_OPENALEX_PER_PAGE = 50
+GITHUB_SEARCH_MIN_INTERVAL_S = 2.1  # 30 search requests/min authenticated
+
+_MAX_HASH = (1 << 64) - 1
+
+
+# ---------------------------
+# MinHash
+# ---------------------------
+
+def _h64(value: str, seed: int) -> int:
+    d = hashlib.blake2b(value.encode("utf-8", errors="ignore"), digest_size=8, salt=seed.to_bytes(8, "little"))
+    return int.from_bytes(d.digest(), "little")
+
+
+def minhash_signature(ids: Iterable[str], num_perm: int = DEFAULT_NUM_PERM) -> Tuple[int, ...]:
+    sig = [_MAX_HASH] * num_perm
+    for x in ids:
+        for i in range(num_perm):
+            hv = _h64(x, i)
+            if hv < sig[i]:
+                sig[i] = hv
+    return tuple(sig)
+
+
+def merge_signatures(a: Sequence[int], b: Sequence[int]) -> Tuple[int, ...]:
+    return tuple(x if x < y else y for x, y in zip(a, b))
+
+
+def estimate_jaccard(a: Sequence[int], b: Sequence[int]) -> float:
+    if not a or not b:
+        return 0.0
+    if a[0] == _MAX_HASH or b[0] == _MAX_HASH:
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / float(len(a))
+
+
+def estimate_intersection(size_a: int, size_b: int, jaccard: float) -> float:
+    # |A ∩ B| = J * (|A| + |B|) / (1 + J)
+    if jaccard <= 0.0:
+        return 0.0
+    return min(float(size_a), jaccard * (size_a + size_b) / (1.0 + jaccard))
+
+
+# ---------------------------
+# Sampling
+# ---------------------------
+
+@dataclass
+class VariantSample:
+    key: str
+    source: str
+    query: str
+    ids: Set[str]
+    total_count: int
+    calls: int
+
+
+def source_for_seed_type(seed_type: str) -> str:
+    s = (seed_type or "").strip().lower()
+    if "openalex" in s:
+        return "openalex"
+    if "github" in s:
+        return "github"
+    return ""
+
+
+def sample_github_first_page(query: str, per_page: int = DEFAULT_GITHUB_PER_PAGE) -> Optional[Tuple[Set[str], int]]:
+    from github_api_ultra import get_json
+
+    headers = {"Accept": "application/vnd.github+json", "User-Agent": "AI-Talent-Engine/QueryPlanner"}
+    tok = os.getenv("GITHUB_TOKEN", "").strip()
+    if tok:
+        headers["Authorization"] = f"Bearer {tok}"
+    data = get_json("/search/users", headers=headers, params={"q": query, "per_page": per_page, "page": 1})
+    if not isinstance(data, dict) or "items" not in data:
+        return None  # 403/429, network error or error payload: not a zero-yield answer
+    logins = {(it.get("login") or "").strip().lower() for it in data.get("items", []) or []}
+    logins.discard("")
+    return logins, int(data.get("total_count", 0) or 0)
+
+
+def sample_openalex_first_page(query: str, per_page: int = DEFAULT_OPENALEX_PER_PAGE) -> Optional[Tuple[Set[str], int]]:
+    from enumerator_openalex import OPENALEX, _get
+
+    data = _get(f"{OPENALEX}/works", {"search": query, "per-page": per_page, "select": "id,authorships"})
+    if not isinstance(data, dict) or "results" not in data:
+        return None
+    authors: Set[str] = set()
+    for w in data.get("results", []) or []:
+        for a in w.get("authorships", []) or []:
+            aid = ((a.get("author") or {}).get("id") or "").strip()
+            if aid:
+                authors.add(aid)
+    return authors, int((data.get("meta") or {}).get("count", 0) or 0)
+
+
+def sample_variants(
+    variants: List[Tuple[str, str, str]],
+    samplers: Optional[Dict[str, Callable[[str], Optional[Tuple[Set[str], int]]]]] = None,
+    github_min_interval_s: float = GITHUB_SEARCH_MIN_INTERVAL_S,
+) -> Dict[str, VariantSample]:
+    """
+    variants: (key, source, query). Identical (source, query) pairs are sampled once.
+    Returns key -> VariantSample. Unknown sources and failed samples (sampler
+    returned None) get an empty, zero-call sample, so plan_variants keeps them
+    unsampled instead of pruning them.
+    """
+    samplers = samplers or {"github": sample_github_first_page, "openalex": sample_openalex_first_page}
+    by_query: Dict[Tuple[str, str], Optional[Tuple[Set[str], int]]] = {}
+    out: Dict[str, VariantSample] = {}
+    last_github = 0.0
+
+    for key, source, query in variants:
+        fn = samplers.get(source)
+        if fn is None:
+            out[key] = VariantSample(key=key, source=source, query=query, ids=set(), total_count=0, calls=0)
+            continue
+        qk = (source, query.strip().lower())
+        if qk not in by_query:
+            if source == "github" and github_min_interval_s > 0:
+                wait = last_github + github_min_interval_s - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                last_github = time.monotonic()
+            by_query[qk] = fn(query)
+        sampled = by_query[qk]
+        if sampled is None:
+            out[key] = VariantSample(key=key, source=source, query=query, ids=set(), total_count=0, calls=0)
+            continue
+        ids, total = sampled
+        out[key] = VariantSample(key=key, source=source, query=query, ids=set(ids), total_count=total, calls=1)
+    return out
+
+
+# ---------------------------
+# Planning
+# ---------------------------
+
+@dataclass
+class PlanRow:
+    plan_rank: int
+    key: str
+    source: str
+    query: str
+    sample_size: int
+    total_count: int
+    est_overlap_with_planned: float
+    est_new_people_per_call: float
+    plan_action: str
+
+
+def plan_variants(
+    samples: Dict[str, VariantSample],
+    num_perm: int = DEFAULT_NUM_PERM,
+    min_new_per_call: float = DEFAULT_MIN_NEW_PER_CALL,
+) -> List[PlanRow]:
+    """
+    Greedy max-marginal-coverage ordering.
+
+    Each round picks the variant with the highest estimated number of people
+    not already covered by previously planned variants (per sampled API call),
+    then folds its signature into the covered union. Ties break on input order.
+    Variants whose marginal yield drops below min_new_per_call are "prune".
+    Unsampled variants (no sampler for their source, or a failed sample) are
+    kept at the end.
+    """
+    keys = list(samples.keys())
+    sigs = {k: minhash_signature(samples[k].ids, num_perm) for k in keys if samples[k].calls}
+    remaining = [k for k in keys if samples[k].calls]
+    unsampled = [k for k in keys if not samples[k].calls]
+
+    covered: Optional[Tuple[int, ...]] = None
+    covered_size = 0.0
+    plan: List[PlanRow] = []
+
+    while remaining:
+        best_k, best_new, best_overlap = "", -1.0, 0.0
+        for k in remaining:
+            size = len(samples[k].ids)
+            if covered is None or size == 0:
+                overlap = 0.0
+            else:
+                j = estimate_jaccard(sigs[k], covered)
+                overlap = estimate_intersection(size, int(round(covered_size)), j)
+            new = (size - overlap) / float(max(1, samples[k].calls))
+            if new > best_new:
+                best_k, best_new, best_overlap = k, new, overlap
+        remaining.remove(best_k)
+
+        s = samples[best_k]
+        action = "keep" if best_new >= min_new_per_call else "prune"
+        plan.append(
+            PlanRow(
+                plan_rank=len(plan) + 1,
+                key=best_k,
+                source=s.source,
+                query=s.query,
+                sample_size=len(s.ids),
+                total_count=s.total_count,
+                est_overlap_with_planned=round(best_overlap, 2),
+                est_new_people_per_call=round(best_new, 2),
+                plan_action=action,
+            )
+        )
+        if action == "keep" and s.ids:
+            covered = sigs[best_k] if covered is None else merge_signatures(covered, sigs[best_k])
+            covered_size += best_new * s.calls
+
+    for k in unsampled:
+        s = samples[k]
+        plan.append(
+            PlanRow(
+                plan_rank=len(plan) + 1,
+                key=k,
+                source=s.source,
+                query=s.query,
+                sample_size=0,
+                total_count=0,
+                est_overlap_with_planned=0.0,
+                est_new_people_per_call=0.0,
+                plan_action="keep_unsampled",
+            )
+        )
+    return plan
+
+
+def plan_rows_as_dicts(plan: List[PlanRow]) -> List[dict]:
+    return [asdict(p) for p in plan]
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Contact extractor benchmark: EXECUTION_CORE/contact_extractor.py (per column,
+prefiltered) vs the former public_identity_contact_pass blob scan (every field
+joined, three regexes over the blob), on ROWS synthetic rows of WIDTH columns.
+
+    python3 scripts/bench_contact_extractor.py [ROWS] [WIDTH]
+
+Tests: test/test_contact_extractor.py
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from EXECUTION_CORE.contact_extractor import EMAIL_DEOB_RE, EMAIL_DIRECT_RE, PHONE_RE, ContactExtractor
+
+
+def bench_rows(n, width):
+    rows = []
+    for i in range(n):
+        row = {f"Col_{j:03d}": f"value {i}-{j} https://example.org/p/{j}" for j in range(width)}
+        row["Full_Name"] = f"Person {i}"
+        row["Citation_Count_Raw"] = str(i * 7)
+        if i % 3 == 0:
+            row["Bio"] = f"reach me: user{i} (at) lab dot edu"
+        if i % 4 == 0:
+            row["Contact"] = f"user{i}@example.com, +1 415-555-{i % 10000:04d}"
+        row["Field_Level_Provenance_JSON"] = json.dumps(
+            {f"Col_{j:03d}": {"source": "seed", "method": "copy"} for j in range(width)}, sort_keys=True
+        )
+        rows.append(row)
+    return rows
+
+
+def blob_extract(row):
+    blob = " ".join(str(row.get(k) or "").strip() for k in row.keys())
+    emails = [f"{m.group(1)}@{m.group(2)}.{m.group(3)}" for m in EMAIL_DEOB_RE.finditer(blob)]
+    emails.extend(EMAIL_DIRECT_RE.findall(blob))
+    phones = [m.group(0).strip() for m in PHONE_RE.finditer(blob)]
+    return emails, phones
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 80
+    rows = bench_rows(n, width)
+    t0 = time.perf_counter()
+    for r in rows:
+        blob_extract(r)
+    t_blob = time.perf_counter() - t0
+    ex = ContactExtractor()
+    t0 = time.perf_counter()
+    for r in rows:
+        ex.extract(r)
+    t_cols = time.perf_counter() - t0
+    print(f"{n} rows x {width} columns")
+    print(f"  blob scan   {t_blob:>8.3f}s  {n / t_blob:>10.0f} rows/s")
+    print(f"  per column  {t_cols:>8.3f}s  {n / t_cols:>10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
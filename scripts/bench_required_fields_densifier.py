@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Strengths keyword containment benchmark: EXECUTION_CORE/required_fields_densifier.py
+KeywordGroups (pre-lowered keywords, one lowering of the text for all groups)
+vs the former per-keyword scan called once per group, on ROWS synthetic texts.
+
+    python3 scripts/bench_required_fields_densifier.py [ROWS]
+
+Tests: test/test_required_fields_densifier.py
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from EXECUTION_CORE.required_fields_densifier import STRENGTH_KEYWORD_GROUPS, extract_keyword_groups
+
+VOCAB = ["Llama", "GPT-4", "Mistral", "FAISS", "Weaviate", "pgvector", "LangChain", "LlamaIndex",
+         "vLLM", "TensorRT-LLM", "ONNX", "Triton", "RAG", "Retrieval-Augmented Generation",
+         "PyTorch", "JAX", "CUDA", "Kubernetes", "DPO", "RLHF", "transformers", "evaluation"]
+
+
+def bench_texts(n):
+    return [
+        " | ".join(VOCAB[(i * 7 + j * 5) % len(VOCAB)] for j in range(4 + i % 9)) + f" | repo-{i}"
+        for i in range(n)
+    ]
+
+
+def per_keyword(text, keywords):
+    blob = (text or "").lower()
+    return [k for k in keywords if k.lower() in blob]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    texts = bench_texts(n)
+
+    t0 = time.perf_counter()
+    for t in texts:
+        [per_keyword(t, g) for g in STRENGTH_KEYWORD_GROUPS]
+    t_old = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for t in texts:
+        extract_keyword_groups(t)
+    t_new = time.perf_counter() - t0
+
+    print(json.dumps({
+        "rows": n,
+        "per_keyword_s": round(t_old, 3),
+        "compiled_s": round(t_new, 3),
+        "speedup": round(t_old / t_new, 2) if t_new else 0.0,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+URL canon micro-benchmark: each EXECUTION_CORE/url_canon.py rule, uncached
+(the bare function) vs memoized, over N URLs recurring ~5x each (one per pass).
+
+    python3 scripts/bench_url_canon.py [N]
+
+Tests: test/test_url_canon.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from EXECUTION_CORE import url_canon
+
+HOSTS = ["github.com", "www.linkedin.com", "scholar.google.com", "orcid.org",
+         "www.semanticscholar.org", "alice.github.io", "lab.example.edu", "medium.com"]
+PATHS = ["/{u}", "/in/{u}", "/citations?hl=en&user={u}", "/0000-0002-1825-{n:04d}",
+         "/author/{n}", "/", "/people/{u}/cv.pdf", "/@{u}/post-{n}"]
+BASE = "https://lab.example.edu/people/"
+
+
+def bench_urls(n):
+    distinct = max(1, n // 5)
+    urls = []
+    for k in range(n):
+        j = k % distinct
+        h = j % len(HOSTS)
+        urls.append(f"https://{HOSTS[h]}" + PATHS[h].format(u=f"user{j}", n=j % 10000) + ("#top" if j % 7 == 0 else ""))
+    return urls
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    urls = bench_urls(n)
+    cases = {
+        "person_url": (url_canon.person_url, lambda u: (u,)),
+        "anchor_column": (url_canon.anchor_column, lambda u: (u,)),
+        "absolute_http": (url_canon.absolute_http, lambda u: (BASE, u)),
+        "normalize_http": (url_canon.normalize_http, lambda u: (u, BASE)),
+        "strip_fragment": (url_canon.strip_fragment, lambda u: (u,)),
+    }
+    print(f"{n} URLs, ~5 occurrences each")
+    for name, (fn, argf) in cases.items():
+        arglist = [argf(u) for u in urls]
+        t0 = time.perf_counter()
+        for a in arglist:
+            fn.__wrapped__(*a)
+        t_raw = time.perf_counter() - t0
+        fn.cache_clear()
+        t0 = time.perf_counter()
+        for a in arglist:
+            fn(*a)
+        t_memo = time.perf_counter() - t0
+        print(f"  {name:<15} uncached {t_raw:>8.4f}s  memoized {t_memo:>8.4f}s  x{t_raw / t_memo:.2f}")
+    print(url_canon.cache_stats())
+
+
+if __name__ == "__main__":
+    main()
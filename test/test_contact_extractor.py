@@ -0,0 +1,97 @@
+import json
+import unittest
+
+from EXECUTION_CORE.contact_extractor import ContactExtractor, ContactHits, scan_text
+from EXECUTION_CORE.public_identity_contact_pass import enrich_rows_public_identity_contact
+
+
+def scan(text, column="Bio"):
+    hits = ContactHits()
+    scan_text(text, column, hits)
+    return hits
+
+
+class TestScanText(unittest.TestCase):
+
+    def test_direct_email(self):
+        self.assertEqual(scan("Contact: jane.doe@example.com").emails, {"jane.doe@example.com": "Bio"})
+        self.assertEqual(scan("user+tag@mail.co.uk").emails, {"user+tag@mail.co.uk": "Bio"})
+
+    def test_obfuscated_email(self):
+        self.assertEqual(scan("Bob (at) lab dot edu").emails, {"Bob@lab.edu": "Bio"})
+        self.assertEqual(scan("x AT y DOT org").emails, {"x@y.org": "Bio"})
+        self.assertEqual(scan("x at y.io").emails, {"x@y.io": "Bio"})
+
+    def test_at_inside_words_is_not_an_email(self):
+        self.assertEqual(scan("Data at scale, chat later").emails, {})
+        self.assertEqual(scan("a@b").emails, {})
+
+    def test_phones(self):
+        self.assertEqual(scan("+1 415-555-0134").phones, {"+1 415-555-0134": "Bio"})
+        self.assertEqual(scan("call (415) 555-0134 or 650.555.1212").phones,
+                         {"(415) 555-0134": "Bio", "650.555.1212": "Bio"})
+
+    def test_fewer_than_ten_digits_is_not_a_phone(self):
+        self.assertEqual(scan("ext 555-0134, 2024").phones, {})
+
+    def test_non_ascii_digits_still_reach_the_phone_regex(self):
+        # \d matches any decimal digit, as in the former blob scan
+        self.assertEqual(scan("٤١٥٥٥٥٠١٣٤").phones, {"٤١٥٥٥٥٠١٣٤": "Bio"})
+
+
+class TestContactExtractor(unittest.TestCase):
+
+    def test_first_column_wins_and_primary_is_lowest(self):
+        hits = ContactExtractor().extract({"A": "Zed@x.com", "B": "amy@x.com zed@x.com"})
+        self.assertEqual(hits.emails, {"Zed@x.com": "A", "amy@x.com": "B", "zed@x.com": "B"})
+        self.assertEqual(hits.primary_email(), ("amy@x.com", "B"))
+
+    def test_primary_phone(self):
+        hits = ContactExtractor().extract({"A": "+1 650-555-1212", "B": "(415) 555-0134"})
+        self.assertEqual(hits.primary_phone(), ("(415) 555-0134", "B"))
+        self.assertIsNone(ContactHits().primary_phone())
+
+    def test_matches_do_not_straddle_columns(self):
+        # joined into one blob this read "jane at lab.edu"
+        self.assertEqual(ContactExtractor().extract({"A": "contact jane at", "B": "lab.edu"}).emails, {})
+
+    def test_provenance_columns_are_not_evidence(self):
+        row = {
+            "A": "a@x.com",
+            "Field_Level_Provenance_JSON": "c@z.net",
+            "Identity_Provenance_JSON": "d@z.net",
+        }
+        self.assertEqual(ContactExtractor().extract(row).emails, {"a@x.com": "A"})
+
+    def test_explicit_evidence_columns(self):
+        row = {"A": "a@x.com", "B": "b@y.org", "C": None}
+        self.assertEqual(ContactExtractor(["B", "C"]).extract(row).emails, {"b@y.org": "B"})
+
+
+class TestPublicIdentityContactPass(unittest.TestCase):
+
+    def test_fills_blanks_with_source_column(self):
+        row = {
+            "Full_Name": "",
+            "LinkedIn_Public_URL": "https://www.linkedin.com/in/jane-q-doe",
+            "Bio": "jane (at) uni dot edu, +1 415-555-0134",
+            "Field_Level_Provenance_JSON": "",
+        }
+        [out] = enrich_rows_public_identity_contact([row])
+        self.assertEqual(out["Seed_Query_Or_Handle"], "jane-q-doe")
+        self.assertEqual((out["Full_Name"], out["First_Name"], out["Last_Name"]), ("Jane Doe", "Jane", "Doe"))
+        self.assertEqual(out["Primary_Email"], "jane@uni.edu")
+        self.assertEqual(out["Primary_Phone"], "+1 415-555-0134")
+        prov = json.loads(out["Field_Level_Provenance_JSON"])
+        self.assertEqual(prov["Primary_Email"], {"method": "regex_extract_email", "source": "Bio"})
+        self.assertEqual(prov["Primary_Phone"], {"method": "regex_extract_phone", "source": "Bio"})
+
+    def test_existing_values_are_kept(self):
+        row = {"Primary_Email": "keep@x.com", "Primary_Phone": "1", "Bio": "other@y.org 415-555-0134"}
+        [out] = enrich_rows_public_identity_contact([row])
+        self.assertEqual((out["Primary_Email"], out["Primary_Phone"]), ("keep@x.com", "1"))
+        self.assertEqual(out["Field_Level_Provenance_JSON"], "{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest import mock
+
+from EXECUTION_CORE import deep_personal_artifact_scrape as dpas
+
+URL = "https://example.org/people/"
+
+
+def page(title=None, h1=None, emails=(), links=()):
+    return {"title": title, "h1": h1, "emails": [list(e) for e in emails], "links": list(links)}
+
+
+class TestExtractPage(unittest.TestCase):
+
+    def test_title_and_h1(self):
+        self.assertEqual(
+            dpas._extract_page("<html><head><title>Jane Q. Doe &amp; Lab</title></head>"
+                               "<h1 class='x'>  Ada <b>Lovelace</b> </h1>", URL),
+            page(title="Jane Q. Doe & Lab", h1="Ada Lovelace"),
+        )
+        self.assertEqual(dpas._extract_page("<TITLE lang=en>Dr. <b>Ada</b>\n Lovelace</TITLE>", URL),
+                         page(title="Dr. Ada Lovelace"))
+
+    def test_unclosed_or_blank_title(self):
+        self.assertEqual(dpas._extract_page("<title>unclosed <h1>", URL), page())
+        self.assertEqual(dpas._extract_page("<title> <b></b> </title><h1>\n</h1>", URL), page())
+
+    def test_mailto(self):
+        self.assertEqual(
+            dpas._extract_page('Contact: <a href="mailto:Jane.Doe%40uni.edu?subject=hi">mail</a>', URL),
+            page(emails=[("Jane.Doe@uni.edu", "mailto")]),
+        )
+        self.assertEqual(dpas._extract_page("mailto:no-at-sign MAILTO:x@y.org", URL),
+                         page(emails=[("x@y.org", "mailto")]))
+
+    def test_mailto_wins_dedupe(self):
+        # mailto hits come first; the same address found by the regex is dropped
+        self.assertEqual(dpas._extract_page("X@Y.org and mailto:x@y.org", URL),
+                         page(emails=[("x@y.org", "mailto")]))
+
+    def test_obfuscated_emails(self):
+        for text in ("jane (at) cs.uni (dot) edu", "jane [at] cs.uni [dot] edu",
+                     "jane {at} cs.uni {dot} edu", "JANE AT CS.UNI DOT EDU", "jane\tat\ncs.uni dot edu"):
+            with self.subTest(text=text):
+                self.assertEqual(dpas._extract_page(text, URL), page(emails=[("jane@cs.uni.edu", "regex_obfus")]))
+        self.assertEqual(dpas._extract_page("first.last@sub.domain.co.uk", URL),
+                         page(emails=[("first.last@sub.domain.co.uk", "regex_obfus")]))
+
+    def test_not_emails(self):
+        # the domain part before the TLD must itself contain a dot
+        for text in ("jane (at) uni (dot) edu", "user@localhost", "a+b%c@x-y.io",
+                     "data at scale. see.you", "Kelvin@ſite.org", "@@@"):
+            with self.subTest(text=text):
+                self.assertEqual(dpas._extract_page(text, URL), page())
+
+    def test_links(self):
+        html_text = (
+            "<a HREF = 'cv.pdf'>CV</a><a href=\"/resume\">R</a>"
+            "<a href='https://other.org/p?x=1#f'>o</a><a href='#top'>t</a>"
+            "<a href=\"javascript:void(0)\">j</a><a href='/resume'>again</a>"
+        )
+        self.assertEqual(dpas._extract_page(html_text, URL), page(links=[
+            "https://example.org/people/",
+            "https://example.org/people/cv.pdf",
+            "https://example.org/resume",
+            "https://other.org/p?x=1",
+        ]))
+
+    def test_long_whitespace_run(self):
+        # quadratic in the whitespace run before v0.5.0
+        html_text = "name" + " " * 5000 + "at cs.uni dot edu"
+        self.assertEqual(dpas._extract_page(html_text, URL), page(emails=[("name@cs.uni.edu", "regex_obfus")]))
+
+    def test_empty_page(self):
+        self.assertEqual(dpas._extract_page("", URL), {"title": None, "h1": None, "emails": [], "links": []})
+        self.assertEqual(dpas._extract_page(None, URL), page())
+
+    def test_over_budget(self):
+        html_text = "<title>T</title> mailto:a@b.co jane at cs.uni dot edu"
+        with mock.patch.object(dpas, "PAGE_SCAN_BUDGET_S", -1.0):
+            with self.assertRaises(dpas.PageBudgetExceeded) as ctx:
+                dpas._extract_page(html_text, URL)
+        # what was found before the budget ran out is kept
+        self.assertEqual(ctx.exception.page, page(title="T", emails=[("a@b.co", "mailto")]))
+
+
+if __name__ == "__main__":
+    unittest.main()
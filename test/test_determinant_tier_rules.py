@@ -0,0 +1,102 @@
+import unittest
+
+from EXECUTION_CORE import determinant_tier_rules as dtr
+from EXECUTION_CORE.determinant_tier_rules import (
+    explain_tier,
+    resolve_cohort_tiers,
+    resolve_determinant_tier,
+    resolve_determinant_tiers,
+)
+
+
+def tier(rf, ec):
+    return resolve_determinant_tier(role_family=rf, evidence_category=ec)
+
+
+class TestResolveDeterminantTier(unittest.TestCase):
+
+    def test_listed_categories(self):
+        self.assertEqual(tier("frontier", "scaling laws"), "tier_1")
+        self.assertEqual(tier("frontier", "lora"), "tier_2")
+        self.assertEqual(tier("frontier", "pytorch"), "tier_3")
+        self.assertEqual(tier("frontier", "ai interest"), "tier_4")
+        self.assertEqual(tier("infra", "cuda"), "tier_1")
+        self.assertEqual(tier("infra", "vllm"), "tier_2")
+        self.assertEqual(tier("applied", "rag system design"), "tier_1")
+        self.assertEqual(tier("gtm", "sales analytics"), "tier_3")
+
+    def test_casing_and_padding(self):
+        self.assertEqual(tier("  Frontier\n", "\tScaling Laws "), "tier_1")
+        self.assertEqual(tier("INFRA", "TensorRT"), "tier_2")
+
+    def test_category_of_another_family(self):
+        self.assertEqual(tier("applied", "cuda"), "tier_4")
+        self.assertEqual(tier("infra", "rag system design"), "tier_4")
+
+    def test_unknown_or_blank(self):
+        self.assertEqual(tier("frontier", "scaling law"), "tier_4")
+        self.assertEqual(tier("frontier", "scaling  laws"), "tier_4")
+        self.assertEqual(tier("unknown_family", "cuda"), "tier_4")
+        self.assertEqual(tier("", "cuda"), "tier_4")
+        self.assertEqual(tier(None, "cuda"), "tier_4")
+        self.assertEqual(tier("infra", ""), "tier_4")
+        self.assertEqual(tier("infra", "   "), "tier_4")
+        self.assertEqual(tier("infra", None), "tier_4")
+
+
+class TestCompileTierTables(unittest.TestCase):
+
+    def test_first_listing_tier_wins(self):
+        tables = dtr._compile_tier_tables({
+            "fam": {
+                "tier_2": ["Shared", "only two"],
+                "tier_1": ["shared ", "only one", ""],
+                "tier_3": ["SHARED"],
+            },
+        })
+        self.assertEqual(tables, {"fam": {"shared": "tier_2", "only two": "tier_2", "only one": "tier_1"}})
+
+    def test_family_keys_kept_as_listed(self):
+        # lookups normalize role_family; the rule keys are not normalized
+        tables = dtr._compile_tier_tables({"Fam": {"tier_1": ["x"]}})
+        self.assertEqual(tables, {"Fam": {"x": "tier_1"}})
+
+
+class TestBatchResolution(unittest.TestCase):
+
+    def test_row(self):
+        self.assertEqual(
+            resolve_determinant_tiers(role_family="Infra",
+                                      evidence_categories=["CUDA", "onnx", "monitoring", "docker", "cooking", ""]),
+            ["tier_1", "tier_2", "tier_3", "tier_4", "tier_4", "tier_4"],
+        )
+        self.assertEqual(resolve_determinant_tiers(role_family="infra", evidence_categories=[]), [])
+        self.assertEqual(resolve_determinant_tiers(role_family="nobody", evidence_categories=["cuda"]), ["tier_4"])
+
+    def test_cohort(self):
+        cohort = [
+            ("frontier", ["neurips", "dpo"]),
+            ("applied", []),
+            ("evangelism", iter(["Conference Talks", "blog posts"])),
+            (None, ["cuda"]),
+        ]
+        self.assertEqual(
+            resolve_cohort_tiers(cohort),
+            [["tier_1", "tier_2"], [], ["tier_1", "tier_3"], ["tier_4"]],
+        )
+        self.assertEqual(resolve_cohort_tiers([]), [])
+
+
+class TestExplainTier(unittest.TestCase):
+
+    def test_known_and_unknown(self):
+        self.assertEqual(explain_tier("tier_1")["label"], "Primary Determinant")
+        self.assertEqual(explain_tier("tier_9"), {
+            "tier": "tier_9",
+            "label": "Non-Determinative",
+            "description": "Generic, ambiguous, or surface-level signal.",
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+
+from EXECUTION_CORE.full_evaluation_runner import run_full_evaluation, run_ranked_evaluation
+
+# Dense enough (16 fields, 5 signal fields, 3 evidence fields) to meet every infra density threshold.
+INFRA_ROW = {
+    "Role_Type": "AI Infra Engineer",
+    "Full_Name": "B",
+    "Summary": "distributed training with deepspeed and fsdp",
+    "Strengths": "CUDA, NCCL",
+    "Evidence_URLs": "https://example.org/b",
+    "Signal_Score": "High",
+    "Inference_Stack": "vLLM",
+    "Cuda_Version": "12",
+    "Nccl_Tuning": "yes",
+    "Distributed_Role": "yes",
+    "Current_Company": "X",
+    "Title": "Engineer",
+    "Location": "SF",
+    "LinkedIn_URL": "https://www.linkedin.com/in/b",
+    "GitHub_URL": "https://github.com/b",
+    "Email": "b@example.org",
+}
+
+
+def evaluation(evidence, tiers, density, score, verdict):
+    return {
+        "canonical_evidence": evidence,
+        "determinant_tiers": tiers,
+        "density_level": density,
+        "final_score": score,
+        "verdict": verdict,
+    }
+
+
+def applied(name, summary, role_type="AI Engineer"):
+    return {"Role_Type": role_type, "Full_Name": name, "Summary": summary}
+
+
+class TestRunFullEvaluation(unittest.TestCase):
+
+    def test_per_role_density(self):
+        # the sparse AI Engineer row does not pull the infra row's density down
+        got = run_full_evaluation([INFRA_ROW, applied("C", "RAG with FAISS and LangChain")])
+        self.assertEqual(got, [
+            evaluation(["cuda", "deepspeed", "distributed training", "fsdp", "nccl"], ["tier_1"] * 5,
+                       "strong", 28.0, "strong_fit"),
+            evaluation(["langchain pipelines", "rag system design", "vector database integration"], ["tier_1"] * 3,
+                       "deficient", 7.5, "weak_fit"),
+        ])
+
+    def test_frontier_row(self):
+        row = {"Role_Type": "Frontier AI Scientist", "Full_Name": "A", "Research": "pretraining and RLHF, scaling laws"}
+        self.assertEqual(run_full_evaluation([row]), [
+            evaluation(["base model training", "rlhf training", "scaling laws"], ["tier_1"] * 3,
+                       "deficient", 7.5, "weak_fit"),
+        ])
+
+    def test_unknown_and_blank_role_types_are_applied(self):
+        got = run_full_evaluation([applied("U", "rag", "Unknown Role"), applied("V", "rag", ""), applied("W", "cuda")])
+        self.assertEqual(got, [
+            evaluation(["rag system design"], ["tier_1"], "deficient", 2.5, "insufficient_signal"),
+            evaluation(["rag system design"], ["tier_1"], "deficient", 2.5, "insufficient_signal"),
+            # cuda is not an applied determinant: evidence bonus only
+            evaluation(["cuda"], ["tier_4"], "deficient", 1.0, "insufficient_signal"),
+        ])
+
+    def test_no_evidence(self):
+        self.assertEqual(run_full_evaluation([applied("D", "")]),
+                         [evaluation([], [], "deficient", 0.0, "insufficient_signal")])
+        self.assertEqual(run_full_evaluation([]), [])
+
+    def test_qc_failures(self):
+        # narratives of these families carry no density_level and fail QC
+        for role_type in ("AI Solutions Architect", "Developer Evangelist", "Account Executive"):
+            with self.subTest(role_type=role_type):
+                with self.assertRaises(AssertionError):
+                    run_full_evaluation([applied("E", "conference talk", role_type), applied("F", "rag")])
+
+
+class TestRunRankedEvaluation(unittest.TestCase):
+
+    def test_ranking_and_context(self):
+        rows = [applied("a", "rag"), applied("b", "cuda"), applied("c", "faiss"), applied("d", ""), INFRA_ROW]
+        got = run_ranked_evaluation(rows)
+        self.assertEqual(list(got), ["evaluations", "cohort_context", "ranked"])
+        self.assertEqual([e["final_score"] for e in got["evaluations"]], [2.5, 1.0, 2.5, 0.0, 28.0])
+        self.assertEqual(got["cohort_context"], {"avg_score": 6.8})
+        # ties keep cohort order; ranked holds the evaluation objects themselves
+        order = [4, 0, 2, 1, 3]
+        self.assertEqual(len(got["ranked"]), len(order))
+        for ranked, i in zip(got["ranked"], order):
+            self.assertIs(ranked, got["evaluations"][i])
+
+    def test_empty(self):
+        got = run_ranked_evaluation([])
+        self.assertEqual(dict(got), {"evaluations": [], "cohort_context": {"avg_score": 0.0}, "ranked": []})
+
+    def test_ranked_is_sorted_by_score(self):
+        rng = random.Random(0)
+        summaries = ["rag", "faiss langchain", "cuda", "", "RAG, pinecone, llamaindex", "speaker"]
+        rows = [applied(str(i), rng.choice(summaries)) for i in range(200)]
+        got = run_ranked_evaluation(rows)
+        scores = [e["final_score"] for e in got["ranked"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(sorted(map(id, got["ranked"])), sorted(map(id, got["evaluations"])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from EXECUTION_CORE import required_fields_densifier as rfd
+from EXECUTION_CORE.required_fields_densifier import extract_keyword_groups, process_csv
+
+GAP_IDENTITY = "Missing reliable identity signals (name or public profile URL) in current row fields"
+GAP_GITHUB = "No GitHub profile or repository evidence present in current row fields"
+GAP_MODELS = "No explicit model family or determinant skill evidence present in current row fields"
+GAP_INFRA = "No infra, serving, or alignment signals present in current row fields"
+GAP_PUBS = "No publication or citation evidence present in current row fields"
+GAP_COMPANY = "No company affiliation evidence present in current row fields"
+NO_GAPS = "No major public-evidence gaps detected in the current row fields for this role context."
+
+ALL_FLAGS = {
+    "has_identity": True, "has_github": True, "has_models": True, "has_infra": True,
+    "has_rlhf": True, "has_pubs": True, "has_company": True,
+}
+
+
+class TestExtractKeywordGroups(unittest.TestCase):
+
+    def test_groups_in_keyword_order(self):
+        # hits come back in keyword-list order, not text order
+        self.assertEqual(
+            extract_keyword_groups("qdrant, FAISS | weaviate; LlamaIndex langchain vllm"),
+            [["Weaviate", "FAISS", "Qdrant"], [], ["LangChain", "LlamaIndex"], ["vLLM"]],
+        )
+
+    def test_casing(self):
+        self.assertEqual(
+            extract_keyword_groups("PINECONE pgVector onnx TRITON"),
+            [["Pinecone", "pgvector"], [], [], ["ONNX", "Triton"]],
+        )
+
+    def test_substring_containment(self):
+        self.assertEqual(extract_keyword_groups("retrieval-augmented generation")[1],
+                         ["Retrieval-Augmented Generation"])
+        self.assertEqual(extract_keyword_groups("Retrieval-Augmented Generation (RAG)")[1],
+                         ["Retrieval-Augmented Generation", "RAG"])
+        self.assertEqual(extract_keyword_groups("RAG pipelines")[1], ["RAG"])
+        # containment, not tokens: "storage" contains "rag"
+        self.assertEqual(extract_keyword_groups("storage")[1], ["RAG"])
+        self.assertEqual(extract_keyword_groups("retrieval augmented generation")[1], [])
+
+    def test_tensorrt_variants(self):
+        self.assertEqual(extract_keyword_groups("TensorRT-LLM")[3], ["TensorRT", "TensorRT-LLM"])
+        self.assertEqual(extract_keyword_groups("tensorrt")[3], ["TensorRT"])
+        self.assertEqual(extract_keyword_groups("llama.cpp, TGI")[3], ["TGI", "llama.cpp"])
+        self.assertEqual(extract_keyword_groups("llamaxcpp")[3], [])
+
+    def test_blank(self):
+        self.assertEqual(extract_keyword_groups(""), [[], [], [], []])
+        self.assertEqual(extract_keyword_groups(None), [[], [], [], []])
+
+    def test_ordered_keywords_any_list(self):
+        self.assertEqual(rfd._extract_ordered_keywords("tgi and rag", ["RAG", "TGI", "ONNX"]), ["RAG", "TGI"])
+        self.assertEqual(rfd._extract_ordered_keywords("anything", []), [])
+        # both sides are lowered with str.lower(): "İ" lowers to "i" + combining dot
+        self.assertEqual(rfd._extract_ordered_keywords("İSTANBUL", ["İstanbul"]), ["İstanbul"])
+        self.assertEqual(rfd._extract_ordered_keywords("istanbul", ["İstanbul"]), [])
+
+
+class TestComposeWeaknesses(unittest.TestCase):
+
+    def test_no_flags(self):
+        expected = " | ".join([GAP_IDENTITY, GAP_GITHUB, GAP_MODELS, GAP_INFRA, GAP_PUBS, GAP_COMPANY])
+        self.assertEqual(rfd._compose_weaknesses({}), expected)
+
+    def test_all_flags(self):
+        self.assertEqual(rfd._compose_weaknesses(ALL_FLAGS), NO_GAPS)
+
+    def test_infra_or_rlhf_closes_the_infra_gap(self):
+        base = dict(ALL_FLAGS, has_infra=False, has_rlhf=False)
+        self.assertEqual(rfd._compose_weaknesses(base), GAP_INFRA)
+        self.assertEqual(rfd._compose_weaknesses(dict(base, has_rlhf=True)), NO_GAPS)
+        self.assertEqual(rfd._compose_weaknesses(dict(base, has_infra=True)), NO_GAPS)
+
+    def test_gap_order(self):
+        flags = dict(ALL_FLAGS, has_company=False, has_identity=False, has_pubs=False)
+        self.assertEqual(rfd._compose_weaknesses(flags), " | ".join([GAP_IDENTITY, GAP_PUBS, GAP_COMPANY]))
+
+    def test_truthy_values(self):
+        # flags are read by truthiness, as before the memoized path
+        flags = {k: 1 for k in ALL_FLAGS}
+        flags["has_github"] = ""
+        self.assertEqual(rfd._compose_weaknesses(flags), GAP_GITHUB)
+
+
+class TestProcessCsv(unittest.TestCase):
+
+    FIELDS = [
+        "Full_Name", "GitHub_URL", "Primary_Model_Families", "Repo_Topics_Keywords",
+        "Inference_Training_Infra_Signals", "RLHF_Alignment_Signals", "Publication_Count",
+        "Current_Company", "AI_Role_Type", "Role_Type", "Signal_Score", "Strengths", "Weaknesses",
+        "Field_Level_Provenance_JSON",
+    ]
+
+    def run_csv(self, rows):
+        with tempfile.TemporaryDirectory() as tmp:
+            inp, out = Path(tmp, "in.csv"), Path(tmp, "out.csv")
+            with inp.open("w", newline="", encoding="utf-8") as f:
+                w = csv.DictWriter(f, fieldnames=self.FIELDS)
+                w.writeheader()
+                for r in rows:
+                    w.writerow({k: r.get(k, "") for k in self.FIELDS})
+            with mock.patch.dict("os.environ", {"AI_TALENT_ROLE_CANONICAL": ""}):
+                process_csv(inp, out)
+            with out.open(newline="", encoding="utf-8") as f:
+                return list(csv.DictReader(f))
+
+    def test_fills_blanks(self):
+        (row,) = self.run_csv([{
+            "Full_Name": "Jane Doe",
+            "GitHub_URL": "https://github.com/jdoe",
+            "Primary_Model_Families": "Llama|GPT-4; Mistral",
+            "Repo_Topics_Keywords": "faiss, Retrieval-Augmented Generation, langchain",
+            "Inference_Training_Infra_Signals": "vLLM, TensorRT-LLM",
+            "AI_Role_Type": "Applied AI Engineer",
+        }])
+        self.assertEqual(row["Role_Type"], "Applied AI Engineer")
+        self.assertEqual(row["Signal_Score"], "High")
+        self.assertEqual(row["Strengths"], " | ".join([
+            "Model families: Llama, GPT-4, Mistral",
+            "Vector databases: FAISS",
+            "Retrieval-Augmented Generation (RAG) signals present",
+            "RAG tooling: LangChain",
+            "Inference stack: TensorRT, TensorRT-LLM, vLLM",
+            "GitHub evidence present (https://github.com/jdoe)",
+        ]))
+        self.assertEqual(row["Weaknesses"], " | ".join([GAP_PUBS, GAP_COMPANY]))
+        prov = json.loads(row["Field_Level_Provenance_JSON"])
+        self.assertEqual(sorted(prov), ["Role_Type", "Signal_Score", "Strengths", "Weaknesses"])
+
+    def test_keeps_existing_values(self):
+        (row,) = self.run_csv([{
+            "Full_Name": "Jane Doe",
+            "Signal_Score": "Medium",
+            "Strengths": "kept",
+            "Weaknesses": "kept too",
+        }])
+        self.assertEqual(row["Role_Type"], "")
+        self.assertEqual(row["Signal_Score"], "Medium")
+        self.assertEqual(row["Strengths"], "kept")
+        self.assertEqual(row["Weaknesses"], "kept too")
+        self.assertEqual(row["Field_Level_Provenance_JSON"], "{}")
+
+    def test_empty_row(self):
+        (row,) = self.run_csv([{}])
+        self.assertEqual(row["Signal_Score"], "Low")
+        self.assertEqual(
+            row["Strengths"],
+            "Insufficient corroborated technical evidence available in current row fields to summarize deterministically.",
+        )
+        self.assertEqual(row["Weaknesses"], " | ".join([GAP_IDENTITY, GAP_GITHUB, GAP_MODELS, GAP_INFRA, GAP_PUBS, GAP_COMPANY]))
+
+
+if __name__ == "__main__":
+    unittest.main()
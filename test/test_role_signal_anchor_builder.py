@@ -0,0 +1,145 @@
+import random
+import unittest
+from unittest import mock
+
+from EXECUTION_CORE import role_signal_anchor_builder as rsab
+from EXECUTION_CORE.role_signal_anchor_builder import (
+    TEXT_COLUMNS,
+    build_role_signal_anchors,
+    build_role_signal_anchors_batch,
+    build_role_signal_anchors_rows,
+)
+
+BLANK = {
+    "Role_Signal_Summary": "",
+    "Primary_Skill_Cluster": "",
+    "Secondary_Skill_Cluster": "",
+    "Research_vs_Infra_vs_Applied": "",
+    "Core_Domain_Classification": "",
+}
+
+
+def anchors(primary, secondary=""):
+    return {
+        "Role_Signal_Summary": f"{primary}-oriented AI contributor with corroborated technical signals",
+        "Primary_Skill_Cluster": primary,
+        "Secondary_Skill_Cluster": secondary,
+        "Research_vs_Infra_vs_Applied": primary,
+        "Core_Domain_Classification": primary,
+    }
+
+
+SKILLS, TOPICS, INFRA, RLHF = TEXT_COLUMNS
+
+# (row, expected) pairs shared by the batch, csv-rows and no-numpy tests
+CASES = [
+    ({SKILLS: "cuda nccl kernel", TOPICS: "rag"}, anchors("Infrastructure", "Applied")),
+    ({SKILLS: "pretraining,scaling", RLHF: "rlhf\nalignment", INFRA: "gpu"}, anchors("Frontier", "Infrastructure")),
+    ({TOPICS: "RAG, Retrieval,EMBEDDINGS"}, anchors("Applied")),
+    # one of each: ties go to the first cluster in Frontier/Infrastructure/Applied order
+    ({SKILLS: "evaluation", TOPICS: "serving", INFRA: "pipeline"}, anchors("Frontier", "Infrastructure")),
+    ({SKILLS: "rag gpu"}, anchors("Infrastructure", "Applied")),
+    # token sets: repeats count once
+    ({SKILLS: "gpu gpu gpu", TOPICS: "rag retrieval"}, anchors("Applied", "Infrastructure")),
+    # multi-word signals never equal a single token
+    ({SKILLS: "foundation model", TOPICS: "foundation-model"}, BLANK),
+    # punctuation other than commas stays attached; full-width letters do not fold
+    ({SKILLS: "serving. ＧＰＵ (cuda)"}, BLANK),
+    # only the four text columns are read
+    ({"Other": "gpu cuda rag", SKILLS: "python"}, BLANK),
+    ({}, BLANK),
+]
+
+
+def as_csv(rows, fieldnames):
+    return [[row.get(c, "") for c in fieldnames] for row in rows]
+
+
+class TestBuildRoleSignalAnchors(unittest.TestCase):
+
+    def test_cases(self):
+        for row, expected in CASES:
+            with self.subTest(row=row):
+                self.assertEqual(build_role_signal_anchors(row), expected)
+
+
+class TestBuildRoleSignalAnchorsBatch(unittest.TestCase):
+
+    def test_cases(self):
+        rows = [row for row, _ in CASES]
+        self.assertEqual(build_role_signal_anchors_batch(rows), [e for _, e in CASES])
+
+    def test_without_numpy(self):
+        rows = [row for row, _ in CASES]
+        with mock.patch.object(rsab, "np", None):
+            self.assertEqual(build_role_signal_anchors_batch(rows), [e for _, e in CASES])
+
+    def test_nul_token_in_data(self):
+        # a bare NUL token looks like the row separator; the batch falls back to per-row tokenization
+        rows = [{SKILLS: "gpu \x00 cuda"}, {SKILLS: "\x00"}, {TOPICS: "rag \x00x"}]
+        expected = [anchors("Infrastructure"), BLANK, anchors("Applied")]
+        self.assertEqual(build_role_signal_anchors_batch(rows), expected)
+        with mock.patch.object(rsab, "np", None):
+            self.assertEqual(build_role_signal_anchors_batch(rows), expected)
+
+    def test_rows_do_not_bleed(self):
+        # cells of consecutive rows are joined into one buffer; each row scores alone
+        rows = [{RLHF: "gpu"}, {SKILLS: "rag"}, {SKILLS: ""}]
+        self.assertEqual(build_role_signal_anchors_batch(rows), [anchors("Infrastructure"), anchors("Applied"), BLANK])
+
+    def test_empty(self):
+        self.assertEqual(build_role_signal_anchors_batch([]), [])
+        with mock.patch.object(rsab, "np", None):
+            self.assertEqual(build_role_signal_anchors_batch([]), [])
+
+    def test_outputs_not_shared(self):
+        out = build_role_signal_anchors_batch([{SKILLS: "gpu"}, {SKILLS: "cuda"}, {}, {}])
+        self.assertEqual(out[0], out[1])
+        self.assertIsNot(out[0], out[1])
+        self.assertIsNot(out[2], out[3])
+        out[0]["Primary_Skill_Cluster"] = "edited"
+        out[2]["Primary_Skill_Cluster"] = "edited"
+        self.assertEqual(build_role_signal_anchors_batch([{SKILLS: "gpu"}, {}]), [anchors("Infrastructure"), BLANK])
+
+
+class TestBuildRoleSignalAnchorsRows(unittest.TestCase):
+
+    def test_cases(self):
+        fieldnames = ["Full_Name", *TEXT_COLUMNS, "Other"]
+        rows = as_csv([row for row, _ in CASES], fieldnames)
+        self.assertEqual(list(build_role_signal_anchors_rows(fieldnames, rows)), [e for _, e in CASES])
+
+    def test_missing_text_column(self):
+        # RLHF_Alignment_Signals is absent from the header and contributes nothing
+        fieldnames = ["Other", INFRA, SKILLS, TOPICS]
+        rows = [
+            ["rlhf alignment", "cuda", "", ""],
+            ["", "", "evaluation", "rag"],
+            ["", "", "", ""],
+        ]
+        self.assertEqual(
+            list(build_role_signal_anchors_rows(fieldnames, rows)),
+            [anchors("Infrastructure"), anchors("Frontier", "Applied"), BLANK],
+        )
+
+    def test_empty(self):
+        self.assertEqual(list(build_role_signal_anchors_rows(list(TEXT_COLUMNS), [])), [])
+
+
+class TestBatchMatchesPerRow(unittest.TestCase):
+
+    def test_random_rows(self):
+        words = sorted(rsab.FRONTIER_SIGNALS | rsab.INFRA_SIGNALS | rsab.APPLIED_SIGNALS) + [
+            "GPU", "Cuda,", "RAG,RLHF", "python", "",
+        ]
+        rng = random.Random(0)
+        rows = [
+            {c: rng.choice([" ", ",", "\n"]).join(rng.choice(words) for _ in range(rng.randint(0, 4)))
+             for c in TEXT_COLUMNS if rng.random() < 0.8}
+            for _ in range(500)
+        ]
+        self.assertEqual(build_role_signal_anchors_batch(rows), [build_role_signal_anchors(r) for r in rows])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import run_people_pipeline as rpp
+
+
+class FakeSearch:
+    """Search API stand-in: pages[query] is a list of pages, each a list of logins."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def __call__(self, url, headers):
+        qs = parse_qs(urlparse(url).query)
+        q, page = qs["q"][0], int(qs["page"][0])
+        self.calls.append((q, page))
+        logins = (self.pages.get(q) or [])[page - 1:page]
+        items = [{"login": l, "html_url": f"https://github.com/{l}", "score": 1.0} for l in (logins[0] if logins else [])]
+        return {"total_count": len(items), "items": items}, {}, 200
+
+
+def logins(prefix, n):
+    return [f"{prefix}{i}" for i in range(n)]
+
+
+class TestEnumerateCandidatesCallCount(unittest.TestCase):
+    """Each search page is requested only when the sequential stop rules need it."""
+
+    def enumerate(self, pages, fake=None, **kw):
+        fake = fake or FakeSearch(pages)
+        args = dict(token="t", scenario="applied", min_people=25, per_page=100,
+                    max_pages_per_query=5, hard_cap_total=200)
+        args.update(kw)
+        with mock.patch.object(rpp, "http_get_json", fake), \
+                mock.patch.object(rpp, "SEARCH_REQUESTS_PER_MINUTE", 10 ** 9), \
+                redirect_stdout(io.StringIO()):
+            accepted, discards = rpp.enumerate_candidates(**args)
+        return fake.calls, accepted, discards
+
+    def test_minimum_met_on_first_query_stops_after_page_two(self):
+        queries = rpp.scenario_queries("applied")
+        pages = {q: [logins(f"q{i}p1u", 100), logins(f"q{i}p2u", 100), logins(f"q{i}p3u", 100)]
+                 for i, q in enumerate(queries)}
+        calls, accepted, _ = self.enumerate(pages)
+        self.assertEqual(calls, [(queries[0], 1), (queries[0], 2)])
+        self.assertEqual(len(accepted), 200)
+
+    def test_small_queries_stop_on_empty_page_and_at_minimum(self):
+        queries = rpp.scenario_queries("applied")
+        pages = {q: [logins(f"q{i}u", 10)] for i, q in enumerate(queries)}
+        calls, accepted, _ = self.enumerate(pages)
+        # 10 people per query: the minimum of 25 is met after the third query
+        self.assertEqual(calls, [(queries[0], 1), (queries[0], 2),
+                                 (queries[1], 1), (queries[1], 2),
+                                 (queries[2], 1), (queries[2], 2)])
+        self.assertEqual(len(accepted), 30)
+
+    def test_duplicates_and_bots_keep_paginating(self):
+        queries = rpp.scenario_queries("applied")
+        pages = {
+            queries[0]: [logins("a", 10) + ["dependabot", "x-bot"], logins("a", 10), logins("b", 20), ["c"]],
+        }
+        calls, accepted, discards = self.enumerate(pages, min_people=25)
+        self.assertEqual(calls, [(queries[0], 1), (queries[0], 2), (queries[0], 3)])
+        self.assertEqual([c.login for c, _q, _p, _r in accepted], logins("a", 10) + logins("b", 20))
+        self.assertEqual(sum(1 for _l, r in discards if r.startswith("Duplicate")), 10)
+        self.assertEqual(sum(1 for _l, r in discards if r.startswith("Bot-like")), 2)
+
+    def test_hard_cap_stops_mid_page(self):
+        queries = rpp.scenario_queries("applied")
+        pages = {queries[0]: [logins("a", 100), logins("b", 100)]}
+        calls, accepted, discards = self.enumerate(pages, min_people=5, hard_cap_total=7)
+        self.assertEqual(calls, [(queries[0], 1)])
+        self.assertEqual(len(accepted), 7)
+        self.assertEqual(discards[-1][0], "_PIPELINE")
+
+    def test_under_minimum_fails_after_every_query(self):
+        queries = rpp.scenario_queries("applied")
+        fake = FakeSearch({queries[0]: [["solo"]]})
+        with self.assertRaises(RuntimeError):
+            self.enumerate(None, fake=fake)
+        # page 1 of every query, page 2 only where page 1 had items
+        self.assertEqual(fake.calls, [(queries[0], 1), (queries[0], 2)] + [(q, 1) for q in queries[1:]])
+
+
+if __name__ == "__main__":
+    unittest.main()
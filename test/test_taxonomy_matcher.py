@@ -0,0 +1,132 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from EXECUTION_CORE import phase6_ai_stack_signals, phase7_oss_contribution_intel, taxonomy_matcher
+from EXECUTION_CORE.taxonomy_matcher import compile_taxonomy, fold, required_literal
+
+SCHEMA_81 = Path(taxonomy_matcher.REPO_ROOT) / "EXECUTION_CORE" / "CANONICAL_SCHEMA_81_COLUMNS_MACHINE.txt"
+
+GROUPS = {
+    "Tools": [
+        {"canonical": "FAISS", "patterns": [r"\bfaiss\b"]},
+        {"canonical": "TensorRT", "patterns": [r"\btensorrt\b"]},
+        {"canonical": "TensorRT-LLM", "patterns": [r"\btensorrt[- ]llm\b"]},
+        {"canonical": "Pinecone", "patterns": [r"\bpinecone\b"]},
+        {"canonical": "Kubernetes", "patterns": [r"\bkubernetes\b", r"\bk8s\b"]},
+        {"canonical": "Sklearn", "patterns": [r"\bsklearn\b"]},
+    ],
+    "Ids": [
+        {"canonical": "Year Range", "patterns": [r"\d{4}-\d{4}"]},
+    ],
+}
+
+
+class TestRequiredLiteral(unittest.TestCase):
+
+    def test_longest_top_level_run(self):
+        self.assertEqual(required_literal(r"\bgpt[- ]?4\b"), "gpt")
+        self.assertEqual(required_literal(r"retrieval[- ]augmented\s+generation"), "generation")
+        self.assertEqual(required_literal(r"\bFAISS\b"), "faiss")
+
+    def test_no_usable_literal(self):
+        self.assertEqual(required_literal(r"\d{4}-\d{4}"), "")  # single "-" is too short
+        self.assertEqual(required_literal(r"(foo|bar)"), "")
+        self.assertEqual(required_literal(r"café"), "")  # non-ASCII literal
+        self.assertEqual(required_literal(r"[unbalanced"), "")
+
+
+class TestFold(unittest.TestCase):
+
+    def test_turkish_i_and_compat_letters(self):
+        self.assertEqual(fold("PİNECONE"), "pinecone")  # dotted capital I
+        self.assertEqual(fold("pınecone"), "pinecone")  # dotless i
+        self.assertEqual(fold("Kubernetes"), "kubernetes")  # Kelvin sign
+        self.assertEqual(fold("ſklearn"), "sklearn")  # long s
+
+
+class TestCompiledTaxonomy(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        taxonomy_matcher._MEMO.clear()
+        self.m = compile_taxonomy("test", GROUPS, cache_dir=Path(self.tmp.name))
+
+    def test_literal_prefilter_hit_and_miss(self):
+        self.assertEqual(self.m.match("we use FAISS daily"), {"Tools": ["FAISS"], "Ids": []})
+        # literal present, pattern fails on the word boundary
+        self.assertEqual(self.m.match("faissy"), {"Tools": [], "Ids": []})
+        self.assertEqual(self.m.match("nothing relevant"), {"Tools": [], "Ids": []})
+        self.assertEqual(self.m.match(""), {"Tools": [], "Ids": []})
+
+    def test_implied_shorter_literal(self):
+        # "tensorrt" is found inside the longer literal reported at the same position
+        self.assertEqual(self.m.match("TensorRT-LLM serving")["Tools"], ["TensorRT", "TensorRT-LLM"])
+
+    def test_pattern_without_literal_always_runs(self):
+        self.assertEqual(self.m.match("active 2019-2024")["Ids"], ["Year Range"])
+        self.assertEqual(self.m.match("active 2019")["Ids"], [])
+
+    def test_case_equivalences_of_re(self):
+        self.assertEqual(self.m.match("PİNECONE")["Tools"], ["Pinecone"])
+        self.assertEqual(self.m.match("pınecone")["Tools"], ["Pinecone"])
+        self.assertEqual(self.m.match("Kubernetes")["Tools"], ["Kubernetes"])
+        self.assertEqual(self.m.match("ſklearn")["Tools"], ["Sklearn"])
+
+    def test_taxonomy_order(self):
+        self.assertEqual(self.m.match("k8s, pinecone and faiss")["Tools"], ["FAISS", "Pinecone", "Kubernetes"])
+
+    def test_plan_written_and_reused(self):
+        plans = list(Path(self.tmp.name).glob("test_*.json"))
+        self.assertEqual(len(plans), 1)
+        taxonomy_matcher._MEMO.clear()
+        again = compile_taxonomy("test", GROUPS, cache_dir=Path(self.tmp.name))
+        self.assertEqual(again.plan, self.m.plan)
+
+
+class TestPhaseHeaders(unittest.TestCase):
+    """Phase 6 and 7 run after the 81-column step and must not extend the header."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        patcher = mock.patch.object(taxonomy_matcher, "DEFAULT_CACHE_DIR", self.dir / "plans")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.header = SCHEMA_81.read_text(encoding="utf-8").split()
+        self.assertEqual(len(self.header), 81)
+
+    def run_phase(self, phase, row):
+        src, dst = self.dir / "in.csv", self.dir / "out.csv"
+        with src.open("w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=self.header)
+            w.writeheader()
+            w.writerow(row)
+        phase.process_csv(str(src), str(dst))
+        with dst.open(newline="", encoding="utf-8") as f:
+            r = csv.DictReader(f)
+            return r.fieldnames, list(r)
+
+    def test_phase6_fills_canonical_columns(self):
+        header, rows = self.run_phase(phase6_ai_stack_signals, {
+            "Full_Name": "Ada",
+            "Key_GitHub_AI_Repos": "serving GPT-4 with vLLM on CUDA, FAISS index",
+            "Primary_Model_Families": "Llama",
+        })
+        self.assertEqual(header, self.header)
+        self.assertEqual(rows[0]["Primary_Model_Families"], "Llama|GPT-4")
+        self.assertEqual(rows[0]["Inference_Training_Infra_Signals"], "vLLM|CUDA")
+
+    def test_phase7_header_unchanged(self):
+        row = {"Full_Name": "Ada", "Key_GitHub_AI_Repos": "pytorch vllm rag"}
+        header, rows = self.run_phase(phase7_oss_contribution_intel, row)
+        self.assertEqual(header, self.header)
+        self.assertEqual({k: v for k, v in rows[0].items() if v}, row)
+
+
+if __name__ == "__main__":
+    unittest.main()
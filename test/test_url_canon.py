@@ -0,0 +1,135 @@
+import unittest
+
+from EXECUTION_CORE import url_canon
+from EXECUTION_CORE.anchor_exhaustion_pass import classify_anchor
+from EXECUTION_CORE.people_projection_from_anchors import _classify_person_url
+
+
+class TestPersonUrl(unittest.TestCase):
+
+    def test_profile_kinds(self):
+        cases = {
+            "https://github.com/alice": ("github", "alice"),
+            "http://www.GitHub.com/Alice?tab=repos": ("github", "Alice"),
+            "  https://github.com/alice/  ": ("github", "alice"),
+            "https://www.linkedin.com/in/bob-1/": ("linkedin", "bob-1"),
+            "HTTPS://LINKEDIN.COM/in/bob#about": ("linkedin", "bob"),
+            "https://scholar.google.com/citations?hl=en&user=AbC_12": ("scholar", "AbC_12"),
+            "https://scholar.google.com/citations?user=x#frag": ("scholar", "x"),
+            "https://www.semanticscholar.org/author/Jane/123": ("semantic_scholar", "Jane"),
+            "https://orcid.org/0000-0002-1825-009X/works": ("orcid", "0000-0002-1825-009X"),
+        }
+        for url, expected in cases.items():
+            self.assertEqual(url_canon.person_url(url), expected, url)
+
+    def test_not_a_profile(self):
+        for url in (
+            "https://github.com/alice/repo",   # repository, not a user
+            "https://linkedin.com/in/",        # no vanity
+            "https://orcid.org/0000-0002",     # truncated iD
+            "ftp://github.com/alice",
+            "//github.com/alice",
+            "github.com/alice",
+            "",
+            None,
+        ):
+            self.assertEqual(url_canon.person_url(url), ("unknown", ""), url)
+
+    def test_projection_drops_reserved_github_paths(self):
+        self.assertEqual(_classify_person_url("https://github.com/orgs"), ("unknown", ""))
+        self.assertEqual(_classify_person_url("https://github.com/About"), ("unknown", ""))
+        self.assertEqual(_classify_person_url("https://github.com/alice"), ("github", "alice"))
+
+    def test_repo_check(self):
+        self.assertTrue(url_canon.is_github_repo("https://github.com/a/b"))
+        self.assertFalse(url_canon.is_github_repo("https://github.com/a"))
+        self.assertFalse(url_canon.is_github_repo(None))
+
+
+class TestAnchorColumn(unittest.TestCase):
+
+    def test_columns(self):
+        cases = {
+            "https://alice.github.io/cv.pdf": "GitHub_IO_URL",  # github.io wins over CV
+            "https://lab.example.edu/people/cv.pdf": "CV_URLs",
+            "https://x.org/Résumé": "CV_URLs",
+            "https://x.org/RESUME": "CV_URLs",
+            "https://medium.com/@alice": "Blog_URLs",
+            "https://x.org/blog/post": "Blog_URLs",
+            "https://x.org/Portfolio/index.html": "Portfolio_URLs",
+            "https://x.org/work#top": "Portfolio_URLs",
+            "https://x.org/": "Personal_Website_URLs",
+            "": "Personal_Website_URLs",
+            None: "Personal_Website_URLs",
+        }
+        for url, expected in cases.items():
+            self.assertEqual(url_canon.anchor_column(url), expected, url)
+            self.assertEqual(classify_anchor(url), expected, url)
+
+
+class TestAbsoluteHttp(unittest.TestCase):
+
+    def test_resolution(self):
+        base = "https://lab.example.edu/people/"
+        self.assertEqual(url_canon.absolute_http(base, "alice.html"), "https://lab.example.edu/people/alice.html")
+        self.assertEqual(url_canon.absolute_http(base, " /cv.pdf "), "https://lab.example.edu/cv.pdf")
+        self.assertEqual(url_canon.absolute_http(base, "//cdn.org/x"), "https://cdn.org/x")
+        self.assertEqual(url_canon.absolute_http(base, "HTTP://Other.org/a"), "HTTP://Other.org/a")
+
+    def test_rejected(self):
+        base = "https://lab.example.edu/people/"
+        for href in ("", "  ", "#top", "mailto:a@b.c", "MAILTO:a@b.c", "javascript:void(0)", "ftp://x.org/f"):
+            self.assertIsNone(url_canon.absolute_http(base, href), href)
+        self.assertIsNone(url_canon.absolute_http("", "relative/page"))
+
+
+class TestNormalizeHttp(unittest.TestCase):
+
+    def test_normal_forms(self):
+        cases = {
+            "HTTPS://Lab.Example.EDU": "https://lab.example.edu/",
+            "http://lab.example.edu:80/a": "http://lab.example.edu/a",
+            "https://lab.example.edu:443/a": "https://lab.example.edu/a",
+            "https://lab.example.edu:8080/a": "https://lab.example.edu:8080/a",
+            "https://x.org/p;params?q=1#frag": "https://x.org/p?q=1",
+            "  https://x.org/Case/Path  ": "https://x.org/Case/Path",
+        }
+        for url, expected in cases.items():
+            self.assertEqual(url_canon.normalize_http(url), expected, url)
+
+    def test_base(self):
+        self.assertEqual(url_canon.normalize_http("../b?x=1", "https://x.org/a/c/"), "https://x.org/a/b?x=1")
+        self.assertEqual(url_canon.normalize_http("#only", "https://x.org/a"), "https://x.org/a")
+
+    def test_rejected(self):
+        for url in ("", None, "mailto:a@b.c", "ftp://x.org/", "https://", "/relative"):
+            self.assertIsNone(url_canon.normalize_http(url), url)
+
+    def test_invalid_port_raises(self):
+        for url in ("http://h:99999/", "https://h:x/"):
+            with self.assertRaises(ValueError):
+                url_canon.normalize_http(url)
+
+
+class TestStripFragment(unittest.TestCase):
+
+    def test_strip(self):
+        self.assertEqual(url_canon.strip_fragment(" https://x.org/a?q=1#f "), "https://x.org/a?q=1")
+        self.assertEqual(url_canon.strip_fragment("https://x.org/a"), "https://x.org/a")
+        self.assertEqual(url_canon.strip_fragment("#f"), "")
+
+
+class TestMemo(unittest.TestCase):
+
+    def test_hits_and_shared_results(self):
+        url_canon.clear()
+        a = url_canon.normalize_http("https://X.org/" + "p" * 3)
+        b = url_canon.normalize_http("https://X.org/" + "p" * 3)
+        self.assertIs(a, b)
+        self.assertEqual(url_canon.cache_stats()["normalize_http"], {"hits": 1, "misses": 1, "size": 1})
+        url_canon.clear()
+        self.assertEqual(url_canon.cache_stats()["normalize_http"]["size"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
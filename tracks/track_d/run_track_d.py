@@ -12,6 +12,10 @@ Track D Contract (ENFORCED):
 - Missing adapters = HARD FAIL
 - Zero-output runs are FORBIDDEN
 - Output must be written to: outputs/track_d/people.csv
+
+Seed hubs are read through the compiled seed hub index
+(EXECUTION_CORE/seed_hub_index.py, "sheets" view); the workbook is only parsed
+again when it changes.
 """
 
 from __future__ import annotations
@@ -22,8 +26,7 @@ import os
 import sys
 from typing import Any, Dict, List, Optional, Sequence, Set
 
-import pandas as pd
-
+from EXECUTION_CORE.seed_hub_index import SeedHubIndex
 from tracks.track_d.adapter_registry import SEED_HUB_TYPE_TO_ADAPTER, get_adapter_class_for_seed_hub_type
 
 
@@ -50,30 +53,19 @@ def read_seed_hubs(xlsx: str) -> tuple[list[dict], set[str]]:
         fatal(f"Seed hub Excel not found: {xlsx}")
 
     try:
-        book = pd.ExcelFile(xlsx, engine="openpyxl")
+        index = SeedHubIndex.open(xlsx, "sheets")
     except Exception as e:
         fatal(f"Failed to open Excel: {e}")
 
     rows: list[dict] = []
     discovered: set[str] = set()
-    found_col = False
-
-    for sheet in book.sheet_names:
-        df = pd.read_excel(book, sheet_name=sheet, dtype=object)
-        if df is None or df.empty:
-            continue
-
-        norm_cols = {c.lower().replace(" ", "_"): c for c in df.columns}
-        if "seed_hub_type" not in norm_cols:
-            continue
-
-        found_col = True
-        col = norm_cols["seed_hub_type"]
 
-        for _, r in df.iterrows():
-            rec = {k: (None if pd.isna(v) else v) for k, v in r.to_dict().items()}
-            rec["__sheet__"] = sheet
-            val = s(rec.get(col))
+    with index:
+        sheets = index.sheets()
+        found_col = bool(sheets)
+        key_cols = {sheet: col for sheet, col, _ in sheets}
+        for rec in index.rows(with_sheet=True):
+            val = s(rec.get(key_cols[rec["__sheet__"]]))
             if val:
                 rec["Seed_Hub_Type"] = val
                 discovered.add(val)
@@ -1,70 +1,256 @@
 #!/usr/bin/env python3
 """
 Track E — Identity Enrichment (Expanded, Public GitHub Only)
-v2.0 | Dec 22, 2025
+v3.0 | Jan 06, 2026
 © 2025 L. David Mendoza. All Rights Reserved.
+
+v3.0:
+- Bounded concurrent fetcher (thread pool, per-thread HTTP sessions)
+- Persistent per-login cache with TTL (outputs/track_e/identity_cache.jsonl)
+- Resumable: every finished login is appended to the cache immediately,
+  so a killed run resumes where it stopped on the next invocation
+- Duplicate usernames are fetched once
+- Output columns unchanged (consumed by Track F and scenario_runner)
 """
 
-import csv, os, sys, time, math, requests
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+import requests
+
 INPUT = "outputs/track_d/people.csv"
 OUTDIR = "outputs/track_e"
 OUTPUT = f"{OUTDIR}/people_enriched.csv"
+CACHE = f"{OUTDIR}/identity_cache.jsonl"
 
-if not os.path.exists(INPUT):
-    sys.exit("❌ HARD FAIL: Track D people.csv missing")
+API = "https://api.github.com"
 
-os.makedirs(OUTDIR, exist_ok=True)
+DEFAULT_WORKERS = 8
+DEFAULT_TTL_DAYS = 7.0
+MAX_RATE_LIMIT_WAIT_S = 900
+
+ENRICH_FIELDS = [
+    "github_name", "github_company", "github_location",
+    "github_followers", "github_public_repos",
+    "github_top_languages", "github_account_age_years",
+]
+
+_local = threading.local()
+
+
+def _session():
+    s = getattr(_local, "session", None)
+    if s is None:
+        s = requests.Session()
+        s.headers.update({"Accept": "application/vnd.github+json", "User-Agent": "AI-Talent-Engine/TrackE"})
+        tok = os.getenv("GITHUB_TOKEN", "").strip()
+        if tok:
+            s.headers["Authorization"] = f"Bearer {tok}"
+        _local.session = s
+    return s
 
-API = "https://api.github.com"
 
 def gh(url):
-    r = requests.get(url, timeout=20)
-    return r.json() if r.status_code == 200 else {}
+    """GET JSON; returns (payload, status). Waits out an exhausted rate limit once."""
+    for attempt in range(2):
+        try:
+            r = _session().get(url, timeout=20)
+        except requests.RequestException:
+            return {}, 0
+        if r.status_code in (403, 429) and r.headers.get("X-RateLimit-Remaining") == "0" and attempt == 0:
+            reset = int(r.headers.get("X-RateLimit-Reset", "0") or 0)
+            time.sleep(min(MAX_RATE_LIMIT_WAIT_S, max(1, reset - int(time.time()) + 1)))
+            continue
+        return (r.json() if r.status_code == 200 else {}), r.status_code
+    return {}, 0
 
-def enrich(username):
-    p = gh(f"{API}/users/{username}")
-    repos = gh(f"{API}/users/{username}/repos?per_page=100")
+
+class IdentityCache:
+    """
+    Append-only JSONL cache keyed by lowercase login. Last entry wins on load.
+    Entries older than ttl_days are treated as misses (and refetched).
+    """
+
+    def __init__(self, path, ttl_days):
+        self.path = path
+        self.ttl_s = max(0.0, float(ttl_days)) * 86400.0
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        e = json.loads(line)
+                        self._entries[e["login"]] = e
+                    except Exception:
+                        continue  # torn last line from a killed run
+
+    def get(self, login):
+        e = self._entries.get(login.lower())
+        if e and (time.time() - float(e.get("fetched_at", 0))) <= self.ttl_s:
+            return e
+        return None
+
+    def put(self, login, data):
+        e = {"login": login.lower(), "fetched_at": time.time(), "data": data}
+        line = json.dumps(e, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._entries[e["login"]] = e
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+        return e
+
+    def compact(self):
+        """Rewrite the log with one line per login (drops superseded entries)."""
+        with self._lock:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                for e in self._entries.values():
+                    f.write(json.dumps(e, ensure_ascii=False) + "\n")
+            os.replace(tmp, self.path)
+
+
+def fetch_identity(username):
+    """Raw, cacheable identity facts for one login. None means a transient failure."""
+    p, status = gh(f"{API}/users/{username}")
+    if status == 404:
+        return {"found": False}
+    if status != 200:
+        return None
+    repos, repos_status = gh(f"{API}/users/{username}/repos?per_page=100")
+    if repos_status != 200:
+        return None  # languages unknown: do not cache a partial identity
 
     langs = {}
-    for r in repos:
+    for r in repos if isinstance(repos, list) else []:
         l = r.get("language")
         if l:
             langs[l] = langs.get(l, 0) + 1
 
+    return {
+        "found": True,
+        "name": p.get("name"),
+        "company": p.get("company"),
+        "location": p.get("location"),
+        "followers": p.get("followers", 0),
+        "public_repos": p.get("public_repos", 0),
+        "created_at": p.get("created_at"),
+        "languages": langs,
+    }
+
+
+def to_columns(data):
+    """Derive the Track E output columns; account age is computed at write time."""
+    if not data or not data.get("found"):
+        data = {}
+    langs = data.get("languages") or {}
     top_langs = ",".join(sorted(langs, key=langs.get, reverse=True)[:3])
-    created = p.get("created_at")
+    created = data.get("created_at")
 
     acct_age = None
     if created:
-        acct_age = round((datetime.utcnow() - datetime.fromisoformat(created.replace("Z",""))).days / 365, 2)
+        acct_age = round((datetime.utcnow() - datetime.fromisoformat(created.replace("Z", ""))).days / 365, 2)
 
     return {
-        "github_name": p.get("name"),
-        "github_company": p.get("company"),
-        "github_location": p.get("location"),
-        "github_followers": p.get("followers", 0),
-        "github_public_repos": p.get("public_repos", 0),
+        "github_name": data.get("name"),
+        "github_company": data.get("company"),
+        "github_location": data.get("location"),
+        "github_followers": data.get("followers", 0),
+        "github_public_repos": data.get("public_repos", 0),
         "github_top_languages": top_langs,
         "github_account_age_years": acct_age,
     }
 
-rows = list(csv.DictReader(open(INPUT, encoding="utf-8")))
-fields = list(rows[0].keys()) + [
-    "github_name","github_company","github_location",
-    "github_followers","github_public_repos",
-    "github_top_languages","github_account_age_years"
-]
 
-with open(OUTPUT,"w",newline="",encoding="utf-8") as f:
-    w = csv.DictWriter(f, fieldnames=fields)
-    w.writeheader()
+def enrich_all(usernames, cache, workers):
+    """Fetch every username not fresh in cache. Returns {login_lower: data}."""
+    results = {}
+    todo = []
+    for u in usernames:
+        hit = cache.get(u)
+        if hit is not None:
+            results[u.lower()] = hit["data"]
+        else:
+            todo.append(u)
+
+    print(f"Track E: {len(usernames)} unique logins | cached {len(results)} | to fetch {len(todo)}")
+    if not todo:
+        return results
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, int(workers))) as pool:
+        futures = {pool.submit(fetch_identity, u): u for u in todo}
+        for i, fut in enumerate(as_completed(futures), start=1):
+            u = futures[fut]
+            try:
+                data = fut.result()
+            except Exception:
+                data = None
+            if data is None:
+                failed += 1
+            else:
+                results[u.lower()] = cache.put(u, data)["data"]
+            if i % 50 == 0:
+                print(f"  fetched {i}/{len(todo)} (failed {failed})")
+
+    if failed:
+        print(f"⚠️ {failed} logins failed transiently; re-run to resume them")
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Track E — Identity Enrichment")
+    ap.add_argument("--input", default=INPUT)
+    ap.add_argument("--output", default=OUTPUT)
+    ap.add_argument("--cache", default=CACHE)
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    ap.add_argument("--ttl-days", type=float, default=DEFAULT_TTL_DAYS)
+    args = ap.parse_args()
+
+    if not os.path.exists(args.input):
+        sys.exit("❌ HARD FAIL: Track D people.csv missing")
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    os.makedirs(os.path.dirname(args.cache) or ".", exist_ok=True)
+
+    rows = list(csv.DictReader(open(args.input, encoding="utf-8")))
+    if not rows:
+        sys.exit("❌ HARD FAIL: Track D people.csv has no rows")
+    fields = list(rows[0].keys()) + ENRICH_FIELDS
+
+    usernames = []
+    seen = set()
     for r in rows:
-        u = r.get("github_username") or r.get("github")
-        if u:
-            r.update(enrich(u.strip()))
-            time.sleep(0.25)
-        w.writerow(r)
+        u = (r.get("github_username") or r.get("github") or "").strip()
+        if u and u.lower() not in seen:
+            seen.add(u.lower())
+            usernames.append(u)
+
+    cache = IdentityCache(args.cache, args.ttl_days)
+    results = enrich_all(usernames, cache, args.workers)
+    cache.compact()
+
+    tmp = args.output + ".tmp"
+    with open(tmp, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fields)
+        w.writeheader()
+        for r in rows:
+            u = (r.get("github_username") or r.get("github") or "").strip()
+            if u:
+                r.update(to_columns(results.get(u.lower())))
+            w.writerow(r)
+    os.replace(tmp, args.output)
+
+    print(f"✅ Track E v3 complete → {args.output}")
+
 
-print(f"✅ Track E v2 complete → {OUTPUT}")
+if __name__ == "__main__":
+    main()